@@ -0,0 +1,160 @@
+#Headless batch analysis of connect 4 positions, without the GUI.
+#Positions are read as move strings, one per line ("4453" means discs in the 4th, 4th, 5th and 3rd column from
+#the left, the first player starting), analyzed by a pool of worker processes in chunks, and written out in input
+#order as soon as they are done, so the input is never held in memory as a whole.
+#python batch.py --algorithm alphabeta --depth 6 positions.txt results.tsv --stats stats.jsonl
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from bitboard import Position
+from deepening import iterative_deepening
+from four_in_a_row import alphabeta, expectimax, minimax
+from stats import SearchStats
+from transposition import TranspositionTable
+
+algorithms = {
+    "minimax": minimax,
+    "alphabeta": alphabeta,
+    "expectimax": expectimax,
+}
+
+_worker_table = None    #Transposition table reused by every position a worker process analyzes
+
+
+def analyze(moves, algorithm="alphabeta", depth=6, time_budget=None, table=None, stats=None, rows=6, cols=7):
+    """
+    Find the best move for the player to move after the given move string.
+
+    Parameters
+    ----------
+    moves: str
+        the moves played so far, see Position.from_moves
+    algorithm: str
+        "minimax", "alphabeta" or "expectimax"
+    depth: int
+        search depth, or the deepest iteration when time_budget is given
+    time_budget: float or None
+        seconds to search with iterative deepening instead of a fixed depth
+    table: TranspositionTable or None
+        used by minimax and alphabeta
+    stats: SearchStats or None
+        receives the counters of the search
+    rows, cols: int
+        size of the board
+
+    Returns
+    -------
+    result: tuple
+        (moves, placement, score, nodes), placement counted from the most left as 0
+
+    Raises
+    ------
+    ValueError
+        if the move string is not valid or the game is already over
+    """
+    search = algorithms[algorithm]
+    position = Position.from_moves(moves, rows, cols)
+    if position.terminal():
+        raise ValueError("game over after " + repr(moves) + ", no move to find")
+    player = position.players[position.moves % 2]
+    if time_budget is not None:
+        result = iterative_deepening(search, player, position, time_budget, depth, table, stats)
+        return moves, result.placement, result.score, result.nodes
+    if stats is None:
+        stats = SearchStats()
+    kwargs = {"table": table} if table is not None and search is not expectimax else {}
+    placement = search(player, position, depth, stats=stats, **kwargs)
+    return moves, placement, stats.score, stats.nodes
+
+
+def _analyze_chunk(lines, algorithm, depth, time_budget, table_megabytes, with_stats=False, rows=6, cols=7):
+    global _worker_table
+    if table_megabytes and _worker_table is None:
+        _worker_table = TranspositionTable(table_megabytes)
+    results = []
+    for moves in lines:
+        stats = SearchStats() if with_stats else None
+        try:
+            result = analyze(moves, algorithm, depth, time_budget, _worker_table, stats, rows, cols)
+        except ValueError as error:
+            result = (moves, None, str(error), 0)
+        results.append(result + (stats.as_dict(),) if with_stats else result)
+    return results
+
+
+def analyze_stream(lines, algorithm="alphabeta", depth=6, time_budget=None, workers=None, chunk_size=64,
+                   table_megabytes=16, with_stats=False, rows=6, cols=7):
+    """
+    Analyze a stream of move strings over a pool of worker processes.
+
+    At most a few chunks per worker are in flight at any time, so the input is
+    consumed only as fast as the results are. The positions are played on a
+    board of rows x cols.
+
+    Yields
+    ------
+    result: tuple
+        (moves, placement, score, nodes) in input order, with with_stats also
+        the SearchStats.as_dict() of the search. Positions that are not valid
+        or where the game is over have None as placement and the error message
+        as score
+    """
+    workers = workers or os.cpu_count() or 1
+    lines = (line.strip() for line in lines)    #An empty line is the empty board
+    chunks = iter(lambda: list(itertools.islice(lines, chunk_size)), [])
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_analyze_chunk, chunk, algorithm, depth, time_budget, table_megabytes, with_stats,
+                                       rows, cols))
+            if len(pending) >= 2*workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze connect 4 positions given as move strings, one per line.")
+    parser.add_argument("input", nargs="?", default="-", help="file of move strings, - for stdin")
+    parser.add_argument("output", nargs="?", default="-", help="file for the results, - for stdout")
+    parser.add_argument("--algorithm", choices=sorted(algorithms), default="alphabeta")
+    parser.add_argument("--depth", type=int, default=6, help="search depth, or the deepest iteration with --time")
+    parser.add_argument("--time", type=float, default=None, help="seconds per position, searched with iterative deepening")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, the number of CPUs by default")
+    parser.add_argument("--chunk-size", type=int, default=64, help="positions sent to a worker at once")
+    parser.add_argument("--table-mb", type=float, default=16, help="transposition table size per worker, 0 for none")
+    parser.add_argument("--stats", default=None, help="file for the search counters of every position as JSON lines")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    sink = sys.stdout if args.output == "-" else open(args.output, "w")
+    statsSink = None if args.stats is None else open(args.stats, "w")
+    try:
+        #One tab separated line per position: moves, best column (left column as 1 like the moves), score, nodes
+        for moves, placement, score, nodes, *stats in analyze_stream(
+            source, args.algorithm, args.depth, args.time, args.workers, args.chunk_size, args.table_mb,
+            statsSink is not None
+        ):
+            if statsSink is not None and stats[0] is not None:
+                statsSink.write(json.dumps(dict(stats[0], moves=moves)) + "\n")
+            if placement is None:
+                print(moves, "error", score, sep="\t", file=sink)
+            else:
+                print(moves, placement + 1, score, nodes, sep="\t", file=sink)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        if statsSink is not None:
+            statsSink.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#Benchmark of the connect 4 searches on a fixed suite of positions
+#Every algorithm searches the opening, midgame and endgame positions below at a fixed depth, without a transposition
+#table, so the node counts only change when the search itself does. The nodes per second, time per position and peak
+#memory of every algorithm and suite are measured and compared with a saved baseline by instrumentation/benchmark.py.
+#python benchmark.py --save baseline.json
+#python benchmark.py --baseline baseline.json
+#The instrumentation package is installed with pip install -e . from the repository root
+
+import argparse
+import sys
+import time
+
+from batch import analyze
+from stats import SearchStats
+from instrumentation.benchmark import compare, load_baseline, peak_memory, save_baseline, summarize
+
+#Move strings of positions where neither player has won yet, see Position.from_moves
+#With perfect play the midgame positions only end 20 to 24 plies later, so no search stops early at a forced win.
+POSITIONS = {
+    "opening": ["4721", "6357", "6666", "6542"],
+    "midgame": ["5461314424442653", "7632543257164576", "5475635176354343", "6254113765441453"],
+    "endgame": ["565473131745613477335347261572", "716677157745266713526233611543",
+                "564772565212651421143554617146", "364234132315664224441375265751"],
+}
+
+DEPTHS = {
+    "minimax": 5,
+    "alphabeta": 8,
+    "expectimax": 6,
+}
+
+
+def benchmark(algorithm, depth, positions, repeat=1):
+    """
+    Time one algorithm on a list of positions.
+
+    Parameters
+    ----------
+    algorithm: str
+        "minimax", "alphabeta" or "expectimax"
+    depth: int
+        search depth
+    positions: list of str
+        move strings
+    repeat: int
+        times every position is searched
+
+    Returns
+    -------
+    result: dict
+        searches, nodes, seconds, nodes_per_sec, p50_ms, p90_ms, p99_ms and peak_kb
+    """
+    latencies = []
+    nodes = 0
+    for _ in range(repeat):
+        for moves in positions:
+            stats = SearchStats()
+            start = time.perf_counter()
+            analyze(moves, algorithm, depth, stats=stats)
+            latencies.append(time.perf_counter() - start)
+            nodes += stats.nodes
+
+    peak = peak_memory(lambda moves: analyze(moves, algorithm, depth), positions)
+    result = {"searches": len(latencies), "nodes": nodes}
+    result.update(summarize(latencies, nodes, peak))
+    return result
+
+
+def run(algorithms=tuple(DEPTHS), suites=tuple(POSITIONS), depths=None, repeat=3):
+    #Results of every algorithm on every suite, depths maps algorithms to a depth other than DEPTHS
+    results = []
+    for algorithm in algorithms:
+        depth = (depths or {}).get(algorithm, DEPTHS[algorithm])
+        for suite in suites:
+            result = {"algorithm": algorithm, "depth": depth, "suite": suite}
+            result.update(benchmark(algorithm, depth, POSITIONS[suite], repeat))
+            results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the connect 4 searches on a fixed suite of positions.")
+    parser.add_argument("--algorithm", choices=sorted(DEPTHS), action="append", help="algorithm to time, all by default")
+    parser.add_argument("--suite", choices=sorted(POSITIONS), action="append", help="positions to search, all by default")
+    parser.add_argument("--depth", type=int, default=None, help="search depth of every algorithm instead of the defaults")
+    parser.add_argument("--repeat", type=int, default=3, help="times every position is searched")
+    parser.add_argument("--save", default=None, help="file to write the results to as a baseline")
+    parser.add_argument("--baseline", default=None, help="baseline file to compare the results with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown against the baseline, 0.2 for 20%%")
+    args = parser.parse_args(argv)
+
+    algorithms = args.algorithm or tuple(DEPTHS)
+    depths = None if args.depth is None else dict.fromkeys(algorithms, args.depth)
+    results = run(algorithms, args.suite or tuple(POSITIONS), depths, args.repeat)
+    print("algorithm", "depth", "suite", "nodes/sec", "p50 ms", "p90 ms", "p99 ms", "peak KB", sep="\t")
+    for r in results:
+        print(r["algorithm"], r["depth"], r["suite"], r["nodes_per_sec"], r["p50_ms"], r["p90_ms"], r["p99_ms"],
+              r["peak_kb"], sep="\t")
+
+    if args.save is not None:
+        save_baseline(args.save, results)
+    if args.baseline is not None:
+        regressions = compare(results, load_baseline(args.baseline), ("algorithm", "depth", "suite"), "nodes",
+                              "searches", args.tolerance)
+        for regression in regressions:
+            print("regression:", regression)
+        return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#Bitboard representation of a connect 4 position, used by the search algorithms in four_in_a_row.py
+#Every column takes rows+1 bits of an integer, the extra bit on top of each column is always empty so that
+#shifting a mask never carries a disc from the top of one column into the bottom of the next one.
+#For the standard 7x6 board this fits in 49 bits, so both masks stay well within 64 bits.
+
+from evaluation import IncrementalEvaluator, WEIGHTS
+from transposition import zobrist_keys
+
+_geometries = {}    #Cache of precomputed window masks, shared by every position with the same dimensions
+
+
+def _geometry(rows, cols):
+    """
+    Precompute the 4-slot windows of a rows x cols board as bit masks.
+
+    Returns
+    -------
+    windows: list of int
+        one mask per horizontal, vertical, slash and backslash 4-slot segment
+    cell_windows: list of tuple
+        for every bit index, the indices of the windows that contain it
+    """
+    key = (rows, cols)
+    if key not in _geometries:
+        stride = rows + 1
+        windows = []
+        for c in range(cols):
+            for r in range(rows):
+                for dc, dr in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                    end_c, end_r = c + 3*dc, r + 3*dr
+                    if 0 <= end_c < cols and 0 <= end_r < rows:
+                        mask = 0
+                        for k in range(4):
+                            mask |= 1 << ((c + k*dc)*stride + r + k*dr)
+                        windows.append(mask)
+        cell_windows = [
+            tuple(w for w, mask in enumerate(windows) if mask >> bit & 1) for bit in range(cols*stride)
+        ]
+        _geometries[key] = (windows, cell_windows)
+    return _geometries[key]
+
+
+class Position:
+    """
+    A connect 4 position stored as two bit masks (one per player) and the
+    height of every column.
+
+    Moves are made and unmade in place, so a search can walk the whole tree
+    on a single Position without allocating a board per node.
+
+    Parameters
+    ----------
+    rows: int
+    cols: int
+    players: tuple
+        the values of board.PLAYER1 and board.PLAYER2, sides 0 and 1 in the masks
+    """
+
+    def __init__(self, rows=6, cols=7, players=(1, 2)):
+        self.rows = rows
+        self.cols = cols
+        self.players = tuple(players)
+        self.stride = rows + 1
+        self.masks = [0, 0]                                         #masks[side] has a bit set for every disc of that side
+        self.height = [c*self.stride for c in range(cols)]          #Bit index of the next free cell in every column
+        self.top = [c*self.stride + rows for c in range(cols)]      #Bit index one past the last cell of every column
+        self.moves = 0
+        self.zobrist = zobrist_keys(cols*self.stride)
+        self.hash = 0                                               #Zobrist hash of the discs on the board
+        self.windows, cell_windows = _geometry(rows, cols)
+        self.evaluator = IncrementalEvaluator(cell_windows, len(self.windows), WEIGHTS)
+
+    @classmethod
+    def from_board(cls, board):
+        """
+        Build a position from the board instance used by the GUI.
+
+        Anything that is not board.PLAYER1 or board.PLAYER2 is treated as an
+        empty slot, the same way evaluate() treats it.
+        """
+        position = cls(board.rows, board.cols, (board.PLAYER1, board.PLAYER2))
+        columns = [board.col(c) for c in range(board.cols)]
+        bottom_first = cls._bottom_first(board, columns)
+        for c, col in enumerate(columns):
+            if not bottom_first:
+                col = col[::-1]
+            for value in col:
+                if value not in position.players:
+                    break
+                position.make_move(c, position.side(value))
+        return position
+
+    @classmethod
+    def from_moves(cls, moves, rows=6, cols=7, players=(1, 2)):
+        """
+        Build a position from a move string such as "4453", one digit per disc
+        with the left column as 1, starting with board.PLAYER1 and alternating.
+        """
+        position = cls(rows, cols, players)
+        for i, move in enumerate(moves):
+            col = int(move) - 1
+            if not 0 <= col < cols or not position.placeable(col):
+                raise ValueError("invalid move " + repr(move) + " in " + repr(moves))
+            position.make_move(col, i % 2)
+        return position
+
+    @staticmethod
+    def _bottom_first(board, columns):
+        #Find out whether col() lists a column from the bottom or from the top.
+        #A partially filled column answers it directly, otherwise drop a disc into an empty column of a copy
+        players = (board.PLAYER1, board.PLAYER2)
+        for col in columns:
+            filled = [value in players for value in col]
+            if any(filled) and not all(filled):
+                return filled[0]
+        for c, col in enumerate(columns):
+            if not any(value in players for value in col):
+                tmp_board = board.clone()
+                tmp_board.place(board.PLAYER1, c)
+                return tmp_board.col(c)[0] == board.PLAYER1
+        return True     #Every column is full, the orientation no longer matters
+
+    def to_board(self, empty_board):
+        """
+        Return a copy of the given empty GUI board with this position's discs
+        dropped into it.
+        """
+        board = empty_board.clone()
+        for c in range(self.cols):
+            for bit in range(c*self.stride, self.height[c]):
+                side = 0 if self.masks[0] >> bit & 1 else 1
+                board.place(self.players[side], c)
+        return board
+
+    def copy(self):
+        position = Position(self.rows, self.cols, self.players)
+        position.masks = list(self.masks)
+        position.height = list(self.height)
+        position.moves = self.moves
+        position.hash = self.hash
+        position.evaluator = self.evaluator.copy()
+        return position
+
+    def key(self):
+        """
+        A unique integer for the discs on the board. Adding side 0's mask to the
+        mask of all discs gives every column the value 2**height - 1 + side 0's
+        discs, which never carries into the next column and can be undone.
+        """
+        return self.masks[0] + (self.masks[0] | self.masks[1])
+
+    def side(self, player):
+        #Index of the mask that belongs to board.PLAYER1 or board.PLAYER2
+        return 0 if player == self.players[0] else 1
+
+    def placeable(self, col):
+        return self.height[col] != self.top[col]
+
+    def make_move(self, col, side):
+        #Drop a disc for side into col, the column must be placeable
+        self.masks[side] |= 1 << self.height[col]
+        self.hash ^= self.zobrist[side][self.height[col]]
+        self.evaluator.place(self.height[col], side)
+        self.height[col] += 1
+        self.moves += 1
+
+    def unmake_move(self, col, side):
+        #Take back the last disc side dropped into col
+        self.height[col] -= 1
+        self.masks[side] ^= 1 << self.height[col]
+        self.hash ^= self.zobrist[side][self.height[col]]
+        self.evaluator.remove(self.height[col], side)
+        self.moves -= 1
+
+    def is_win(self, side):
+        #Check for four aligned discs in the vertical, horizontal and both diagonal directions
+        mask = self.masks[side]
+        for shift in (1, self.stride, self.stride - 1, self.stride + 1):
+            pairs = mask & (mask >> shift)
+            if pairs & (pairs >> 2*shift):
+                return True
+        return False
+
+    def terminal(self):
+        return self.moves == self.rows*self.cols or self.is_win(0) or self.is_win(1)
+
+    def evaluate(self, side):
+        """
+        Score the position for side with the 4-slot window heuristic, the same
+        value evaluate() in four_in_a_row.py computes for the matching player.
+
+        The evaluator is kept up to date by make_move and unmake_move, so this
+        does not look at the board at all.
+        """
+        return self.evaluator.score(side)
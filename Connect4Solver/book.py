@@ -0,0 +1,160 @@
+#Opening book for the connect 4 agents.
+#Every position reachable within a number of plies from the empty board is analyzed once, offline, with alphabeta,
+#and its best column and utility are written to a binary file as fixed-size records sorted by Position.key().
+#Lookups memory-map the file and binary search it, so every agent process shares the same pages of the file
+#through the operating system instead of loading the book into its own memory.
+#python book.py build book.bin --plies 8 --depth 8
+#python book.py probe book.bin 4453
+
+import argparse
+import mmap
+import struct
+import sys
+
+from batch import analyze_stream
+from bitboard import Position
+
+_HEADER = struct.Struct("<4sHBBBBxxI")  #magic, version, rows, cols, plies, depth, number of records
+_RECORD = struct.Struct("<QiBxxx")      #position key, utility, best column
+_MAGIC = b"C4BK"
+_VERSION = 1
+
+
+def book_positions(plies, rows=6, cols=7):
+    """
+    Move strings of every distinct, undecided position reachable within plies
+    moves of the empty board, one per position.
+    """
+    seen = set()
+    layer = [""]
+    for ply in range(plies + 1):
+        nextLayer = []
+        for moves in layer:
+            position = Position.from_moves(moves, rows, cols)
+            key = position.key()
+            if key in seen or position.terminal():
+                continue
+            seen.add(key)
+            yield moves
+            if ply < plies:
+                nextLayer.extend(moves + str(c + 1) for c in range(cols) if position.placeable(c))
+        layer = nextLayer
+
+
+def build_book(path, plies=8, depth=8, workers=None, rows=6, cols=7):
+    """
+    Analyze every position of book_positions(plies) on a board of rows x cols
+    with alphabeta at the given depth and write the book to path.
+
+    Returns
+    -------
+    count: int
+        the number of positions in the book
+    """
+    moveStrings = {}
+    for moves in book_positions(plies, rows, cols):
+        moveStrings[moves] = Position.from_moves(moves, rows, cols).key()
+    records = []
+    for moves, placement, score, nodes in analyze_stream(moveStrings, "alphabeta", depth, workers=workers,
+                                                             rows=rows, cols=cols):
+        records.append((moveStrings[moves], int(score), placement))
+    records.sort()
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, rows, cols, plies, depth, len(records)))
+        for record in records:
+            file.write(_RECORD.pack(*record))
+    return len(records)
+
+
+class OpeningBook:
+    """
+    Read-only, memory-mapped view of a book file written by build_book.
+
+    Parameters
+    ----------
+    path: str
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, self.cols, self.plies, self.depth, self.count = _HEADER.unpack_from(self.data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(path + " is not an opening book")
+
+    def lookup(self, position):
+        """
+        Find a position in the book.
+
+        Returns
+        -------
+        entry: tuple or None
+            (placement, score) of the player to move, None when the position is not in the book
+        """
+        if position.moves > self.plies or (position.rows, position.cols) != (self.rows, self.cols):
+            return None
+        key = position.key()
+        low, high = 0, self.count
+        while low < high:      #Binary search for the first record with a key >= key
+            middle = (low + high) // 2
+            if struct.unpack_from("<Q", self.data, _HEADER.size + middle*_RECORD.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count:
+            recordKey, score, placement = _RECORD.unpack_from(self.data, _HEADER.size + low*_RECORD.size)
+            if recordKey == key:
+                return placement, score
+        return None
+
+    def close(self):
+        self.data.close()
+
+
+def with_book(search, book):
+    """
+    Wrap search into a function with the (player, board, depth_limit) signature
+    the GUI calls, that answers from the book when the player to move is in a
+    book position and falls back to search otherwise.
+    """
+    from four_in_a_row import as_position
+
+    def book_search(player, board, depth_limit):
+        position = as_position(board)
+        if player == position.players[position.moves % 2]:
+            entry = book.lookup(position)
+            if entry is not None:
+                return entry[0]
+        return search(player, position, depth_limit)
+
+    return book_search
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or probe a connect 4 opening book.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="analyze the opening positions and write the book")
+    build.add_argument("path")
+    build.add_argument("--plies", type=int, default=8, help="book every position up to this many moves")
+    build.add_argument("--depth", type=int, default=8, help="alphabeta depth for every book position")
+    build.add_argument("--workers", type=int, default=None)
+    build.add_argument("--rows", type=int, default=6)
+    build.add_argument("--cols", type=int, default=7)
+    probe = commands.add_parser("probe", help="look up move strings in a book")
+    probe.add_argument("path")
+    probe.add_argument("moves", nargs="*", default=[""])
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        print(build_book(args.path, args.plies, args.depth, args.workers, args.rows, args.cols), "positions written to", args.path)
+    else:
+        book = OpeningBook(args.path)
+        for moves in args.moves:
+            entry = book.lookup(Position.from_moves(moves, book.rows, book.cols))
+            print(moves, "none" if entry is None else "%d\t%d" % (entry[0] + 1, entry[1]), sep="\t")
+        book.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#Time-budgeted versions of the connect 4 searches.
+#The search is repeated at depth 1, 2, 3, ... until the deadline passes, and the move of the deepest search
+#that finished is played. Every iteration searches the root columns in the order of the previous iteration's
+#utilities, and minimax/alphabeta share one transposition table across iterations, so the stored best moves of
+#the shallower searches are tried first by the deeper ones. alphabeta also keeps its killer moves and history.
+
+import time
+from collections import namedtuple
+
+from four_in_a_row import SearchTimeout, alphabeta, as_position, minimax
+from ordering import MoveOrderer
+from stats import SearchStats
+from transposition import TranspositionTable
+
+#placement: the chosen column, score: its utility, depth: the deepest completed iteration,
+#nodes: nodes visited by all iterations, elapsed: wall time in seconds
+SearchResult = namedtuple("SearchResult", ["placement", "score", "depth", "nodes", "elapsed"])
+
+
+def iterative_deepening(search, player, board, time_budget, max_depth=None, table=None, stats=None):
+    """
+    Run search with increasing depth limits until time_budget runs out.
+
+    Parameters
+    ----------
+    search: minimax, alphabeta or expectimax
+    player: board.PLAYER1 or board.PLAYER2
+        the player that needs to take an action (place a disc in the game)
+    board: the current game board instance or a bitboard Position
+    time_budget: float
+        seconds the search may take. The depth 1 search always runs to
+        completion so that there is a move to return
+    max_depth: int or None
+        stop deepening at this depth, by default the number of empty slots
+    table: TranspositionTable or None
+        table for minimax and alphabeta, a new one is used when None; pass the
+        same table on every move to reuse the work of earlier moves
+    stats: SearchStats or None
+        receives the counters of every iteration, the time of each as phase
+        "depth N", and the root values of the deepest completed one
+
+    Returns
+    -------
+    result: SearchResult
+
+    Raises
+    ------
+    ValueError
+        if max_depth is below 1, which would leave no iteration to take the move from
+    """
+    if max_depth is not None and max_depth < 1:
+        raise ValueError("max_depth must be at least 1, got %d" % max_depth)
+    start = time.monotonic()
+    deadline = start + time_budget
+    position = as_position(board)
+    if max_depth is None:
+        max_depth = max(1, position.rows*position.cols - position.moves)
+
+    kwargs = {}
+    if search in (minimax, alphabeta):
+        kwargs["table"] = table if table is not None else TranspositionTable()
+    if search is alphabeta:
+        kwargs["ordering"] = MoveOrderer(position.cols, position.rows*position.cols)
+
+    result = None
+    nodes = 0
+    order = None
+    for depth in range(1, max_depth + 1):
+        iteration = SearchStats()
+        try:
+            placement = search(
+                player, position, depth, stats=iteration, order=order,
+                deadline=deadline if result is not None else None, **kwargs
+            )
+        except SearchTimeout:
+            nodes += iteration.nodes
+            if stats is not None:
+                iteration.depth = 0     #Not completed
+                stats.merge(iteration)
+            break
+        nodes += iteration.nodes
+        result = SearchResult(placement, iteration.score, depth, nodes, time.monotonic() - start)
+        if stats is not None:
+            iteration.phases = {"depth %d" % depth: iteration.phases.get("search", 0.0)}
+            stats.merge(iteration)
+            stats.score, stats.root_values = iteration.score, iteration.root_values
+
+        #The next iteration starts with the columns this one found best
+        values = iteration.root_values
+        order = sorted(
+            (c for c in range(position.cols) if values[c] is not None),
+            key=lambda c: -values[c]
+        )
+        if time.monotonic() >= deadline:
+            break
+
+    if stats is not None:
+        stats.elapsed += time.monotonic() - start
+    return result._replace(nodes=nodes, elapsed=time.monotonic() - start)
+
+
+def timed(search, time_budget):
+    """
+    Wrap search into a function with the (player, board, depth_limit) signature
+    the GUI calls, that searches for time_budget seconds with depth_limit as the
+    deepest iteration. A transposition table is kept between its moves.
+    """
+    table = TranspositionTable() if search in (minimax, alphabeta) else None
+
+    def timed_search(player, board, depth_limit):
+        return iterative_deepening(search, player, board, time_budget, depth_limit, table).placement
+
+    return timed_search
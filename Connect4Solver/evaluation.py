@@ -0,0 +1,81 @@
+#Incremental version of the 4-slot window heuristic from evaluate() in four_in_a_row.py
+#Instead of rescanning every window of the board on each call, the evaluator keeps the number of discs
+#each player has in every window, and the running reward of both players, and only touches the windows
+#that pass through a cell when a disc is placed there or removed from it.
+
+# Initialize the weights
+# [w0, w1, w2, w3, --w4--]
+# w0 for a 4-slot segment with no discs of the player, w1 for one, w2 for two, w3 for three
+# w4 for four
+WEIGHTS = [0, 1, 4, 16, 1000]
+
+
+class IncrementalEvaluator:
+    """
+    Per-window occupancy counts and running score totals of both players.
+
+    totals[side] is the sum of the weights of every window that side can
+    still complete (no opposing disc in it), which is the reward the full
+    rescan computes for side, and the penalty it computes for the other side.
+
+    Parameters
+    ----------
+    cell_windows: list of tuple
+        for every cell index, the indices of the windows passing through it
+    n_windows: int
+        the number of 4-slot windows on the board
+    weights: list
+        the weight of a window holding 0, 1, 2, 3 or 4 discs of one player
+    """
+
+    def __init__(self, cell_windows, n_windows, weights=WEIGHTS):
+        self.cell_windows = cell_windows
+        self.weights = weights
+        self.counts = [[0]*n_windows, [0]*n_windows]    #counts[side][window] is the number of discs side has in window
+        self.totals = [0, 0]
+
+    def copy(self):
+        evaluator = IncrementalEvaluator(self.cell_windows, 0, self.weights)
+        evaluator.counts = [list(self.counts[0]), list(self.counts[1])]
+        evaluator.totals = list(self.totals)
+        return evaluator
+
+    def place(self, cell, side):
+        #Update the windows through cell after a disc of side is placed on it
+        weights = self.weights
+        mine = self.counts[side]
+        theirs = self.counts[1 - side]
+        gained = 0
+        lost = 0
+        for w in self.cell_windows[cell]:
+            n = mine[w]
+            mine[w] = n + 1
+            if theirs[w]:
+                if not n:
+                    lost += weights[theirs[w]]  #The adversary can no longer complete this window
+            else:
+                gained += weights[n + 1] - weights[n]
+        self.totals[side] += gained
+        self.totals[1 - side] -= lost
+
+    def remove(self, cell, side):
+        #Undo place(cell, side)
+        weights = self.weights
+        mine = self.counts[side]
+        theirs = self.counts[1 - side]
+        lost = 0
+        gained = 0
+        for w in self.cell_windows[cell]:
+            n = mine[w] - 1
+            mine[w] = n
+            if theirs[w]:
+                if not n:
+                    gained += weights[theirs[w]]
+            else:
+                lost += weights[n + 1] - weights[n]
+        self.totals[side] -= lost
+        self.totals[1 - side] += gained
+
+    def score(self, side):
+        #reward - penalty for side, equal to the full rescan of the board
+        return self.totals[side] - self.totals[1 - side]
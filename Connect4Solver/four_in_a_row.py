@@ -4,6 +4,12 @@
 #Nophil Mehboob 217395609
 
 import math
+import time
+
+from bitboard import Position
+from ordering import MoveOrderer
+from transposition import EXACT, LOWER, UPPER, node_keys
+from vectorized import child_values
 
 def get_child_boards(player, board):
     """
@@ -31,6 +37,29 @@ def get_child_boards(player, board):
     return res
 
 
+def get_child_scores(player, board):
+    """
+    Score every succesor board obtained by placing a disc at the given board
+    for a given player, all in one vectorized call (needs numpy).
+
+    Parameters
+    ----------
+    player: board.PLAYER1 or board.PLAYER2
+        the player that will place a disc on the board
+    board: the current board instance or a bitboard Position
+
+    Returns
+    -------
+    a list of (col, score) tuples,
+    where col is the column in which a new disc is placed (left column has a 0 index),
+    and score is evaluate(player, new_board)
+    """
+    position = as_position(board)
+    side = position.side(player)
+    columns, scores = child_values(position, side, side)
+    return list(zip(columns, scores))
+
+
 def evaluate(player, board):
     """
     This is a function to evaluate the advantage of the specific player at the
@@ -40,7 +69,7 @@ def evaluate(player, board):
     ----------
     player: board.PLAYER1 or board.PLAYER2
         the specific player
-    board: the board instance
+    board: the board instance or a bitboard Position
 
     Returns
     -------
@@ -48,69 +77,81 @@ def evaluate(player, board):
         a scalar to evaluate the advantage of the specific player at the given
         game board
     """
-    adversary = board.PLAYER2 if player == board.PLAYER1 else board.PLAYER1
-    # Initialize the value of scores
-    # [s0, s1, s2, s3, --s4--]
-    # s0 for the case where all slots are empty in a 4-slot segment
-    # s1 for the case where the player occupies one slot in a 4-slot line, the rest are empty
-    # s2 for two slots occupied
-    # s3 for three
-    # s4 for four
-    score = [0]*5
-    adv_score = [0]*5
-
-    # Initialize the weights
-    # [w0, w1, w2, w3, --w4--]
-    # w0 for s0, w1 for s1, w2 for s2, w3 for s3
-    # w4 for s4
-    weights = [0, 1, 4, 16, 1000]
-
-    # Obtain all 4-slot segments on the board
-    seg = []
-    invalid_slot = -1
-    left_revolved = [
-        [invalid_slot]*r + board.row(r) + \
-        [invalid_slot]*(board.rows-1-r) for r in range(board.rows)
-    ]
-    right_revolved = [
-        [invalid_slot]*(board.rows-1-r) + board.row(r) + \
-        [invalid_slot]*r for r in range(board.rows)
-    ]
-    for r in range(board.rows):
-        # row
-        row = board.row(r) 
-        for c in range(board.cols-3):
-            seg.append(row[c:c+4])
-    for c in range(board.cols):
-        # col
-        col = board.col(c) 
-        for r in range(board.rows-3):
-            seg.append(col[r:r+4])
-    for c in zip(*left_revolved):
-        # slash
-        for r in range(board.rows-3):
-            seg.append(c[r:r+4])
-    for c in zip(*right_revolved): 
-        # backslash
-        for r in range(board.rows-3):
-            seg.append(c[r:r+4])
-    # compute score
-    for s in seg:
-        if invalid_slot in s:
+    # Every 4-slot segment without an adversary disc is rewarded, and every
+    # segment without a player disc is penalized, by the weight of the number
+    # of discs in it. The weights are evaluation.WEIGHTS:
+    # [w0, w1, w2, w3, --w4--] = [0, 1, 4, 16, 1000]
+    position = as_position(board)
+    return position.evaluate(position.side(player))
+
+
+def as_position(board):
+    #The search functions accept either the GUI's board instance or a bitboard Position
+    if isinstance(board, Position):
+        return board.copy()
+    return Position.from_board(board)
+
+
+def choose_column(position, options, stats=None):
+    """
+    The final root 'max' choice shared by the search algorithms.
+
+    Parameters
+    ----------
+    position: the root Position
+    options: list
+        (search value, static value) of every column, None for columns that are not placeable
+    stats: SearchStats or None
+        receives the utility of the chosen column and of every root column
+
+    Returns
+    -------
+    placement: int
+        the first column with the largest utility
+    """
+    maximum = 0
+    maxScore = -math.inf
+    values = [None]*position.cols
+    for i in range(position.cols):
+        if options[i] is None:
             continue
-        if adversary not in s:
-            score[s.count(player)] += 1
-        if player not in s:
-            adv_score[s.count(adversary)] += 1
-    reward = sum([s*w for s, w in zip(score, weights)])
-    penalty = sum([s*w for s, w in zip(adv_score, weights)])
-    return reward - penalty
+        #If our initial state was better, prefer the initial
+        values[i] = max(options[i])
+        if values[i] > maxScore:
+            maxScore = values[i]
+            maximum = i
+    if stats is not None:
+        stats.score = maxScore
+        stats.root_values = values
+    return maximum
+
+
+def _record_search(stats, started, depth_limit, table, probes):
+    #Search time, depth and table lookups of a finished search, started at time.perf_counter() value started
+    stats.record("search", time.perf_counter() - started)
+    stats.depth = max(stats.depth, depth_limit)
+    if probes is not None:
+        stats.count_table(table, *probes)
+
+
+class SearchTimeout(Exception):
+    #Raised inside a search once its deadline has passed
+    pass
+
+
+def root_order(position, order, columns=None):
+    #Columns in the order the root should search them, the columns of order first, only those in columns if given
+    if columns is None:
+        columns = range(position.cols)
+    if order is None:
+        return columns
+    return [c for c in order if c in columns] + [c for c in columns if c not in order]
 
 #Minimax algorithm, assumes player in first call is the max player
 #@param player, the max player
 #@param board, the board state to start at
 #@param depth_limit, the deepest we would like to search
-def minimax(player, board, depth_limit):
+def minimax(player, board, depth_limit, table=None, stats=None, deadline=None, order=None, columns=None):
     """
     Minimax algorithm with limited search depth.
 
@@ -122,6 +163,17 @@ def minimax(player, board, depth_limit):
     depth_limit: int
         the tree depth that the search algorithm needs to go further before stopping
     max_player: boolean
+    table: TranspositionTable or None
+        transposition table to reuse positions reached through different move
+        orders, can be kept between the moves of one game
+    stats: SearchStats or None
+        receives the search counters and the utility of the root columns
+    deadline: float or None
+        time.monotonic() value after which SearchTimeout is raised
+    order: list or None
+        columns to search first at the root
+    columns: list or None
+        only search these root columns, the others are left out of the choice
 
     Returns
     -------
@@ -130,87 +182,81 @@ def minimax(player, board, depth_limit):
         (counted from the most left as 0)
         None to give up the game
     """
-    max_player = player
-    placement = None
-    
+    position = as_position(board)       #Searched in place, every move is made and unmade on this one position
+    max_side = position.side(player)
+    if table is not None:
+        table.new_search()
+    if stats is not None:
+        started = time.perf_counter()
+        probes = (table.hits, table.misses) if table is not None else None
+
     #Recursive function to calculate max and min values of each board state below our starting board
-    def mongomax(player, board, depth):
-        #Next player for recursive call
-        next_player = board.PLAYER2 if player == board.PLAYER1 else board.PLAYER1
-        
+    def mongomax(side, depth):
+        if stats is not None:
+            stats.nodes += 1
+        if deadline is not None and time.monotonic() >= deadline:
+            raise SearchTimeout()
+
         #If end  of branch, return utility
-        if depth == 0 or board.terminal():
-            return evaluate(player, board)
-        
+        if depth == 0 or position.terminal():
+            if stats is not None:
+                stats.evaluations += 1
+            return position.evaluate(side)
+
+        #Minimax values are always exact, so any entry searched at least as deep can be returned
+        if table is not None:
+            key = position.hash ^ node_keys[side][side == max_side]
+            entry = table.probe(key)
+            if entry is not None and entry[1] >= depth:
+                return entry[0]
+
+        if stats is not None:
+            stats.expanded += 1
+            stats.evaluations += 1
+        v = position.evaluate(side)
         #If max player choose max of children
-        if player == max_player:
-            v = -math.inf
-            v = evaluate(player,board)
-            for state in get_child_boards(player, board):
-                #Recursively find max of child states
-                v = max(v, mongomax(next_player, state[1], depth-1))
-            return v
+        if side == max_side:
+            for c in range(position.cols):
+                if position.placeable(c):
+                    position.make_move(c, side)
+                    #Recursively find max of child states
+                    v = max(v, mongomax(1 - side, depth-1))
+                    position.unmake_move(c, side)
 
         #Otherwise if min player do the opposite
         else:
-            v = math.inf
-            v = evaluate(player,board)
+            for c in range(position.cols):
+                if position.placeable(c):
+                    position.make_move(c, side)
+                    v = min(v, mongomax(1 - side, depth-1))
+                    position.unmake_move(c, side)
 
-            for state in get_child_boards(player, board):
-                score = mongomax(next_player, state[1], depth-1)
-              
-                v = min(v, score)
-            return v
-
-    options = []
-    optionsTest = []
+        if table is not None:
+            table.store(key, v, depth, EXACT)
+        return v
 
     #Our implementation technically does the first 'max' manually, so change players for now
-    player = board.PLAYER2 if player == board.PLAYER1 else board.PLAYER1
+    side = 1 - max_side
 
     #Find the minimax of all child states of our current states, because this returns up to 7 possible states, at the end we must run a max on this list for the best move to make
-    for state in get_child_boards(player, board):
-        options.append(mongomax(player, state[1], depth_limit-1))
-        optionsTest.append(evaluate(player,state[1]))
-
-    index = 0
-    modifiedOptions = []    #The list of states to choose from as a max, just modified to account for non placable columns
-    ogMod = []              #The original utility values
-
-    #Our utility values exist for all possible board placements, so we could have only 3 states here later in the game. 
-    #We want our list of possible states to be of length 7, so we fill in invalid board locations in the list with -inf
-    for i in range(0,7):
-        if board.placeable(i):
-            modifiedOptions.append(options[index])
-            ogMod.append(optionsTest[index])
-            index += 1
-        else:
-            modifiedOptions.append(-math.inf)
-            ogMod.append(-math.inf)
-    maximum = 0
-    maxScore = -math.inf
+    options = [None]*position.cols
+    for c in root_order(position, order, columns):
+        if position.placeable(c):
+            position.make_move(c, side)
+            options[c] = (mongomax(side, depth_limit-1), position.evaluate(side))
+            position.unmake_move(c, side)
 
-    #If our initial state was better, prefer the initial
-    for i in range(len(modifiedOptions)):
-        if modifiedOptions[i] < ogMod[i]:
-            modifiedOptions[i] = ogMod[i]
+    if stats is not None:
+        _record_search(stats, started, depth_limit, table, probes)
+    placement = choose_column(position, options, stats) #placement is the index of our best/ highest utility option
 
-    #Now we do the final root 'max' choice, and pick the largest utility from the board states.
-    for i in range(len(modifiedOptions)):
-        if modifiedOptions[i] > maxScore:
-            maxScore = modifiedOptions[i]
-            maximum = i
-
-    placement = maximum #placement is the index of our best/ highest utility option
-
-    
     return placement
 
 #Minimax with pruning algorithm, assumes player in first call is the max player
 #@param player, the max player
 #@param board, the board state to start at
 #@param depth_limit, the deepest we would like to search
-def alphabeta(player, board, depth_limit):
+def alphabeta(player, board, depth_limit, table=None, stats=None, deadline=None, order=None, ordering=True, pvs=False, columns=None):
     """
     Minimax algorithm with alpha-beta pruning.
 
@@ -224,7 +270,25 @@ def alphabeta(player, board, depth_limit):
     alpha: float
     beta: float
     max_player: boolean
-
+    table: TranspositionTable or None
+        transposition table storing bounds and best moves, can be kept between
+        the moves of one game
+    stats: SearchStats or None
+        receives the search counters and the utility of the root columns
+    deadline: float or None
+        time.monotonic() value after which SearchTimeout is raised
+    order: list or None
+        columns to search first at the root, a good first column lets the
+        others be searched against its utility
+    ordering: boolean or MoveOrderer
+        order the columns of every node by hash move, killer moves and history,
+        center first; pass a MoveOrderer to keep them between searches, False
+        searches columns left to right
+    pvs: boolean
+        principal variation search, every column after the first is only
+        checked against a null window and searched again if it beats it
+    columns: list or None
+        only search these root columns, the others are left out of the choice
 
     Returns
     -------
@@ -233,86 +297,149 @@ def alphabeta(player, board, depth_limit):
         (counted from the most left as 0)
         None to give up the game
     """
-    max_player = player
-    placement = None
+    position = as_position(board)
+    max_side = position.side(player)
+    if table is not None:
+        table.new_search()
+    if ordering is True:
+        ordering = MoveOrderer(position.cols, position.rows*position.cols)
+    orderer = ordering or None
+    if stats is not None:
+        started = time.perf_counter()
+        probes = (table.hits, table.misses) if table is not None else None
 
     #Recursive algorithm for alpha-beta search
-    def alphabethaMinimax(player, board, depth, alpha, beta):
-        #next player is other player
-        next_player = board.PLAYER2 if player == board.PLAYER1 else board.PLAYER1
-        
-        #if end of brach return utility
-        if depth == 0 or board.terminal():
-            return evaluate(player, board)
+    def alphabethaMinimax(side, depth, alpha, beta):
+        if stats is not None:
+            stats.nodes += 1
+        if deadline is not None and time.monotonic() >= deadline:
+            raise SearchTimeout()
 
+        #if end of brach return utility
+        if depth == 0 or position.terminal():
+            if stats is not None:
+                stats.evaluations += 1
+            return position.evaluate(side)
+
+        #Reuse a stored search of this position, either as its value or to narrow the window
+        hashMove = None
+        if table is not None:
+            key = position.hash ^ node_keys[side][side == max_side]
+            entry = table.probe(key)
+            if entry is not None:
+                score, entryDepth, bound, hashMove = entry
+                if entryDepth >= depth:
+                    if bound == EXACT:
+                        return score
+                    if bound == LOWER:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
+                    if alpha >= beta:
+                        return score
+        alphaOrig, betaOrig = alpha, beta
+
+        ply = depth_limit - depth
+        if orderer is not None:
+            moves = orderer.order(ply, side, hashMove)
+        #Try the best move of the stored search first
+        elif hashMove is not None:
+            moves = [hashMove] + [c for c in range(position.cols) if c != hashMove]
+        else:
+            moves = range(position.cols)
+
+        if stats is not None:
+            stats.expanded += 1
+            stats.evaluations += 1
+        v = position.evaluate(side)
+        best = None
+        first = True
         #If max player return max node
-        if player == max_player:
-            v = -math.inf
-            v = evaluate(player,board)
-            for state in get_child_boards(player, board):
-                v = max(v, alphabethaMinimax(next_player, state[1], depth-1, alpha, beta))
-                if v >= beta:
-                    break
-                a = max(alpha, v)
-            return v
+        if side == max_side:
+            for c in moves:
+                if position.placeable(c):
+                    position.make_move(c, side)
+                    #Principal variation search, after the first column only check whether a column beats alpha
+                    if pvs and not first and alpha > -math.inf:
+                        score = alphabethaMinimax(1 - side, depth-1, alpha, alpha + 1)
+                        if alpha < score < beta:
+                            score = alphabethaMinimax(1 - side, depth-1, score, beta)
+                    else:
+                        score = alphabethaMinimax(1 - side, depth-1, alpha, beta)
+                    position.unmake_move(c, side)
+                    first = False
+                    if score > v:
+                        v, best = score, c
+                    if v >= beta:
+                        if orderer is not None and best == c:
+                            orderer.cutoff(ply, side, c, depth)
+                        if stats is not None:
+                            stats.cutoffs += 1
+                        break
+                    alpha = max(alpha, v)
 
         #If min player return min node
         else:
-            v = math.inf
-            v = evaluate(player,board)
-            for state in get_child_boards(player, board):
-                v = min(v, alphabethaMinimax(next_player, state[1], depth-1, alpha, beta))
-                if v <= alpha:
-                    break
-                beta = min(beta, v)
-            return v
-
-    options = []
-    optionsTest = []
+            for c in moves:
+                if position.placeable(c):
+                    position.make_move(c, side)
+                    #Principal variation search, after the first column only check whether a column gets below beta
+                    if pvs and not first and beta < math.inf:
+                        score = alphabethaMinimax(1 - side, depth-1, beta - 1, beta)
+                        if alpha < score < beta:
+                            score = alphabethaMinimax(1 - side, depth-1, alpha, score)
+                    else:
+                        score = alphabethaMinimax(1 - side, depth-1, alpha, beta)
+                    position.unmake_move(c, side)
+                    first = False
+                    if score < v:
+                        v, best = score, c
+                    if v <= alpha:
+                        if orderer is not None and best == c:
+                            orderer.cutoff(ply, side, c, depth)
+                        if stats is not None:
+                            stats.cutoffs += 1
+                        break
+                    beta = min(beta, v)
+
+        if table is not None:
+            if v <= alphaOrig:
+                bound = UPPER
+            elif v >= betaOrig:
+                bound = LOWER
+            else:
+                bound = EXACT
+            table.store(key, v, depth, bound, best)
+        return v
 
     #Our implementation technically does the first 'max' manually, so change players for now
-    player = board.PLAYER2 if player == board.PLAYER1 else board.PLAYER1
-
-    #Find the minimax of all child states of our current states, because this returns up to 7 possible states, at the end we must run a max on this list for the best move to make
-    for state in get_child_boards(player, board):
-        options.append(alphabethaMinimax(player, state[1], depth_limit-1, -math.inf, math.inf))
-        optionsTest.append(evaluate(player, state[1]))
-
-    modifiedOptions = []    #The list of states to choose from as a max, just modified to account for non placable columns
-    index = 0
-    ogMod = []              #The original utility values
-
-    #Our utility values exist for all possible board placements, so we could have only 3 states here later in the game. 
-    #We want our list of possible states to be of length 7, so we fill in invalid board locations in the list with -inf
-    for i in range(0,7):
-        if board.placeable(i):
-            modifiedOptions.append(options[index])
-            ogMod.append(optionsTest[index])
-            index += 1
-        else:
-            modifiedOptions.append(-math.inf)
-            ogMod.append(-math.inf)
-
-    #If our initial state was better, prefer the initial
-    for i in range(len(modifiedOptions)):
-        if modifiedOptions[i] < ogMod[i]:
-            modifiedOptions[i] = ogMod[i]
-
-    #Now we do the final root 'max' choice, and pick the largest utility from the board states.
-    maxScore = -math.inf
-    for i in range(len(modifiedOptions)):
-        print(maxScore)
-        if modifiedOptions[i] > maxScore:
-            maxScore = modifiedOptions[i]
-
-            maximum = i
-
-    placement = maximum
+    side = 1 - max_side
+
+    #Find the minimax of all child states of our current states, because this returns up to 7 possible states, at the end we must run a max on this list for the best move to make.
+    #A column only matters if it beats the best utility found so far (or ties it from further left), so the
+    #others are searched with that utility as alpha. A column that fails low keeps an upper bound that is
+    #below the best, unless its initial state wins it the column on its own, which is then its exact utility.
+    options = [None]*position.cols
+    bestScore = -math.inf
+    bestCol = position.cols
+    for c in root_order(position, order, columns):
+        if position.placeable(c):
+            position.make_move(c, side)
+            alpha = bestScore if c > bestCol else bestScore - 1     #Utilities are integers
+            options[c] = (alphabethaMinimax(side, depth_limit-1, alpha, math.inf), position.evaluate(side))
+            position.unmake_move(c, side)
+            score = max(options[c])
+            if score > bestScore or (score == bestScore and c < bestCol):
+                bestScore, bestCol = score, c
+
+    if stats is not None:
+        _record_search(stats, started, depth_limit, table, probes)
+    placement = choose_column(position, options, stats)
 
     return placement
 
 
-def expectimax(player, board, depth_limit):
+def expectimax(player, board, depth_limit, stats=None, deadline=None, order=None, columns=None):
     """
     Expectimax algorithm.
     We assume that the adversary of the initial player chooses actions
@@ -329,6 +456,15 @@ def expectimax(player, board, depth_limit):
     depth_limit: int
         the tree depth that the search algorithm needs to go before stopping
     max_player: boolean
+    stats: SearchStats or None
+        receives the search counters and the utility of the root columns
+    deadline: float or None
+        time.monotonic() value after which SearchTimeout is raised
+    order: list or None
+        accepted for the same calls as minimax and alphabeta, every option of
+        expectimax is valued from the root board so the order changes nothing
+    columns: list or None
+        only search these root columns, the others are left out of the choice
 
     Returns
     -------
@@ -337,75 +473,63 @@ def expectimax(player, board, depth_limit):
         (counted from the most left as 0)
         None to give up the game
     """
-    max_player = player
-    placement = None
-
+    position = as_position(board)
+    max_side = position.side(player)
+    if stats is not None:
+        started = time.perf_counter()
 
     #Recursive function to calculate max and min values of each board state below our starting board
-    def expectiman(player, board, depth):
-        #Next player for recursive call
-        next_player = board.PLAYER2 if player == board.PLAYER1 else board.PLAYER1
+    def expectiman(side, depth):
+        if stats is not None:
+            stats.nodes += 1
+        if deadline is not None and time.monotonic() >= deadline:
+            raise SearchTimeout()
 
         #If end  of branch, return utility
-        if depth == 0 or board.terminal():
-            return evaluate(player, board)
+        if depth == 0 or position.terminal():
+            if stats is not None:
+                stats.evaluations += 1
+            return position.evaluate(side)
 
+        if stats is not None:
+            stats.expanded += 1
         #If max player choose max of children 
-        if player == max_player:
+        if side == max_side:
             v = -math.inf
-            #v = evaluate(player,board)
-            for state in get_child_boards(player, board):
-                v = max(v, expectiman(next_player, state[1], depth-1))
+            for c in range(position.cols):
+                if position.placeable(c):
+                    position.make_move(c, side)
+                    v = max(v, expectiman(1 - side, depth-1))
+                    position.unmake_move(c, side)
             return v
 
         #Otherwise if min player take average of children
         else:
-            children = get_child_boards(player, board)
+            children = [c for c in range(position.cols) if position.placeable(c)]
             v = 0
             probability = 1 / len(children)
-            for state in children:
-                v += probability*expectiman(next_player, state[1], depth-1)
+            for c in children:
+                position.make_move(c, side)
+                v += probability*expectiman(1 - side, depth-1)
+                position.unmake_move(c, side)
             return v
 
     #Our implementation technically does the first 'max' manually, so change players for now
-    player = board.PLAYER2 if player == board.PLAYER1 else board.PLAYER1
-    options = []
-    optionsTest = []
+    side = 1 - max_side
 
-    #Find the minimax of all child states of our current states, because this returns up to 7 possible states, at the end we must run a max on this list for the best move to make
-    for state in get_child_boards(player, board):
-        options.append(expectiman(player, board, depth_limit-1))
-        optionsTest.append(evaluate(player, state[1]))
-
-    index = 0
-    modifiedOptions = []        #The list of states to choose from as a max, just modified to account for non placable columns
-    ogMod = []                  #The original utility values
-
-    #Our utility values exist for all possible board placements, so we could have only 3 states here later in the game. 
-    #We want our list of possible states to be of length 7, so we fill in invalid board locations in the list with -inf
-    for i in range(0,7):
-        if board.placeable(i):
-            modifiedOptions.append(options[index])
-            ogMod.append(optionsTest[index])
-            index += 1
-        else:
-            modifiedOptions.append(-math.inf)
-            ogMod.append(-math.inf)
-    maximum = 0
-    maxScore = -math.inf
+    #Every option is searched from the root board itself, so its value only has to be computed once
+    rootValue = expectiman(side, depth_limit-1)
 
-    #If our initial state was better, prefer the initial
-    for i in range(len(modifiedOptions)):
-        if modifiedOptions[i] < ogMod[i]:
-            modifiedOptions[i] = ogMod[i]
-    
-    #Now we do the final root 'max' choice, and pick the largest utility from the board states.
-    for i in range(len(modifiedOptions)):
-        if modifiedOptions[i] > maxScore:
-            maxScore = modifiedOptions[i]
-            maximum = i
+    options = [None]*position.cols
+    for c in root_order(position, None, columns):
+        if position.placeable(c):
+            position.make_move(c, side)
+            options[c] = (rootValue, position.evaluate(side))
+            position.unmake_move(c, side)
 
-    placement = maximum #placement is the index of our best/ highest utility option
+    if stats is not None:
+        _record_search(stats, started, depth_limit, None, None)
+    placement = choose_column(position, options, stats) #placement is the index of our best/ highest utility option
 
     return placement
 
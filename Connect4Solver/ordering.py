@@ -0,0 +1,94 @@
+#Move ordering for the alpha-beta search in four_in_a_row.py
+#Alpha-beta prunes the most when the best column is searched first. Columns are tried in this order:
+#the best move stored in the transposition table, the killer moves that caused a cutoff at the same ply,
+#then the rest by history score (how often and how deep a column caused cutoffs), center columns first on ties.
+
+import sys
+
+
+class MoveOrderer:
+    """
+    Killer moves and history scores collected during a search.
+
+    Keep the same instance across the iterations of an iterative deepening
+    search so that the shallower iterations order the deeper ones.
+
+    Parameters
+    ----------
+    cols: int
+        the number of columns of the board
+    max_ply: int
+        the deepest ply that keeps killer moves
+    """
+
+    def __init__(self, cols=7, max_ply=64):
+        self.center = sorted(range(cols), key=lambda c: (abs(2*c - (cols - 1)), c))
+        self.killers = [[None, None] for _ in range(max_ply + 1)]   #Two killer moves per ply, most recent first
+        self.history = [[0]*cols, [0]*cols]                         #history[side][col]
+
+    def order(self, ply, side, hash_move=None):
+        """
+        Return every column in the order to search them, placeable or not.
+        """
+        history = self.history[side]
+        moves = sorted(self.center, key=lambda c: -history[c])      #sorted() is stable, so ties stay center first
+        for c in reversed(self.killers[ply] if ply < len(self.killers) else ()):
+            if c is not None:
+                moves.remove(c)
+                moves.insert(0, c)
+        if hash_move is not None:
+            moves.remove(hash_move)
+            moves.insert(0, hash_move)
+        return moves
+
+    def cutoff(self, ply, side, col, depth):
+        #Record that col caused a cutoff at ply, with depth left to search
+        if ply < len(self.killers):
+            killers = self.killers[ply]
+            if killers[0] != col:
+                killers[1] = killers[0]
+                killers[0] = col
+        self.history[side][col] += depth*depth
+
+
+def compare_ordering(positions, depth):
+    """
+    Count the nodes alphabeta visits at a fixed depth with plain column order,
+    with move ordering, and with move ordering plus principal variation search.
+
+    Parameters
+    ----------
+    positions: list of str
+        move strings, see Position.from_moves
+    depth: int
+
+    Returns
+    -------
+    rows: list
+        (moves, plain nodes, ordered nodes, pvs nodes, same column) per position
+    """
+    from bitboard import Position
+    from four_in_a_row import alphabeta
+    from stats import SearchStats
+
+    rows = []
+    for moves in positions:
+        position = Position.from_moves(moves)
+        player = position.players[position.moves % 2]
+        counts = []
+        columns = set()
+        for ordering, pvs in ((False, False), (True, False), (True, True)):
+            stats = SearchStats()
+            columns.add(alphabeta(player, position, depth, stats=stats, ordering=ordering, pvs=pvs))
+            counts.append(stats.nodes)
+        rows.append((moves, *counts, len(columns) == 1))
+    return rows
+
+
+if __name__ == "__main__":
+    #python ordering.py 8 4453 3344
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    positions = sys.argv[2:] or ["", "44", "4453", "445362", "4444", "334455", "3344455", "12345671234567"]
+    print("moves", "plain", "ordered", "pvs", "same", sep="\t")
+    for row in compare_ordering(positions, depth):
+        print(*row, sep="\t")
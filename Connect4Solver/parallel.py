@@ -0,0 +1,120 @@
+#Root-parallel versions of the connect 4 searches.
+#Every root column is searched in its own worker process with a full window, so each worker computes exactly
+#the utility the serial search computes for that column, and the same first-largest choice is made from them.
+#The workers can also share one transposition table in shared memory, so a position reached below two different
+#root columns is only searched once (the table's entries are checked against their key, torn writes are ignored).
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from four_in_a_row import alphabeta, as_position, choose_column, expectimax, minimax
+from stats import SearchStats
+from transposition import TranspositionTable
+
+COLUMNS = 7     #Root columns of the board, so at most this many workers ever have work
+
+_worker_table = None    #The shared transposition table as seen from inside a worker
+_worker_memory = None
+
+
+def _init_worker(memory_name, megabytes):
+    global _worker_table, _worker_memory
+    if memory_name is not None:
+        _worker_memory = SharedMemory(name=memory_name)
+        _worker_table = TranspositionTable(megabytes, buffer=_worker_memory.buf)
+
+
+def _search_column(search, player, position, depth_limit, column):
+    #Search a single root column, returns its utility and the SearchStats of its search
+    stats = SearchStats()
+    kwargs = {"table": _worker_table} if _worker_table is not None else {}
+    search(player, position, depth_limit, stats=stats, columns=[column], **kwargs)
+    return column, stats.root_values[column], stats
+
+
+class ParallelSearch:
+    """
+    A pool of worker processes that split the root columns of a search.
+
+    Keep one instance for a whole game so the processes (and the shared table)
+    are only started once.
+
+    Parameters
+    ----------
+    workers: int or None
+        number of worker processes, by default the number of CPUs but at most
+        one per column
+    table_megabytes: float
+        size of the transposition table shared by the workers, 0 for none.
+        With a table a worker may reuse an entry searched deeper than it needs,
+        so only the search without one is guaranteed to pick the serial column
+    """
+
+    def __init__(self, workers=None, table_megabytes=0):
+        self.workers = workers or min(os.cpu_count() or 1, COLUMNS)
+        self.memory = None
+        memory_name = None
+        if table_megabytes:
+            size = TranspositionTable.entries_for(table_megabytes)*TranspositionTable.ENTRY_BYTES
+            self.memory = SharedMemory(create=True, size=size)
+            memory_name = self.memory.name
+        self.pool = ProcessPoolExecutor(
+            self.workers, initializer=_init_worker, initargs=(memory_name, table_megabytes)
+        )
+
+    def search(self, search, player, board, depth_limit, stats=None):
+        """
+        Run minimax, alphabeta or expectimax with the root columns split over
+        the workers.
+
+        Returns
+        -------
+        placement: int
+            the column the serial search would choose
+        """
+        position = as_position(board)
+        if search is expectimax:
+            #Every expectimax option is valued from the root board itself, there is nothing to split
+            return expectimax(player, position, depth_limit, stats=stats)
+        if search not in (minimax, alphabeta):
+            raise ValueError("only minimax, alphabeta and expectimax can be searched in parallel")
+
+        futures = [
+            self.pool.submit(_search_column, search, player, position, depth_limit, c)
+            for c in range(position.cols) if position.placeable(c)
+        ]
+        options = [None]*position.cols
+        for future in futures:
+            c, value, columnStats = future.result()
+            options[c] = (value,)
+            if stats is not None:
+                stats.merge(columnStats)    #The phase times add up the time of every worker
+        return choose_column(position, options, stats)
+
+    def close(self):
+        self.pool.shutdown()
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parallel(search, workers=None, table_megabytes=0):
+    """
+    Wrap search into a function with the (player, board, depth_limit) signature
+    the GUI calls, that splits the root columns over a pool of workers.
+    """
+    searcher = ParallelSearch(workers, table_megabytes)
+
+    def parallel_search(player, board, depth_limit):
+        return searcher.search(search, player, board, depth_limit)
+
+    parallel_search.close = searcher.close
+    return parallel_search
@@ -0,0 +1,279 @@
+#Exact connect 4 solver, proving whether the player to move wins, loses or draws with perfect play.
+#Negamax with alpha-beta on the bit masks of a Position, following the approach of Pascal Pons' connect 4 solver:
+#positions are searched with null windows that are narrowed until the exact score is known, moves that let the
+#opponent win at once are never played, an opponent threat that has to be blocked is the only move considered, and
+#the remaining moves are tried in order of the number of threats they create, center columns first.
+#
+#The search is only practical near the end of the game: in CPython it visits some 70,000 positions a second, and a
+#balanced position of 10 plies such as 4453444555 takes over 17 million of them (minutes), so every method takes a
+#node_limit after which it gives up with SolveLimit.
+#
+#A score of 0 is a draw. A positive score means the player to move wins, the larger the sooner: with his last
+#possible disc it is 1, with his disc before that 2, and so on. A negative score is the same for the opponent.
+
+import math
+from collections import namedtuple
+
+from transposition import EXACT, LOWER, UPPER, TranspositionTable
+
+#score: the game theoretic value, outcome: "win", "loss" or "draw" for the player to move,
+#distance: plies until the game ends with perfect play, nodes: positions searched
+SolveResult = namedtuple("SolveResult", ["score", "outcome", "distance", "nodes"])
+
+
+class SolveLimit(Exception):
+    #Raised inside a solve once it has searched more positions than its node_limit
+    pass
+
+
+class Solver:
+    """
+    Perfect play solver for positions of one board size.
+
+    Parameters
+    ----------
+    rows: int
+    cols: int
+    table_megabytes: float
+        size of the transposition table, which is kept between solves
+    """
+
+    def __init__(self, rows=6, cols=7, table_megabytes=64):
+        self.rows = rows
+        self.cols = cols
+        self.stride = rows + 1
+        self.size = rows*cols
+        self.bottom = sum(1 << c*self.stride for c in range(cols))  #Bottom cell of every column
+        self.board = self.bottom*((1 << rows) - 1)                   #Every cell of the board
+        self.column_masks = [((1 << rows) - 1) << c*self.stride for c in range(cols)]
+        self.order = sorted(range(cols), key=lambda c: (abs(2*c - (cols - 1)), c))
+        self.table = TranspositionTable(table_megabytes)
+        self.nodes = 0
+        self.node_limit = math.inf
+
+    def _start(self, node_limit):
+        #Count the nodes of a new solve, which gives up after node_limit of them
+        self.nodes = 0
+        self.node_limit = math.inf if node_limit is None else node_limit
+
+    def winning_cells(self, current, mask):
+        #Empty cells where a disc of current would complete four in a row
+        stride = self.stride
+        #vertical
+        r = (current << 1) & (current << 2) & (current << 3)
+        #horizontal and both diagonals
+        for shift in (stride, stride - 1, stride + 1):
+            p = (current << shift) & (current << 2*shift)
+            r |= p & (current << 3*shift)
+            r |= p & (current >> shift)
+            p = (current >> shift) & (current >> 2*shift)
+            r |= p & (current << shift)
+            r |= p & (current >> 3*shift)
+        return r & (self.board ^ mask)
+
+    def non_losing_moves(self, current, mask):
+        """
+        Cells the player to move can play without losing on the next move, as a
+        bit mask of the cell each move would fill. 0 when every move loses.
+        """
+        possible = (mask + self.bottom) & self.board
+        opponentWins = self.winning_cells(current ^ mask, mask)
+        forced = possible & opponentWins
+        if forced:
+            if forced & (forced - 1):   #Two threats cannot both be blocked
+                return 0
+            possible = forced
+        return possible & ~(opponentWins >> 1)  #Never play right below an opponent's winning cell
+
+    def negamax(self, current, mask, moves, alpha, beta):
+        #Score of the position for the player to move, who cannot win with his next disc.
+        #Returns the exact score inside (alpha, beta), an upper bound <= alpha or a lower bound >= beta
+        self.nodes += 1
+        if self.nodes > self.node_limit:
+            raise SolveLimit()
+        possible = self.non_losing_moves(current, mask)
+        if not possible:
+            return -((self.size - moves)//2)
+        if moves >= self.size - 2:
+            return 0
+
+        low = -((self.size - 2 - moves)//2)     #The opponent cannot win with his next disc
+        high = (self.size - 1 - moves)//2       #We cannot win with our next disc
+        key = current + mask                    #Unique for the discs on the board and the player to move
+        entry = self.table.probe(key)
+        if entry is not None:
+            score, _, bound, _ = entry
+            if bound == EXACT:
+                return score
+            if bound == UPPER:
+                high = min(high, score)
+            else:
+                low = max(low, score)
+        if alpha < low:
+            alpha = low
+        if beta > high:
+            beta = high
+        if alpha >= beta:
+            return alpha
+
+        #Moves that create the most new threats first, center first on ties
+        children = []
+        for c in self.order:
+            move = possible & self.column_masks[c]
+            if move:
+                threats = self.winning_cells(current | move, mask).bit_count()
+                children.append((-threats, len(children), move))
+        children.sort()
+
+        alphaOrig = alpha
+        best = -self.size
+        for _, _, move in children:
+            score = -self.negamax(current ^ mask, mask | move, moves + 1, -beta, -alpha)
+            if score > best:
+                best = score
+            if score >= beta:
+                self.table.store(key, score, 0, LOWER)
+                return score
+            if score > alpha:
+                alpha = score
+        self.table.store(key, best, 0, UPPER if best <= alphaOrig else EXACT)
+        return best
+
+    def _score(self, current, mask, moves, weak):
+        #Exact (or with weak, only the sign of the) score of a position for the player to move
+        if self.winning_cells(current, mask) & (mask + self.bottom) & self.board:
+            return 1 if weak else (self.size + 1 - moves)//2
+        if weak:
+            low, high = -1, 1
+        else:
+            low, high = -((self.size - moves)//2), (self.size + 1 - moves)//2
+        while low < high:       #Narrow the score with null window searches, favouring the middle and zero
+            middle = low + (high - low)//2
+            if middle <= 0 and int(low/2) < middle:
+                middle = int(low/2)
+            elif middle >= 0 and int(high/2) > middle:
+                middle = int(high/2)
+            r = self.negamax(current, mask, moves, middle, middle + 1)
+            if r <= middle:
+                high = r
+            else:
+                low = r
+        if weak:
+            return max(-1, min(1, low))
+        return low
+
+    def _masks(self, position, side):
+        if (position.rows, position.cols) != (self.rows, self.cols):
+            raise ValueError("the solver was built for %dx%d boards" % (self.rows, self.cols))
+        if side is None:
+            side = position.moves % 2
+        return position.masks[side], position.masks[0] | position.masks[1], position.moves
+
+    def solve(self, position, side=None, weak=False, node_limit=None):
+        """
+        Solve a position that is not already won.
+
+        Parameters
+        ----------
+        position: Position
+        side: 0 or 1 or None
+            the side to move, by default the side whose turn it is by the number of discs
+        weak: boolean
+            only find out whether the position is a win, draw or loss, which is
+            faster; the score is then -1, 0 or 1 and the distance is None
+        node_limit: int or None
+            the most positions to search, None for no limit
+
+        Returns
+        -------
+        result: SolveResult
+
+        Raises
+        ------
+        SolveLimit
+            if the position was not solved within node_limit positions; the
+            transposition table keeps what was found, for the next solve
+        """
+        self._start(node_limit)
+        current, mask, moves = self._masks(position, side)
+        score = self._score(current, mask, moves, weak)
+        return SolveResult(score, _outcome(score), None if weak else self.distance(score, current, mask), self.nodes)
+
+    def distance(self, score, current, mask):
+        #Plies until the end of the game with perfect play, from the score of the player to move
+        if score == 0:
+            return self.size - mask.bit_count()
+        stone = (self.size + 2)//2 - abs(score)     #The winner wins with his stone-th disc
+        if score > 0:
+            return 2*(stone - current.bit_count()) - 1
+        return 2*(stone - (current ^ mask).bit_count())
+
+    def analyze(self, position, side=None, node_limit=None):
+        """
+        Score every column for the player to move.
+
+        Returns
+        -------
+        scores: list
+            the score of playing each column, None for columns that are not placeable
+
+        Raises
+        ------
+        SolveLimit
+            if the columns were not all scored within node_limit positions
+        """
+        self._start(node_limit)
+        current, mask, moves = self._masks(position, side)
+        winning = self.winning_cells(current, mask)
+        scores = [None]*self.cols
+        for c in range(self.cols):
+            move = (mask + self.bottom) & self.column_masks[c]
+            if not move:
+                continue
+            if winning & move:
+                scores[c] = (self.size + 1 - moves)//2
+            else:
+                scores[c] = -self._score(current ^ mask, mask | move, moves + 1, False)
+        return scores
+
+    def best_move(self, position, side=None, node_limit=None):
+        #The leftmost column with the best score, None when there is no move left, see analyze
+        scores = self.analyze(position, side, node_limit)
+        best = None
+        for c in range(self.cols):
+            if scores[c] is not None and (best is None or scores[c] > scores[best]):
+                best = c
+        return best
+
+
+def _outcome(score):
+    return "win" if score > 0 else "loss" if score < 0 else "draw"
+
+
+def with_solver(search, empty_slots=16, solver=None, node_limit=200000):
+    """
+    Wrap search into a function with the (player, board, depth_limit) signature
+    the GUI calls, that plays perfect moves from the solver once at most
+    empty_slots slots are left, and uses search before that and for the
+    positions the solver cannot solve within node_limit positions (a few
+    seconds for the default), None for no limit.
+    """
+    from four_in_a_row import as_position
+
+    solvers = {}
+    if solver is not None:
+        solvers[(solver.rows, solver.cols)] = solver
+
+    def solver_search(player, board, depth_limit):
+        position = as_position(board)
+        if position.rows*position.cols - position.moves > empty_slots or position.terminal():
+            return search(player, position, depth_limit)
+        size = (position.rows, position.cols)
+        if size not in solvers:
+            solvers[size] = Solver(position.rows, position.cols)
+        try:
+            return solvers[size].best_move(position, position.side(player), node_limit)
+        except SolveLimit:
+            return search(player, position, depth_limit)
+
+    return solver_search
@@ -0,0 +1,49 @@
+#Counters filled in by the connect 4 searches when a SearchStats instance is passed to them
+#The phases, timing and JSON output are shared with the path searches, see instrumentation/stats.py.
+
+from instrumentation.stats import BaseStats
+
+
+class SearchStats(BaseStats):
+    """
+    What a search did on its last call.
+
+    Attributes
+    ----------
+    nodes: int
+        the number of nodes visited below the root
+    expanded: int
+        the visited nodes whose children were generated
+    evaluations: int
+        the calls of evaluate() below the root
+    cutoffs: int
+        the nodes alpha-beta stopped searching at
+    tt_probes: int
+        transposition table lookups
+    tt_hits: int
+        transposition table lookups that found their position
+    depth: int
+        the depth of the deepest completed search
+    score: float
+        the utility of the chosen column
+    root_values: list
+        the utility of every root column, None for columns that are not placeable
+    elapsed: float
+        wall time in seconds
+    phases: dict
+        wall time in seconds of every phase, see phase()
+    """
+
+    COUNTERS = ("nodes", "expanded", "evaluations", "cutoffs", "tt_probes", "tt_hits")
+    NODES = "nodes"
+
+    def __init__(self):
+        BaseStats.__init__(self)
+        self.score = None
+        self.root_values = None
+
+    def count_table(self, table, hits, misses):
+        #Add the lookups of table since it had the given hit and miss counts
+        if table is not None:
+            self.tt_hits += table.hits - hits
+            self.tt_probes += table.hits - hits + table.misses - misses
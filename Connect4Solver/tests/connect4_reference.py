@@ -0,0 +1,137 @@
+#Reference implementations and random positions the searches are checked against
+
+from bitboard import Position
+from evaluation import WEIGHTS
+
+
+def random_moves(rng, plies, rows=6, cols=7):
+    #Move string of up to plies random moves, stopping before a move that would win, see Position.from_moves
+    position = Position(rows, cols)
+    moves = ""
+    for ply in range(plies):
+        side = ply % 2
+        column = rng.choice([c for c in range(cols) if position.placeable(c)])
+        position.make_move(column, side)
+        if position.is_win(side):
+            break
+        moves += str(column + 1)
+    return moves
+
+
+def random_position(rng, plies, rows=6, cols=7):
+    #Position after random_moves
+    return Position.from_moves(random_moves(rng, plies, rows, cols), rows, cols)
+
+
+def perfect_score(position, side):
+    #Exact score for side to move by plain negamax over every move, see solver.py for the scores
+    size = position.rows*position.cols
+    if position.moves == size:
+        return 0
+    best = -size
+    for c in range(position.cols):
+        if not position.placeable(c):
+            continue
+        position.make_move(c, side)
+        if position.is_win(side):
+            score = (size + 1 - (position.moves - 1))//2
+        else:
+            score = -perfect_score(position, 1 - side)
+        position.unmake_move(c, side)
+        best = max(best, score)
+    return best
+
+
+def grid(position):
+    #grid[r][c] is the side with a disc in row r (from the bottom) and column c, None for an empty slot
+    cells = [[None]*position.cols for _ in range(position.rows)]
+    for c in range(position.cols):
+        for r in range(position.rows):
+            bit = 1 << c*position.stride + r
+            if position.masks[0] & bit:
+                cells[r][c] = 0
+            elif position.masks[1] & bit:
+                cells[r][c] = 1
+    return cells
+
+
+def windows(rows, cols):
+    #Every 4-slot segment of the board as a list of (r, c)
+    segments = []
+    for r in range(rows):
+        for c in range(cols):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                if 0 <= r + 3*dr < rows and 0 <= c + 3*dc < cols:
+                    segments.append([(r + k*dr, c + k*dc) for k in range(4)])
+    return segments
+
+
+def rescan(position, side):
+    #evaluate() by scanning every window of the board, the reward of side minus its penalty
+    return _scan(grid(position), side)
+
+
+def _scan(cells, side):
+    score = 0
+    for segment in windows(len(cells), len(cells[0])):
+        values = [cells[r][c] for r, c in segment]
+        own, other = values.count(side), values.count(1 - side)
+        if not other:
+            score += WEIGHTS[own]
+        if not own:
+            score -= WEIGHTS[other]
+    return score
+
+
+def _children(cells, side):
+    #(column, cells after side drops a disc into it) of every column that is not full
+    for c in range(len(cells[0])):
+        for r in range(len(cells)):
+            if cells[r][c] is None:
+                child = [list(row) for row in cells]
+                child[r][c] = side
+                yield c, child
+                break
+
+
+def _terminal(cells):
+    segments = windows(len(cells), len(cells[0]))
+    if all(value is not None for row in cells for value in row):
+        return True
+    for segment in segments:
+        values = {cells[r][c] for r, c in segment}
+        if len(values) == 1 and None not in values:
+            return True
+    return False
+
+
+def minimax_options(position, max_side, depth):
+    """
+    The root options of the original minimax of four_in_a_row.py, on plain
+    lists of cells: (value, static value) of every column, None for full ones.
+    Like the original, the root moves are made for the other side.
+    """
+    def value(cells, side, depth):
+        v = _scan(cells, side)
+        if depth == 0 or _terminal(cells):
+            return v
+        values = [value(child, 1 - side, depth - 1) for _, child in _children(cells, side)]
+        return max([v] + values) if side == max_side else min([v] + values)
+
+    options = [None]*position.cols
+    side = 1 - max_side
+    for c, child in _children(grid(position), side):
+        options[c] = (value(child, side, depth - 1), _scan(child, side))
+    return options
+
+
+def best_option(options):
+    #(placement, score) the searches choose from the root options: the first column with the largest value
+    values = [None if option is None else max(option) for option in options]
+    score = max(v for v in values if v is not None)
+    return values.index(score), score
+
+
+def four_in_a_row(position, side):
+    cells = grid(position)
+    return any(all(cells[r][c] == side for r, c in segment) for segment in windows(position.rows, position.cols))
@@ -0,0 +1,80 @@
+import json
+import random
+
+import pytest
+
+from batch import analyze, analyze_stream, main
+from bitboard import Position
+from four_in_a_row import alphabeta, expectimax, minimax
+from connect4_reference import random_moves
+from stats import SearchStats
+from transposition import TranspositionTable
+
+
+@pytest.mark.parametrize("search", [minimax, alphabeta, expectimax])
+def test_analyze_matches_search(search):
+    rng = random.Random(7)
+    for _ in range(10):
+        moves = random_moves(rng, rng.randint(0, 30))
+        result = analyze(moves, search.__name__, 3)
+        position = Position.from_moves(moves)
+        stats = SearchStats()
+        placement = search(position.players[position.moves % 2], position, 3, stats=stats)
+        assert result == (moves, placement, stats.score, stats.nodes)
+
+
+def test_stream_matches_analyze():
+    rng = random.Random(70)
+    lines = [random_moves(rng, rng.randint(0, 30)) for _ in range(40)] + ["", "4444444", "48"]
+    results = list(analyze_stream((line + "\n" for line in lines), "alphabeta", 3, workers=2, chunk_size=3,
+                                  table_megabytes=0))
+    assert [result[0] for result in results] == lines
+    for result in results[:-2]:
+        assert result == analyze(result[0], "alphabeta", 3)
+    for moves, placement, error, nodes in results[-2:]:
+        assert placement is None and "invalid move" in error and nodes == 0
+
+
+def test_game_over_is_an_error(tmp_path, capsys):
+    full = "121212343434212121434343565656656565777777"       #A draw
+    won = "4343434"
+    assert Position.from_moves(full).moves == 42 and not Position.from_moves(full).is_win(0)
+    assert Position.from_moves(won).is_win(0)
+    for moves in (full, won):
+        with pytest.raises(ValueError, match="game over"):
+            analyze(moves, "alphabeta", 3)
+    source = tmp_path / "positions.txt"
+    source.write_text(full + "\n" + won + "\n")
+    stats = tmp_path / "stats.jsonl"
+    main([str(source), "--depth", "2", "--workers", "1", "--stats", str(stats)])
+    out = capsys.readouterr().out
+    assert [line.split("\t")[:2] for line in out.splitlines()] == [[full, "error"], [won, "error"]]
+    assert "Infinity" not in out and "Infinity" not in stats.read_text()
+    assert [json.loads(line)["moves"] for line in stats.read_text().splitlines()] == [full, won]
+
+
+def test_table_does_not_change_the_answers():
+    rng = random.Random(700)
+    table = TranspositionTable(1)
+    for _ in range(10):
+        moves = random_moves(rng, rng.randint(0, 20))
+        assert analyze(moves, "alphabeta", 4, table=table)[:3] == analyze(moves, "alphabeta", 4)[:3]
+
+
+def test_time_budget():
+    moves, placement, score, nodes = analyze("4453", "alphabeta", 3, time_budget=60.0)
+    assert (placement, score) == analyze("4453", "alphabeta", 3)[1:3]
+    with pytest.raises(ValueError):
+        analyze("4453", "alphabeta", 0, time_budget=1.0)
+
+
+def test_cli(tmp_path, capsys):
+    source = tmp_path / "positions.txt"
+    source.write_text("4453\n\n9\n")
+    stats = tmp_path / "stats.jsonl"
+    main([str(source), "--depth", "2", "--workers", "1", "--stats", str(stats)])
+    lines = capsys.readouterr().out.splitlines()
+    moves, placement, score, nodes = analyze("4453", "alphabeta", 2)
+    assert lines[0] == "4453\t%d\t%s\t%d" % (placement + 1, score, nodes)
+    assert lines[1].startswith("\t") and lines[2].startswith("9\terror\t")
+    assert [json.loads(line)["moves"] for line in stats.read_text().splitlines()] == ["4453", "", "9"]
@@ -0,0 +1,28 @@
+from benchmark import POSITIONS, run
+from bitboard import Position
+from solver import Solver
+from instrumentation.benchmark import compare
+
+
+def test_positions_are_undecided():
+    for positions in POSITIONS.values():
+        for moves in positions:
+            assert not Position.from_moves(moves).terminal()
+
+
+def test_midgame_positions_are_balanced():
+    #Neither player can force a win within the depth of the searches
+    solver = Solver()
+    for moves in POSITIONS["midgame"]:
+        result = solver.solve(Position.from_moves(moves))
+        assert result.distance >= 20 and abs(result.score) <= 4
+
+
+def test_node_counts_are_fixed():
+    first, second = (run(("minimax", "alphabeta"), ("opening",), {"minimax": 2, "alphabeta": 3}, repeat=1)
+                     for _ in range(2))
+    assert [r["nodes"] for r in first] == [r["nodes"] for r in second]
+    assert all(r["searches"] == len(POSITIONS["opening"]) and r["nodes"] > 0 for r in first)
+    #Only a slowdown is a regression, the same node counts at a far higher rate are not
+    faster = [dict(r, nodes_per_sec=10*r["nodes_per_sec"], p50_ms=0, p90_ms=0, p99_ms=0, peak_kb=0) for r in first]
+    assert compare(faster, first, ("algorithm", "depth", "suite"), "nodes", "searches") == []
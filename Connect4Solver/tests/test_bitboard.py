@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from bitboard import Position
+from connect4_reference import four_in_a_row, grid, random_position
+
+
+@pytest.mark.parametrize("rows, cols", [(6, 7), (4, 5), (7, 9)])
+def test_moves_match_a_plain_grid(rows, cols):
+    rng = random.Random(1)
+    for _ in range(30):
+        position = Position(rows, cols)
+        played = []
+        while not position.terminal():
+            side = position.moves % 2
+            column = rng.choice([c for c in range(cols) if position.placeable(c)])
+            before = (list(position.masks), list(position.height), position.hash, list(position.evaluator.totals))
+            position.make_move(column, side)
+            played.append(column)
+            assert grid(position)[len([c for c in played if c == column]) - 1][column] == side
+            assert position.is_win(side) == four_in_a_row(position, side)
+            assert not position.is_win(1 - side)
+            position.unmake_move(column, side)
+            assert (position.masks, position.height, position.hash, position.evaluator.totals) == before
+            position.make_move(column, side)
+
+
+def test_key_is_unique():
+    rng = random.Random(2)
+    seen = {}
+    for _ in range(500):
+        position = random_position(rng, rng.randint(0, 20))
+        cells = tuple(map(tuple, grid(position)))
+        assert seen.setdefault(position.key(), cells) == cells
+
+
+def test_from_moves():
+    position = Position.from_moves("4453")
+    cells = grid(position)
+    assert cells[0][3] == 0 and cells[1][3] == 1 and cells[0][4] == 0 and cells[0][2] == 1
+    assert position.moves == 4
+    copy = position.copy()
+    copy.make_move(0, 0)
+    assert position.moves == 4 and grid(position) == cells
+    for moves in ("8", "0", "4444444", "4x"):
+        with pytest.raises(ValueError):
+            Position.from_moves(moves)
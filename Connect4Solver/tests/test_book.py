@@ -0,0 +1,22 @@
+import pytest
+
+from batch import analyze
+from bitboard import Position
+from book import OpeningBook, book_positions, build_book
+
+
+@pytest.mark.parametrize("rows, cols", [(6, 7), (4, 5)])
+def test_book_matches_analysis(tmp_path, rows, cols):
+    path = str(tmp_path / "book.bin")
+    positions = list(book_positions(2, rows, cols))
+    assert build_book(path, plies=2, depth=3, workers=1, rows=rows, cols=cols) == len(positions)
+    book = OpeningBook(path)
+    try:
+        assert (book.rows, book.cols) == (rows, cols)
+        for moves in positions:
+            _, placement, score, _ = analyze(moves, "alphabeta", 3, rows=rows, cols=cols)
+            assert book.lookup(Position.from_moves(moves, rows, cols)) == (placement, score)
+        assert book.lookup(Position.from_moves("1234", rows, cols)) is None     #Deeper than the book
+        assert book.lookup(Position.from_moves("", rows + 1, cols)) is None     #Another board
+    finally:
+        book.close()
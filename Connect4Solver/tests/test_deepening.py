@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from bitboard import Position
+from deepening import iterative_deepening
+from four_in_a_row import alphabeta, expectimax, minimax
+from connect4_reference import random_position
+from stats import SearchStats
+
+
+@pytest.mark.parametrize("max_depth", [0, -3])
+def test_max_depth_below_one(max_depth):
+    with pytest.raises(ValueError, match="max_depth"):
+        iterative_deepening(alphabeta, 1, Position(), 1.0, max_depth)
+
+
+@pytest.mark.parametrize("search", [minimax, alphabeta, expectimax])
+def test_deepest_iteration_matches_fixed_depth(search):
+    rng = random.Random(4)
+    for _ in range(5):
+        position = random_position(rng, rng.randint(0, 12))
+        player = position.players[position.moves % 2]
+        result = iterative_deepening(search, player, position, 60.0, 3)
+        stats = SearchStats()
+        search(player, position, 3, stats=stats)
+        assert result.depth == 3
+        assert result.score == stats.score
+
+
+def test_one_iteration_without_time():
+    result = iterative_deepening(alphabeta, 1, Position(), 0.0, 5)
+    assert result.depth == 1 and result.placement is not None
+
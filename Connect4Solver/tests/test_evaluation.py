@@ -0,0 +1,29 @@
+import random
+
+import pytest
+
+from bitboard import Position
+from connect4_reference import rescan
+
+
+@pytest.mark.parametrize("rows, cols", [(6, 7), (5, 4), (8, 8)])
+def test_incremental_matches_rescan(rows, cols):
+    rng = random.Random(3)
+    for _ in range(20):
+        position = Position(rows, cols)
+        played = []
+        for _ in range(rng.randint(1, rows*cols)):
+            if played and rng.random() < 0.3:
+                column, side = played.pop()
+                position.unmake_move(column, side)
+            else:
+                column = rng.choice([c for c in range(cols) if position.placeable(c)] or [None])
+                if column is None:
+                    break
+                side = rng.randrange(2)
+                position.make_move(column, side)
+                played.append((column, side))
+            for side in (0, 1):
+                assert position.evaluate(side) == rescan(position, side)
+        copy = position.copy()
+        assert copy.evaluate(0) == position.evaluate(0)
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from four_in_a_row import alphabeta, minimax
+from ordering import MoveOrderer, compare_ordering
+from connect4_reference import best_option, minimax_options, random_position
+from stats import SearchStats
+
+
+@pytest.mark.parametrize("ordering, pvs", [(False, False), (True, False), (False, True), (True, True)])
+def test_alphabeta_matches_minimax(ordering, pvs):
+    rng = random.Random(5)
+    for _ in range(12):
+        position = random_position(rng, rng.randint(0, 30))
+        side = position.moves % 2
+        player = position.players[side]
+        for depth in (1, 2, 3, 4):
+            expected = best_option(minimax_options(position, side, depth)) if depth < 4 else None
+            stats = SearchStats()
+            placement = alphabeta(player, position, depth, stats=stats, ordering=ordering, pvs=pvs)
+            if expected is None:        #Deeper than the reference is quick at, minimax itself is the reference
+                plain = SearchStats()
+                expected = minimax(player, position, depth, stats=plain), plain.score
+            assert (placement, stats.score) == expected
+
+
+def test_orderer_kept_between_searches():
+    rng = random.Random(50)
+    orderer = MoveOrderer()
+    for _ in range(10):
+        position = random_position(rng, rng.randint(0, 20))
+        side = position.moves % 2
+        stats = SearchStats()
+        placement = alphabeta(position.players[side], position, 3, stats=stats, ordering=orderer, pvs=True)
+        assert (placement, stats.score) == best_option(minimax_options(position, side, 3))
+
+
+def test_order_puts_hash_and_killer_moves_first():
+    orderer = MoveOrderer()
+    assert orderer.order(0, 0) == [3, 2, 4, 1, 5, 0, 6]
+    orderer.cutoff(2, 0, 6, 3)
+    orderer.cutoff(2, 0, 0, 1)
+    assert orderer.order(2, 0) == [0, 6, 3, 2, 4, 1, 5]
+    assert orderer.order(2, 0, hash_move=4) == [4, 0, 6, 3, 2, 1, 5]
+    assert orderer.order(1, 0) == [6, 0, 3, 2, 4, 1, 5]       #History only, 9 for column 6 and 1 for column 0
+    assert orderer.order(1, 1) == [3, 2, 4, 1, 5, 0, 6]
+
+
+def test_compare_ordering_finds_the_same_column():
+    for row in compare_ordering(["", "4453", "3344455"], 5):
+        assert row[-1]
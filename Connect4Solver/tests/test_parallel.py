@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from four_in_a_row import alphabeta, expectimax, minimax
+from parallel import COLUMNS, ParallelSearch
+from connect4_reference import random_position
+from stats import SearchStats
+
+
+@pytest.fixture(scope="module")
+def searcher():
+    with ParallelSearch(2) as searcher:
+        yield searcher
+
+
+@pytest.mark.parametrize("search", [minimax, alphabeta, expectimax])
+def test_parallel_matches_serial(searcher, search):
+    rng = random.Random(6)
+    for _ in range(6):
+        position = random_position(rng, rng.randint(0, 30))
+        player = position.players[position.moves % 2]
+        serial, split = SearchStats(), SearchStats()
+        assert searcher.search(search, player, position, 3, split) == search(player, position, 3, stats=serial)
+        assert split.score == serial.score
+        if search is minimax:       #alphabeta only gives bounds on the columns that are not chosen
+            assert split.root_values == serial.root_values
+
+
+def test_shared_table():
+    #Workers may reuse entries searched deeper than they need, so only the use of the table is checked
+    position = random_position(random.Random(60), 6)
+    player = position.players[position.moves % 2]
+    with ParallelSearch(2, table_megabytes=1) as searcher:
+        stats = SearchStats()
+        placement = searcher.search(minimax, player, position, 4, stats)
+    assert position.placeable(placement)
+    assert stats.tt_probes > 0 and stats.tt_hits > 0
+
+
+def test_unknown_search(searcher):
+    with pytest.raises(ValueError):
+        searcher.search(print, 1, random_position(random.Random(0), 0), 3)
+
+
+def test_default_workers(monkeypatch):
+    for cpus, workers in ((64, COLUMNS), (3, 3), (None, 1)):
+        monkeypatch.setattr("os.cpu_count", lambda: cpus)
+        with ParallelSearch() as searcher:
+            assert searcher.workers == workers
+    with ParallelSearch(12) as searcher:
+        assert searcher.workers == 12
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from bitboard import Position
+from connect4_reference import perfect_score, random_position
+from solver import SolveLimit, Solver, with_solver
+
+
+def _endgames(seed, count, plies=34):
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        position = random_position(rng, plies)
+        if position.moves == plies:
+            positions.append(position)
+    return positions
+
+
+def test_solve_matches_negamax():
+    solver = Solver()
+    for position in _endgames(10, 15):
+        side = position.moves % 2
+        expected = perfect_score(position, side)
+        result = solver.solve(position)
+        assert result.score == expected
+        assert solver.solve(position, weak=True).score == (expected > 0) - (expected < 0)
+        assert 0 < result.distance <= position.rows*position.cols - position.moves
+
+
+def test_analyze_matches_negamax():
+    solver = Solver()
+    for position in _endgames(100, 5, 35):
+        side = position.moves % 2
+        scores = solver.analyze(position)
+        for c in range(position.cols):
+            if not position.placeable(c):
+                assert scores[c] is None
+                continue
+            position.make_move(c, side)
+            if position.is_win(side):
+                expected = (position.rows*position.cols + 2 - position.moves)//2
+            else:
+                expected = -perfect_score(position, 1 - side)
+            position.unmake_move(c, side)
+            assert scores[c] == expected
+        assert scores[solver.best_move(position)] == max(s for s in scores if s is not None)
+
+
+def test_node_limit():
+    solver = Solver(table_megabytes=1)
+    position = Position.from_moves("4453444555")
+    with pytest.raises(SolveLimit):
+        solver.solve(position, node_limit=1000)
+    assert solver.nodes == 1001
+    with pytest.raises(SolveLimit):
+        solver.best_move(position, node_limit=1000)
+    #A later solve without a limit is not held to the earlier one
+    assert solver.solve(Position.from_moves("44534445553322116677")).score == -2
+
+
+def test_with_solver_falls_back_to_search():
+    calls = []
+
+    def search(player, position, depth_limit):
+        calls.append(position.moves)
+        return 6
+
+    play = with_solver(search, empty_slots=32, solver=Solver(table_megabytes=1), node_limit=1000)
+    assert play(1, Position.from_moves("4453444555"), 4) == 6      #Not solved within 1000 positions
+    endgame = _endgames(7, 1)[0]
+    player = endgame.players[endgame.moves % 2]
+    scores = Solver().analyze(endgame)
+    assert scores[play(player, endgame, 4)] == max(s for s in scores if s is not None)
+    assert calls == [10]
@@ -0,0 +1,64 @@
+import io
+import random
+import json
+import time
+
+from bitboard import Position
+from four_in_a_row import alphabeta, minimax
+from connect4_reference import random_position
+from stats import SearchStats
+from instrumentation.stats import effective_branching_factor
+
+
+def test_minimax_counts_every_node():
+    #No game ends within 3 plies of the empty board, so minimax visits the full tree
+    stats = SearchStats()
+    minimax(1, Position(), 3, stats=stats)
+    assert stats.nodes == stats.evaluations == 7 + 7**2 + 7**3
+    assert stats.expanded == 7 + 7**2
+    assert stats.cutoffs == stats.tt_probes == stats.tt_hits == 0
+    assert stats.depth == 3 and stats.branching_factor() == 7.0
+    assert list(stats.phases) == ["search"] and stats.elapsed == stats.phases["search"] > 0
+
+
+def test_merge_adds_counters():
+    first, second = SearchStats(), SearchStats()
+    minimax(1, Position(), 2, stats=first)
+    alphabeta(1, Position(), 4, stats=second)
+    merged = SearchStats()
+    merged.merge(first)
+    merged.merge(second)
+    for name in SearchStats.COUNTERS:
+        assert getattr(merged, name) == getattr(first, name) + getattr(second, name)
+    assert merged.depth == 4
+    assert merged.phases["search"] == first.phases["search"] + second.phases["search"]
+
+
+def test_phases_add_up():
+    stats = SearchStats()
+    with stats.phase("book"):
+        time.sleep(0.01)
+    stats.record("search", 0.5)
+    stats.record("search", 0.25)
+    assert stats.phases["book"] >= 0.01 and stats.phases["search"] == 0.75
+    assert stats.elapsed == stats.phases["book"] + 0.75
+
+
+def test_emit_round_trips():
+    position = random_position(random.Random(20), 10)
+    stats = SearchStats()
+    alphabeta(position.players[position.moves % 2], position, 5, stats=stats)
+    out = io.StringIO()
+    stats.emit(out, position="x")
+    line = out.getvalue()
+    assert line.endswith("\n") and line.count("\n") == 1
+    values = json.loads(line)
+    assert values == dict(stats.as_dict(), position="x")
+    assert values["branching_factor"] == effective_branching_factor(stats.nodes, 5) > 1
+
+
+def test_effective_branching_factor():
+    assert effective_branching_factor(7 + 49 + 343, 3) == 7.0
+    assert effective_branching_factor(2 + 4 + 8 + 16, 4) == 2.0
+    assert effective_branching_factor(0, 3) == 0.0
+    assert effective_branching_factor(5, 0) == effective_branching_factor(3, 3) == 1.0
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from four_in_a_row import alphabeta, minimax
+from connect4_reference import best_option, minimax_options, random_position
+from stats import SearchStats
+from transposition import EXACT, LOWER, UPPER, TranspositionTable
+
+
+@pytest.mark.parametrize("search", [minimax, alphabeta])
+def test_table_matches_plain_minimax(search):
+    rng = random.Random(3)
+    table = TranspositionTable(1)
+    for _ in range(15):
+        position = random_position(rng, rng.randint(0, 24))
+        side = position.moves % 2
+        player = position.players[side]
+        for depth in (1, 2, 3):
+            expected = best_option(minimax_options(position, side, depth))
+            for kwargs in ({}, {"table": TranspositionTable(1)}, {"table": table}):
+                stats = SearchStats()
+                placement = search(player, position, depth, stats=stats, **kwargs)
+                assert (placement, stats.score) == expected
+
+
+def test_table_kept_between_moves():
+    #The table of the earlier, deeper searches of a game must not change the later ones
+    rng = random.Random(30)
+    table = TranspositionTable(1)
+    position = random_position(rng, 0)
+    for ply in range(10):
+        side = ply % 2
+        player = position.players[side]
+        expected = best_option(minimax_options(position, side, 3))
+        stats = SearchStats()
+        assert alphabeta(player, position, 3, table=table, stats=stats) == expected[0]
+        assert stats.score == expected[1]
+        position.make_move(expected[0], side)
+        if position.terminal():
+            break
+
+
+def test_store_and_probe():
+    table = TranspositionTable(0)       #The smallest table, a single bucket
+    table.store(12345, 2**20, 9, EXACT)
+    assert table.probe(12345) == (2**20, 9, EXACT, None)
+    table.store(54321, -17, 5, LOWER, 3)     #Shallower, so the first slot keeps the deeper entry
+    assert table.probe(54321) == (-17, 5, LOWER, 3)
+    assert table.probe(12345) == (2**20, 9, EXACT, None)
+    table.store(99999, 0, 1, UPPER)         #The second slot is always replaced
+    assert table.probe(54321) is None and table.probe(99999) == (0, 1, UPPER, None)
+    assert table.probe(77777) is None
+    assert table.hits == 4 and table.misses == 2
+    with pytest.raises(ValueError):
+        TranspositionTable(1, replace="never")
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from four_in_a_row import get_child_scores
+from connect4_reference import grid, random_position, rescan
+from vectorized import child_values, evaluate_batch, position_array
+
+
+def test_batch_matches_rescan():
+    rng = random.Random(8)
+    for rows, cols in ((6, 7), (4, 5), (7, 6)):
+        positions = [random_position(rng, rng.randint(0, rows*cols), rows, cols) for _ in range(20)]
+        boards = np.array([position_array(position) for position in positions])
+        for side in (0, 1):
+            scores = evaluate_batch(boards, side + 1, 2 - side)
+            assert scores.tolist() == [rescan(position, side) for position in positions]
+
+
+def test_position_array():
+    position = random_position(random.Random(80), 20)
+    cells = grid(position)
+    expected = [[0 if value is None else value + 1 for value in row] for row in cells]
+    assert position_array(position).tolist() == expected
+
+
+def test_child_values_match_scalar():
+    rng = random.Random(800)
+    for _ in range(20):
+        position = random_position(rng, rng.randint(0, 35))
+        for side in (0, 1):
+            for perspective in (0, 1):
+                columns, scores = child_values(position, side, perspective)
+                expected = []
+                for c in columns:
+                    position.make_move(c, side)
+                    expected.append(position.evaluate(perspective))
+                    position.unmake_move(c, side)
+                assert columns == [c for c in range(position.cols) if position.placeable(c)]
+                assert scores == expected
+        player = position.players[position.moves % 2]
+        assert get_child_scores(player, position) == list(zip(*child_values(position, position.moves % 2,
+                                                                            position.moves % 2)))
@@ -0,0 +1,145 @@
+#Transposition table for the connect 4 searches, keyed by the Zobrist hash that Position keeps up to date.
+#The table is a fixed block of 64-bit words, two per entry, so its size never grows during a game and the
+#same table can be kept between moves. Each entry stores the key xor-ed with its data next to the data itself,
+#an entry whose two words were written by different stores (or belongs to another position) simply fails the key check.
+
+import random
+from array import array
+
+EXACT = 1   #The stored score is the value of the node
+LOWER = 2   #The search failed high, the value is at least the stored score
+UPPER = 3   #The search failed low, the value is at most the stored score
+
+_SCORE_OFFSET = 1 << 31
+_MASK64 = (1 << 64) - 1
+
+_zobrist = {}   #Cache of zobrist keys by board size, the seed is fixed so every process hashes positions the same way
+
+
+def zobrist_keys(n_cells):
+    """
+    Random 64-bit keys for every (side, cell) pair of a board with n_cells bit indices.
+
+    Returns
+    -------
+    keys: list
+        keys[side][cell], xor-ed into a position's hash when side has a disc on cell
+    """
+    if n_cells not in _zobrist:
+        rng = random.Random(4401)
+        _zobrist[n_cells] = [[rng.getrandbits(64) for _ in range(n_cells)] for _ in range(2)]
+    return _zobrist[n_cells]
+
+
+#node_keys[side][is_max] is xor-ed into the hash of a node, the searches value a position differently
+#depending on whose turn it is and on whether it is a max or a min node
+_node_rng = random.Random(217395609)
+node_keys = [[_node_rng.getrandbits(64) for _ in range(2)] for _ in range(2)]
+
+
+class TranspositionTable:
+    """
+    Fixed-size transposition table.
+
+    Entries live in buckets of two slots. With the default "two-tier"
+    replacement the first slot keeps the deepest entry of the current search
+    and the second slot is always overwritten; with "always" the first slot
+    is simply overwritten.
+
+    Parameters
+    ----------
+    megabytes: float
+        memory cap of the table, rounded down to a power of two entries
+    replace: str
+        "two-tier" or "always"
+    buffer: writable buffer or None
+        memory to keep the entries in, for example a shared memory block,
+        it must hold at least 16 bytes per entry
+    """
+
+    ENTRY_BYTES = 16
+
+    def __init__(self, megabytes=16, replace="two-tier", buffer=None):
+        if replace not in ("two-tier", "always"):
+            raise ValueError("unknown replacement policy: " + str(replace))
+        entries = self.entries_for(megabytes)
+        self.size = entries
+        self.replace = replace
+        if buffer is None:
+            self.words = array("Q", bytes(entries*self.ENTRY_BYTES))
+        else:
+            self.words = memoryview(buffer).cast("B")[:entries*self.ENTRY_BYTES].cast("Q")
+        self.age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @classmethod
+    def entries_for(cls, megabytes):
+        #The largest power of two number of entries that fits in megabytes, at least one bucket
+        entries = 2
+        while entries*2*cls.ENTRY_BYTES <= megabytes*(1 << 20):
+            entries *= 2
+        return entries
+
+    def new_search(self):
+        #Called at the start of every move, entries of older searches become the first to be replaced
+        self.age = (self.age + 1) & 0xff
+
+    def clear(self):
+        self.words[:] = array("Q", bytes(len(self.words)*8))
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def probe(self, key):
+        """
+        Look up a position.
+
+        Returns
+        -------
+        entry: tuple or None
+            (score, depth, bound, move) of the stored search, move is None when
+            no best move was recorded
+        """
+        words = self.words
+        slot = (key & (self.size - 1) & ~1) << 1
+        for i in (slot, slot + 2):
+            data = words[i + 1]
+            if data and words[i] ^ data == key:
+                self.hits += 1
+                move = (data >> 42) & 0xf
+                return (
+                    (data & 0xffffffff) - _SCORE_OFFSET,
+                    (data >> 32) & 0xff,
+                    (data >> 40) & 0x3,
+                    move - 1 if move else None,
+                )
+        self.misses += 1
+        return None
+
+    def store(self, key, score, depth, bound, move=None):
+        """
+        Store the result of searching a position to the given depth.
+        """
+        data = (
+            (score + _SCORE_OFFSET)
+            | min(depth, 0xff) << 32
+            | bound << 40
+            | (0 if move is None else move + 1) << 42
+            | self.age << 46
+        )
+        words = self.words
+        slot = (key & (self.size - 1) & ~1) << 1
+        if self.replace == "two-tier":
+            old = words[slot + 1]
+            #Keep the first slot for the deeper entry unless it is from an older search or the same position
+            if old and (old >> 46) & 0xff == self.age and (old >> 32) & 0xff > depth and words[slot] ^ old != key:
+                slot += 2
+        words[slot] = (key ^ data) & _MASK64
+        words[slot + 1] = data
+        self.stores += 1
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
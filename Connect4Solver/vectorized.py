@@ -0,0 +1,114 @@
+#Vectorized version of evaluate() in four_in_a_row.py, scoring many boards in one NumPy call.
+#Every 4-slot window is a row of a precomputed table of flat cell indices, so gathering boards[:, table] gives
+#the contents of every window of every board at once, and the scores are a few array reductions over that.
+#NumPy is only needed by this module, the rest of the solver runs without it.
+
+try:
+    import numpy as np
+except ImportError:     #pragma: no cover
+    np = None
+
+from evaluation import WEIGHTS
+
+_tables = {}    #Cache of window index tables and bit layouts by board size
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("the vectorized evaluator needs numpy, install it with pip install numpy")
+
+
+def window_table(rows, cols):
+    """
+    Flat indices (r*cols + c) of the 4 slots of every horizontal, vertical,
+    slash and backslash window of a rows x cols board.
+
+    Returns
+    -------
+    table: ndarray of shape (windows, 4)
+    """
+    _require_numpy()
+    key = ("windows", rows, cols)
+    if key not in _tables:
+        table = []
+        for r in range(rows):
+            for c in range(cols):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    if 0 <= r + 3*dr < rows and 0 <= c + 3*dc < cols:
+                        table.append([(r + k*dr)*cols + c + k*dc for k in range(4)])
+        _tables[key] = np.array(table, dtype=np.intp)
+    return _tables[key]
+
+
+def evaluate_batch(boards, player, adversary):
+    """
+    Score many boards for the same player in one call.
+
+    Parameters
+    ----------
+    boards: array of shape (N, rows, cols)
+        the slots of every board, holding player, adversary or anything else for empty
+    player: the value of the player's discs
+    adversary: the value of the adversary's discs
+
+    Returns
+    -------
+    scores: ndarray of shape (N,)
+        evaluate(player, board) of every board
+    """
+    _require_numpy()
+    boards = np.asarray(boards)
+    n, rows, cols = boards.shape
+    windows = boards.reshape(n, rows*cols)[:, window_table(rows, cols)]    #(N, windows, 4)
+    own = np.count_nonzero(windows == player, axis=2)
+    adv = np.count_nonzero(windows == adversary, axis=2)
+    weights = np.array(WEIGHTS, dtype=np.int64)
+    reward = np.where(adv == 0, weights[own], 0).sum(axis=1)
+    penalty = np.where(own == 0, weights[adv], 0).sum(axis=1)
+    return reward - penalty
+
+
+def _bit_cells(rows, cols):
+    #For every slot r*cols + c (r counted from the bottom), its bit index in a Position mask
+    key = ("bits", rows, cols)
+    if key not in _tables:
+        _tables[key] = np.array([c*(rows + 1) + r for r in range(rows) for c in range(cols)], dtype=np.intp)
+    return _tables[key]
+
+
+def position_array(position):
+    """
+    The slots of a Position as a (rows, cols) int8 array, 1 for side 0 discs,
+    2 for side 1 discs and 0 for empty slots, with the bottom row first.
+    """
+    _require_numpy()
+    masks = np.array(position.masks, dtype=np.uint64).view(np.uint8)
+    bits = np.unpackbits(masks, bitorder="little").reshape(2, 64)[:, _bit_cells(position.rows, position.cols)]
+    return (bits[0] + 2*bits[1]).astype(np.int8).reshape(position.rows, position.cols)
+
+
+def child_values(position, side, perspective):
+    """
+    Score every child of a position in one call.
+
+    Parameters
+    ----------
+    position: Position
+    side: 0 or 1
+        the side dropping a disc into each placeable column
+    perspective: 0 or 1
+        the side the children are scored for
+
+    Returns
+    -------
+    columns: list of int
+        the placeable columns
+    scores: list of int
+        the score of the board after side drops a disc into each column
+    """
+    base = position_array(position)
+    columns = [c for c in range(position.cols) if position.placeable(c)]
+    rows = [position.height[c] - c*position.stride for c in columns]
+    children = np.repeat(base[None], len(columns), axis=0)
+    children[np.arange(len(columns)), rows, columns] = side + 1
+    return columns, evaluate_batch(children, perspective + 1, 2 - perspective).tolist()
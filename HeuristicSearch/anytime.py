@@ -0,0 +1,145 @@
+#Anytime search with Anytime Repairing A* (ARA*), for queries that must be answered before a deadline
+#A first path is found quickly by weighted A*, whose priorities g + epsilon*h inflate the heuristic and so expand few
+#nodes, at the price of a path up to epsilon times longer than the shortest. epsilon is then lowered step by step down
+#to 1 and the search resumes instead of starting over: the g values and parents of the earlier iterations are kept,
+#and only the nodes whose g went down after they were expanded (the inconsistent ones) are put back on the frontier.
+#Every improved path is reported with a bound on its suboptimality, distance <= bound * shortest distance, which is
+#usually much tighter than epsilon. The search stops at the deadline with the best path found so far.
+#
+#   for path, distance, bound in anytimeSearch(graph, start, end, heuristic, deadline=0.005):
+#       if bound <= 1.1:
+#           break
+
+import heapq
+import math
+import time
+
+
+def anytimeSearch(graph, start, end, heuristic, epsilon=2.5, decrease=0.5, deadline=None, stats=None):
+    """
+    ARA* between two nodes, yielding every improved path.
+
+    Parameters
+    ----------
+    graph: Graph
+    start, end: int
+        node ids
+    heuristic: sequence of int
+        admissable heuristic values towards end by node id
+    epsilon: float
+        inflation of the heuristic for the first search, at least 1
+    decrease: float
+        how much epsilon is lowered after every search
+    deadline: float or None
+        seconds from the first step of the generator after which the search
+        stops, None to search down to epsilon 1
+    stats: SearchStats or None
+        receives the counters of all the searches, with one phase per epsilon
+
+    Yields
+    ------
+    (path, distance, bound): list of node ids, int and float
+        a shorter path than the previous one or a tighter suboptimality
+        bound on it; the last one has bound 1.0 unless the deadline stopped the
+        search first. Nothing is yielded if there is no path or no path was
+        found before the deadline.
+    """
+    stopAt = None if deadline is None else time.perf_counter() + deadline
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    costAcc = {start: 0}        #g, cheapest known cost to reach every node
+    previous = {start: None}
+    opened = {start}            #Nodes on the frontier, the heap entries of other nodes are stale
+    closed = set()              #Nodes expanded in this iteration
+    inconsistent = set()        #Nodes whose cost went down after they were expanded in this iteration
+    frontier = [(epsilon*heuristic[start], 0, start)]     #(g + epsilon*h, g, node)
+    found, tightest = math.inf, math.inf    #Distance and bound of the last reported path
+    completed = math.inf        #epsilon of the last search that ran to the end, which bounds its path and later ones
+    expansions = 0
+
+    while True:
+        if stats is not None:
+            started = time.perf_counter()
+        timedOut = False
+        goalCost = costAcc.get(end, math.inf)
+        while frontier:
+            priority, costToNode, node = frontier[0]
+            if node not in opened or costToNode != costAcc[node]:
+                heapq.heappop(frontier)         #Stale entry
+                if stats is not None:
+                    stats.heap_pops += 1
+                    stats.stale += 1
+                continue
+            if goalCost <= priority:            #The goal would be popped next, nothing better is left at this epsilon
+                break
+            expansions += 1
+            if stopAt is not None and expansions % 32 == 0 and time.perf_counter() > stopAt:   #The clock is read every 32 expansions
+                timedOut = True
+                break
+            heapq.heappop(frontier)
+            opened.discard(node)
+            closed.add(node)
+            if stats is not None:
+                stats.frontier(len(frontier) + 1)
+                stats.heap_pops += 1
+                stats.expanded += 1
+                stats.generated += offsets[node + 1] - offsets[node]
+            for i in range(offsets[node], offsets[node + 1]):
+                child = targets[i]
+                newCost = costToNode + weights[i]
+                if child not in costAcc or newCost < costAcc[child]:
+                    costAcc[child] = newCost
+                    previous[child] = node
+                    if child == end:
+                        goalCost = newCost
+                    if child in closed:
+                        inconsistent.add(child)     #Expanded again in the next iteration, not in this one
+                    else:
+                        opened.add(child)
+                        heapq.heappush(frontier, (newCost + epsilon*heuristic[child], newCost, child))
+                        if stats is not None:
+                            stats.heap_pushes += 1
+        if stats is not None:
+            stats.record("epsilon %g" % epsilon, time.perf_counter() - started)
+
+        if end not in costAcc:      #No path, or none found before the deadline
+            return
+        if not timedOut:
+            completed = epsilon
+        #The shortest path is at least the smallest g + h of the nodes not expanded with their current cost, also in
+        #the middle of a search; epsilon only bounds the path once the search at that epsilon has finished
+        lowest = min((costAcc[u] + heuristic[u] for u in opened | inconsistent), default=costAcc[end])
+        bound = max(1.0, min(completed, costAcc[end]/lowest) if lowest > 0 else completed)
+        if costAcc[end] < found or bound < tightest:
+            found, tightest = costAcc[end], bound
+            path = [end]
+            while previous[path[-1]] is not None:
+                path.append(previous[path[-1]])
+            path.reverse()
+            yield path, found, bound
+        if timedOut or bound <= 1 or epsilon <= 1:
+            return
+
+        #Resume with a smaller epsilon: the inconsistent nodes join the frontier, whose priorities all change
+        epsilon = max(1.0, epsilon - decrease)
+        opened |= inconsistent
+        inconsistent = set()
+        closed = set()
+        frontier = [(costAcc[u] + epsilon*heuristic[u], costAcc[u], u) for u in opened]
+        heapq.heapify(frontier)
+
+
+def anytimePath(graph, start, end, heuristic, deadline=None, bound=1.0, epsilon=2.5, decrease=0.5, stats=None):
+    """
+    The best path anytimeSearch finds before the deadline, or as soon as its
+    suboptimality bound is at most bound.
+
+    Returns
+    -------
+    (path, distance, bound): see anytimeSearch, or (None, None, None) if no path was found
+    """
+    best = None, None, None
+    for best in anytimeSearch(graph, start, end, heuristic, epsilon, decrease, deadline, stats):
+        if best[2] <= bound:
+            break
+    return best
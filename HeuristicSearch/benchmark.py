@@ -0,0 +1,195 @@
+#Benchmark of the searches in find_path3.py on generated graphs
+#Random geometric, grid and scale-free graphs of a given size are generated from a fixed seed, so every run searches the
+#same graphs between the same pairs of nodes. Every algorithm answers all the queries of every graph and is reported
+#with its expanded nodes per second, query latency percentiles and peak memory, and compared with a saved baseline
+#by instrumentation/benchmark.py.
+#The heuristics are consistent: straight line distances on the geometric graphs, Manhattan distances on the grid and
+#landmark (ALT) bounds on the scale-free graph.
+#python benchmark.py --nodes 20000 --queries 100 --save baseline.json
+#python benchmark.py --nodes 20000 --queries 100 --baseline baseline.json
+#The instrumentation package is installed with pip install -e . from the repository root
+
+import argparse
+import math
+import random
+import sys
+import time
+
+from find_path3 import findPath
+from graph import Graph
+from landmarks import Landmarks
+from stats import SearchStats
+from instrumentation.benchmark import compare, load_baseline, peak_memory, save_baseline, summarize
+
+ALGORITHMS = ("bfs", "dfs", "ucs", "astar")
+GRAPHS = ("geometric", "grid", "scalefree")
+SCALE = 1000        #Coordinates of the geometric graph are in [0, SCALE)
+
+
+def geometricGraph(n, degree=6, seed=0):
+    """
+    Random geometric graph: n points in a square, each joined to the points
+    closer than the radius that gives the average degree. The weight of an
+    edge is its length rounded up, the heuristic the straight line distance
+    rounded down, which keeps it consistent.
+
+    Returns
+    -------
+    (graph, heuristic): Graph and a function of the goal id giving heuristic values by node id
+    """
+    rng = random.Random(seed)
+    points = [(rng.random()*SCALE, rng.random()*SCALE) for _ in range(n)]
+    radius = SCALE*math.sqrt(degree/(math.pi*n))
+    buckets = {}            #Points by square of side radius, only the neighbouring squares are compared
+    for u, (x, y) in enumerate(points):
+        buckets.setdefault((int(x//radius), int(y//radius)), []).append(u)
+    edges = []
+    for (bx, by), members in buckets.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for u in members:
+                    for v in buckets.get((bx + dx, by + dy), ()):
+                        if u < v:
+                            length = math.dist(points[u], points[v])
+                            if length <= radius:
+                                edges.append((str(u), str(v), math.ceil(length)))
+    graph = Graph.from_edges(edges)
+    coordinates = [points[int(name)] for name in graph.names]
+
+    def heuristic(goal):
+        return [int(math.dist(point, coordinates[goal])) for point in coordinates]
+    return graph, heuristic
+
+
+def gridGraph(n, seed=0):
+    """
+    Square 4-connected grid of about n nodes with weights from 10 to 20, and
+    10 times the Manhattan distance as the heuristic.
+    """
+    rng = random.Random(seed)
+    side = max(2, math.isqrt(n))
+    edges = []
+    for y in range(side):
+        for x in range(side):
+            if x + 1 < side:
+                edges.append(("%d,%d" % (x, y), "%d,%d" % (x + 1, y), rng.randint(10, 20)))
+            if y + 1 < side:
+                edges.append(("%d,%d" % (x, y), "%d,%d" % (x, y + 1), rng.randint(10, 20)))
+    graph = Graph.from_edges(edges)
+    coordinates = [tuple(int(part) for part in name.split(",")) for name in graph.names]
+
+    def heuristic(goal):
+        gx, gy = coordinates[goal]
+        return [10*(abs(x - gx) + abs(y - gy)) for x, y in coordinates]
+    return graph, heuristic
+
+
+def scaleFreeGraph(n, attach=2, seed=0, landmarks=8):
+    """
+    Scale-free graph grown by preferential attachment (Barabasi-Albert): every
+    new node is joined to attach nodes picked with a probability that grows
+    with their degree. Weights are from 1 to 100 and the heuristic comes from
+    landmarks.
+    """
+    rng = random.Random(seed)
+    edges = []
+    ends = []               #Every node once per edge it has, so a uniform pick is proportional to the degree
+    for u in range(1, min(n, attach + 1)):
+        edges.append(("0", str(u), rng.randint(1, 100)))
+        ends += [0, u]
+    for u in range(attach + 1, n):
+        chosen = set()
+        while len(chosen) < attach:
+            chosen.add(rng.choice(ends))
+        for v in chosen:
+            edges.append((str(u), str(v), rng.randint(1, 100)))
+            ends += [u, v]
+    graph = Graph.from_edges(edges)
+    return graph, Landmarks.build(graph, landmarks).heuristic
+
+
+GENERATORS = {
+    "geometric": geometricGraph,
+    "grid": gridGraph,
+    "scalefree": scaleFreeGraph,
+}
+
+
+def queries(graph, count, seed=0):
+    #Pairs of distinct node names picked from a fixed seed
+    rng = random.Random(seed)
+    return [tuple(graph.names[u] for u in rng.sample(range(len(graph)), 2)) for _ in range(count)]
+
+
+def benchmark(graph, heuristic, pairs, algorithm, repeat=1):
+    """
+    Time one algorithm on every query.
+
+    Returns
+    -------
+    result: dict
+        queries, expanded nodes, seconds, nodes_per_sec, p50_ms, p90_ms,
+        p99_ms and peak_kb
+    """
+    values = {}
+    if algorithm == "astar":        #Heuristic values are computed once per goal, outside of the timings
+        values = {end: heuristic(graph.ids[end]) for _, end in pairs}
+    latencies = []
+    expanded = 0
+    for _ in range(repeat):
+        for start, end in pairs:
+            stats = SearchStats()
+            started = time.perf_counter()
+            findPath(graph, algorithm, start, end, values.get(end), stats=stats)
+            latencies.append(time.perf_counter() - started)
+            expanded += stats.expanded
+
+    peak = peak_memory(lambda pair: findPath(graph, algorithm, pair[0], pair[1], values.get(pair[1])), pairs)
+    result = {"queries": len(latencies), "expanded": expanded}
+    result.update(summarize(latencies, expanded, peak))
+    return result
+
+
+def run(graphs=GRAPHS, algorithms=ALGORITHMS, nodes=10000, count=50, repeat=1, seed=0):
+    #Results of every algorithm on every generated graph
+    results = []
+    for kind in graphs:
+        graph, heuristic = GENERATORS[kind](nodes, seed=seed)
+        pairs = queries(graph, count, seed)
+        for algorithm in algorithms:
+            result = {"graph": kind, "nodes": len(graph), "edges": len(graph.targets)//2, "algorithm": algorithm}
+            result.update(benchmark(graph, heuristic, pairs, algorithm, repeat))
+            results.append(result)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the path searches on generated graphs.")
+    parser.add_argument("--graph", choices=GRAPHS, action="append", help="graph to generate, all by default")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, action="append", help="algorithm to time, all by default")
+    parser.add_argument("--nodes", type=int, default=10000, help="size of every graph")
+    parser.add_argument("--queries", type=int, default=50, help="queries per graph")
+    parser.add_argument("--repeat", type=int, default=3, help="times every query is timed")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", default=None, help="file to write the results to as a baseline")
+    parser.add_argument("--baseline", default=None, help="baseline file to compare the results with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown against the baseline, 0.2 for 20%%")
+    args = parser.parse_args(argv)
+
+    results = run(args.graph or GRAPHS, args.algorithm or ALGORITHMS, args.nodes, args.queries, args.repeat, args.seed)
+    print("graph", "algorithm", "nodes/sec", "p50 ms", "p90 ms", "p99 ms", "peak KB", sep="\t")
+    for r in results:
+        print(r["graph"], r["algorithm"], r["nodes_per_sec"], r["p50_ms"], r["p90_ms"], r["p99_ms"], r["peak_kb"], sep="\t")
+
+    if args.save is not None:
+        save_baseline(args.save, results)
+    if args.baseline is not None:
+        regressions = compare(results, load_baseline(args.baseline), ("graph", "nodes", "algorithm"), "expanded",
+                              "queries", args.tolerance)
+        for regression in regressions:
+            print("regression:", regression)
+        return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#Compact binary graph files for find_path3.py
+#A text graph (and optionally its heuristic files) is converted once into the compressed sparse row arrays of graph.py
+#plus a table of node names, written as raw little-endian arrays. Loading memory-maps the file and casts the arrays
+#in place, so nothing is parsed or copied and every process searching the same file shares its pages.
+#python binary_graph.py input_file1.txt graph.bin heuristic_Frankfort.txt
+#
+#Layout, every section starts on an 8 byte boundary:
+#   header      magic, version, node count n, edge entry count m, heuristic count k
+#   offsets     n+1 int64
+#   targets     m int32
+#   weights     m int64
+#   names       n+1 int64 offsets into the name bytes, then the UTF-8 name bytes
+#   by name     n int32 node ids sorted by name, for looking nodes up by name
+#   heuristics  k times: the goal's node id as int64, then n int64 heuristic values
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from graph import Graph
+
+MAGIC = b"CSRGRAPH"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIxxxxQQQ")
+
+
+def isBinaryGraph(file):
+    #True if file starts with the magic of a binary graph
+    with open(file, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _pad(f):
+    f.write(bytes(-f.tell() % 8))
+
+
+def _writeArray(f, typecode, values):
+    values = array(typecode, values)
+    if sys.byteorder != "little":
+        values.byteswap()
+    values.tofile(f)
+    _pad(f)
+
+
+def writeBinaryGraph(graph, file, heuristics=None):
+    """
+    Write a Graph to a binary graph file.
+
+    Parameters
+    ----------
+    graph: Graph
+    file: str
+    heuristics: dict or None
+        goal node name -> heuristic values by node id
+    """
+    heuristics = heuristics or {}
+    n = len(graph)
+    nameBytes = [name.encode("utf-8") for name in graph.names]
+    nameOffsets = [0]
+    for name in nameBytes:
+        nameOffsets.append(nameOffsets[-1] + len(name))
+
+    with open(file, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, _VERSION, n, len(graph.targets), len(heuristics)))
+        _writeArray(f, "q", graph.offsets)
+        _writeArray(f, "i", graph.targets)
+        _writeArray(f, "q", graph.weights)
+        _writeArray(f, "q", nameOffsets)
+        f.write(b"".join(nameBytes))
+        _pad(f)
+        _writeArray(f, "i", sorted(range(n), key=lambda u: nameBytes[u]))
+        for goal, values in heuristics.items():
+            _writeArray(f, "q", [graph.ids[goal]])
+            _writeArray(f, "q", values)
+
+
+def heuristicGoal(heuristicFile):
+    #The goal a heuristic file is for, from its name heuristic_<goal>.txt
+    return os.path.splitext(os.path.basename(heuristicFile))[0].split("_", 1)[-1]
+
+
+def convert(graphFile, outFile, heuristicFiles=()):
+    """
+    Convert a text graph and its heuristic files (heuristic_<goal>.txt) into a
+    binary graph file.
+    """
+    from find_path3 import hGraph, makeGraph
+
+    graph = makeGraph(graphFile)
+    heuristics = {}
+    for heuristicFile in heuristicFiles:
+        values = hGraph(heuristicFile)
+        heuristics[heuristicGoal(heuristicFile)] = [int(values.get(name, 0)) for name in graph.names]
+    writeBinaryGraph(graph, outFile, heuristics)
+    return graph
+
+
+class _Names:
+    #Node names by id, decoded from the mapped name bytes only when asked for
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, u):
+        if not 0 <= u < len(self):
+            raise IndexError(u)
+        return str(self.encoded(u), "utf-8")
+
+    def encoded(self, u):
+        #The UTF-8 bytes of the name of u
+        return bytes(self.data[self.offsets[u]:self.offsets[u + 1]])
+
+    def __iter__(self):
+        return (self[u] for u in range(len(self)))
+
+
+class _NameIndex:
+    #Node ids by name, found by binary search over the ids sorted by name
+
+    def __init__(self, names, sortedIds):
+        self.names = names
+        self.sortedIds = sortedIds
+
+    def get(self, name, default=None):
+        key = name.encode("utf-8")
+        names = self.names
+        low, high = 0, len(self.sortedIds)
+        while low < high:
+            middle = (low + high) // 2
+            if names.encoded(self.sortedIds[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.sortedIds):
+            u = self.sortedIds[low]
+            if names.encoded(u) == key:
+                return u
+        return default
+
+    def __getitem__(self, name):
+        u = self.get(name)
+        if u is None:
+            raise KeyError(name)
+        return u
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __len__(self):
+        return len(self.sortedIds)
+
+
+class MappedGraph(Graph):
+    """
+    A Graph whose arrays are views into a memory-mapped binary graph file.
+    """
+
+    def __init__(self, file):
+        with open(file, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = memoryview(self.map)
+        magic, version, n, m, k = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != _VERSION:
+            raise ValueError(file + " is not a binary graph file")
+        if sys.byteorder != "little":
+            raise ValueError("binary graph files can only be mapped on little-endian machines")
+
+        position = _HEADER.size
+
+        def section(typecode, count, size):
+            nonlocal position
+            view = data[position:position + count*size].cast(typecode)
+            position += count*size + (-(count*size) % 8)
+            return view
+
+        offsets = section("q", n + 1, 8)
+        targets = section("i", m, 4)
+        weights = section("q", m, 8)
+        nameOffsets = section("q", n + 1, 8)
+        nameData = section("B", nameOffsets[n], 1)
+        names = _Names(nameOffsets, nameData)
+        sortedIds = section("i", n, 4)
+        Graph.__init__(self, names, offsets, targets, weights, _NameIndex(names, sortedIds))
+        for _ in range(k):
+            goal = section("q", 1, 8)[0]
+            self.heuristics[names[goal]] = section("q", n, 8)
+
+    def weight(self, u, v):
+        #Scan the neighbours of u instead of building a lookup map over the whole mapped file
+        best = None
+        for v2, weight in self.neighbors(u):
+            if v2 == v and (best is None or weight < best):
+                best = weight
+        if best is None:
+            raise KeyError((u, v))
+        return best
+
+    def set_weight(self, u, v, weight):
+        raise TypeError("a memory-mapped graph is read-only, load the text graph to change its weights")
+
+
+if __name__ == "__main__":
+    #python binary_graph.py graph.txt graph.bin [heuristic_<goal>.txt ...]
+    if len(sys.argv) < 3:
+        print("usage: python binary_graph.py graph.txt graph.bin [heuristic_<goal>.txt ...]")
+        sys.exit(1)
+    graph = convert(sys.argv[1], sys.argv[2], sys.argv[3:])
+    print(len(graph), "nodes and", len(graph.targets), "edge entries written to", sys.argv[2])
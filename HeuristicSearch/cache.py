@@ -0,0 +1,103 @@
+#Memoization of path queries in front of findPath in find_path3.py
+#Answers are kept in a bounded LRU keyed by the graph version and the query, so a repeated (algorithm, start, end)
+#query is answered without searching. Uniform cost searches also keep the shortest path tree they settled on the way
+#to their target: every later ucs query from the same start to a node that tree already settled is read off the tree.
+#When the graph changes, Graph.changed() starts a new version and the cache drops everything it had on its next use.
+#The cache can be shared by threads: its tables are only touched under a lock, the searches run outside of it.
+
+import threading
+from collections import OrderedDict
+
+from find_path3 import findPath, shortestPathTree
+
+
+class PathCache:
+    """
+    LRU cache of path queries on one graph.
+
+    Parameters
+    ----------
+    graph: Graph
+    size: int
+        the most answers kept
+    trees: int
+        the most shortest path trees kept, one per start node
+    """
+
+    def __init__(self, graph, size=4096, trees=64):
+        self.graph = graph
+        self.size = size
+        self.treeSize = trees
+        self.answers = OrderedDict()    #(version, algorithm, start, end) -> (path, distance)
+        self.trees = OrderedDict()      #(version, start id) -> (costs, parents) of the settled nodes
+        self.version = graph.version
+        self.hits = 0
+        self.treeHits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def invalidate(self):
+        #Drop every cached answer and tree, called whenever the graph has changed
+        self.answers.clear()
+        self.trees.clear()
+        self.version = self.graph.version
+
+    def findPath(self, typeG, start, end, heuristic=None, toStart=None, hierarchy=None, stats=None):
+        """
+        findPath(graph, typeG, start, end, ...) on the cached graph, from the
+        cache when the same query was answered on this version of the graph.
+        """
+        with self.lock:
+            if self.graph.version != self.version:
+                self.invalidate()
+            key = (self.version, typeG, start, end)
+            if key in self.answers:
+                self.hits += 1
+                self.answers.move_to_end(key)
+                return self.answers[key]
+
+        if typeG == "ucs" and start in self.graph and end in self.graph:
+            result = self._fromTree(key[0], self.graph.ids[start], self.graph.ids[end], stats)
+        else:
+            result = findPath(self.graph, typeG, start, end, heuristic, toStart, hierarchy, stats)
+            with self.lock:
+                self.misses += 1
+
+        with self.lock:
+            self.answers[key] = result
+            if len(self.answers) > self.size:
+                self.answers.popitem(last=False)
+        return result
+
+    def _fromTree(self, version, start, end, stats=None):
+        #ucs answer from the shortest path tree of start, searching further only when end was not settled yet
+        key = (version, start)
+        with self.lock:
+            tree = self.trees.get(key)
+            if tree is not None and end in tree[0]:
+                self.treeHits += 1
+                self.trees.move_to_end(key)
+            else:
+                self.misses += 1
+                tree = None
+        if tree is None:
+            #Nodes the old tree settled are all closer than end, so the new tree settles them again and replaces it
+            tree = shortestPathTree(self.graph, start, [end], stats)
+            with self.lock:
+                self.trees[key] = tree
+                self.trees.move_to_end(key)
+                if len(self.trees) > self.treeSize:
+                    self.trees.popitem(last=False)
+
+        costs, parents = tree
+        if end not in costs:
+            return None, None
+        path = [end]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return self.graph.path_names(path), costs[end]
+
+    def hitRate(self):
+        lookups = self.hits + self.treeHits + self.misses
+        return (self.hits + self.treeHits)/lookups if lookups else 0.0
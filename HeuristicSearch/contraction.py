@@ -0,0 +1,272 @@
+#Contraction hierarchies for shortest path queries on the graphs of find_path3.py
+#Offline, nodes are contracted one at a time in order of importance: a contracted node is taken out of the graph and,
+#for every pair of its neighbours whose shortest path ran through it, a shortcut edge is added between them. Whether a
+#shortcut is needed is decided by a witness search, a Dijkstra search that tries to find an equally short path around
+#the node. Nodes are ordered by edge difference (shortcuts added minus edges removed) plus the number of neighbours
+#already contracted, which spreads the contraction evenly over the graph.
+#A query is then a bidirectional Dijkstra search that only follows edges towards more important nodes, both searches
+#meet at the most important node of the shortest path, and shortcuts are unpacked back into the edges of the graph.
+#python contraction.py input_file1.txt ch.bin
+#python find_path3.py ch input_file1.txt Richmond Frankfort ch.bin
+
+import argparse
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b"CHIERARC"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIxxxxQQ")     #magic, version, number of nodes, number of upward edges
+
+ORIGINAL = -1       #Middle node of an edge that is not a shortcut
+
+
+def isHierarchyFile(file):
+    #True if file starts with the magic of a contraction hierarchy file
+    with open(file, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class ContractionHierarchy:
+    """
+    The upward graph of a contraction hierarchy: for every node, the edges and
+    shortcuts to nodes contracted after it, in compressed sparse row form.
+
+    Parameters
+    ----------
+    ranks: sequence of int
+        the contraction order of every node id
+    offsets: sequence of int
+        n+1 offsets into targets, weights and middles
+    targets, weights: sequence of int
+        the upward edges of every node, one slice per node
+    middles: sequence of int
+        the node a shortcut skips, ORIGINAL for edges of the graph
+    """
+
+    def __init__(self, ranks, offsets, targets, weights, middles):
+        self.ranks = ranks
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.middles = middles
+        self.map = None
+
+    def __len__(self):
+        return len(self.ranks)
+
+    @classmethod
+    def build(cls, graph, settleLimit=500):
+        """
+        Contract every node of an undirected graph.
+
+        Parameters
+        ----------
+        graph: Graph
+        settleLimit: int
+            the most nodes a witness search settles before it gives up and a
+            shortcut is added, which is never wrong, only less compact
+        """
+        n = len(graph)
+        adjacency = [{} for _ in range(n)]     #Remaining graph, neighbour -> (weight, middle), lightest edge only
+        for u in range(n):
+            for v, weight in graph.neighbors(u):
+                if v != u and (v not in adjacency[u] or weight < adjacency[u][v][0]):
+                    adjacency[u][v] = (weight, ORIGINAL)
+
+        def witnessDistances(source, excluded, maxCost):
+            #Distances from source without going through excluded, exact up to maxCost
+            distances = {source: 0}
+            frontier = [(0, source)]
+            settled = 0
+            while frontier:
+                cost, u = heapq.heappop(frontier)
+                if cost > distances[u]:
+                    continue
+                settled += 1
+                if cost > maxCost or settled > settleLimit:
+                    break
+                for v, (weight, _) in adjacency[u].items():
+                    if v != excluded and (v not in distances or cost + weight < distances[v]):
+                        distances[v] = cost + weight
+                        heapq.heappush(frontier, (cost + weight, v))
+            return distances
+
+        def shortcuts(v):
+            #(a, b, weight) of every shortcut contracting v would need
+            neighbours = [(u, weight) for u, (weight, _) in adjacency[v].items()]
+            needed = []
+            for i, (a, toA) in enumerate(neighbours):
+                rest = neighbours[i + 1:]
+                if not rest:
+                    continue
+                distances = witnessDistances(a, v, toA + max(weight for _, weight in rest))
+                for b, toB in rest:
+                    if distances.get(b, toA + toB + 1) > toA + toB:
+                        needed.append((a, b, toA + toB))
+            return needed
+
+        contractedNeighbours = [0]*n
+
+        def priority(v):
+            needed = shortcuts(v)
+            return len(needed) - len(adjacency[v]) + contractedNeighbours[v], needed
+
+        queue = [(priority(v)[0], v) for v in range(n)]
+        heapq.heapify(queue)
+        ranks = array("q", [0])*n
+        upward = [None]*n
+        for rank in range(n):
+            while True:     #Lazy updates: recompute the priority of the top node until it stays on top
+                _, v = heapq.heappop(queue)
+                value, needed = priority(v)
+                if not queue or value <= queue[0][0]:
+                    break
+                heapq.heappush(queue, (value, v))
+
+            ranks[v] = rank
+            upward[v] = [(u, weight, middle) for u, (weight, middle) in adjacency[v].items()]
+            for u in adjacency[v]:
+                del adjacency[u][v]
+                contractedNeighbours[u] += 1
+            for a, b, weight in needed:
+                if b not in adjacency[a] or weight < adjacency[a][b][0]:
+                    adjacency[a][b] = (weight, v)
+                    adjacency[b][a] = (weight, v)
+            adjacency[v] = {}
+
+        offsets = array("q", [0])
+        targets, weights, middles = array("q"), array("q"), array("q")
+        for u in range(n):
+            for v, weight, middle in upward[u]:
+                targets.append(v)
+                weights.append(weight)
+                middles.append(middle)
+            offsets.append(len(targets))
+        return cls(ranks, offsets, targets, weights, middles)
+
+    def query(self, start, end):
+        """
+        Shortest path between two node ids.
+
+        Returns
+        -------
+        (path, distance): list of node ids and int, or (None, None) if there is no path
+        """
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        distances = ({start: 0}, {end: 0})
+        previous = ({start: None}, {end: None})
+        frontiers = ([(0, start)], [(0, end)])
+        best = None         #Length of the shortest path found so far
+        meeting = None      #The node where it joins the two upward searches
+        side = 0
+        while frontiers[0] or frontiers[1]:
+            if not frontiers[side]:
+                side = 1 - side
+            cost, u = heapq.heappop(frontiers[side])
+            costs, other = distances[side], distances[1 - side]
+            if best is not None and cost >= best:
+                frontiers[side].clear()         #Nothing further up on this side can be shorter
+                continue
+            if cost > costs[u]:
+                side = 1 - side
+                continue
+            if u in other and (best is None or cost + other[u] < best):
+                best = cost + other[u]
+                meeting = u
+            for i in range(offsets[u], offsets[u + 1]):    #Only edges towards nodes contracted later
+                v = targets[i]
+                newCost = cost + weights[i]
+                if v not in costs or newCost < costs[v]:
+                    costs[v] = newCost
+                    previous[side][v] = u
+                    heapq.heappush(frontiers[side], (newCost, v))
+            side = 1 - side
+
+        if meeting is None:
+            return None, None
+        upPath = [meeting]
+        while previous[0][upPath[-1]] is not None:
+            upPath.append(previous[0][upPath[-1]])
+        upPath.reverse()
+        while previous[1][upPath[-1]] is not None:
+            upPath.append(previous[1][upPath[-1]])
+        return self.unpack(upPath), best
+
+    def _edge(self, u, v):
+        #Index of the upward edge between u and v, stored with whichever of them is contracted first
+        if self.ranks[u] > self.ranks[v]:
+            u, v = v, u
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            if self.targets[i] == v:
+                return i
+        raise KeyError((u, v))
+
+    def unpack(self, path):
+        #Replace every shortcut on a path of node ids with the edges it skips
+        unpacked = [path[0]]
+        stack = [(path[i], path[i + 1]) for i in range(len(path) - 2, -1, -1)]
+        while stack:
+            u, v = stack.pop()
+            middle = self.middles[self._edge(u, v)]
+            if middle == ORIGINAL:
+                unpacked.append(v)
+            else:
+                stack.append((middle, v))
+                stack.append((u, middle))
+        return unpacked
+
+    def save(self, file):
+        with open(file, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, _VERSION, len(self.ranks), len(self.targets)))
+            for values in (self.ranks, self.offsets, self.targets, self.weights, self.middles):
+                values = array("q", values)
+                if sys.byteorder != "little":
+                    values.byteswap()
+                values.tofile(f)
+
+    @classmethod
+    def load(cls, file, graph=None):
+        """
+        Memory-map a hierarchy file written by save. With graph, check that the
+        file was built for a graph with as many nodes.
+        """
+        with open(file, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n, m = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != _VERSION:
+            raise ValueError(file + " is not a contraction hierarchy file")
+        if sys.byteorder != "little":
+            raise ValueError("contraction hierarchy files can only be mapped on little-endian machines")
+        if graph is not None and n != len(graph):
+            raise ValueError("%s was built for a graph with %d nodes, not %d" % (file, n, len(graph)))
+        view = memoryview(data)[_HEADER.size:].cast("q")
+        sections = []
+        position = 0
+        for size in (n, n + 1, m, m, m):
+            sections.append(view[position:position + size])
+            position += size
+        hierarchy = cls(*sections)
+        hierarchy.map = data
+        return hierarchy
+
+
+def main(argv=None):
+    from find_path3 import makeGraph
+
+    parser = argparse.ArgumentParser(description="Contract a graph and write its contraction hierarchy.")
+    parser.add_argument("graph", help="text graph or binary graph file")
+    parser.add_argument("out", help="hierarchy file to write")
+    parser.add_argument("--settle-limit", type=int, default=500, help="nodes settled by a witness search at most")
+    args = parser.parse_args(argv)
+
+    graph = makeGraph(args.graph)
+    hierarchy = ContractionHierarchy.build(graph, args.settle_limit)
+    hierarchy.save(args.out)
+    print(len(hierarchy), "nodes and", len(hierarchy.targets), "upward edges written to", args.out)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,311 +1,677 @@
-import sys
-from collections import defaultdict
-import queue
-
-#Simple python program to create a graph from an input text file and perform ucs, bfs, dfs or astar search between any two points on the graph
-#Nophil Mehboob 217395609
-#Implements psuedocode from: https://github.com/aimacode/aima-pseudocode, although my implemenatation varies in many places
-
-
-
-gEdges = [] #Global list of edges, helps for shortening run time with my implementation of a graph. Each index contains both nodes and the weight of the edge
-
-
-#Main method, simply calls the appropriate search algorithm based on user input
-#@param, typeG, the type of search algorithm to use
-#@param file, the name of the file containing the graph
-#@param start, the starting point
-#@param end, the goal node
-#@param heuristic, the file containing the heuristic values
-def main(typeG, file, start, end, heuristic):
-
-    graph = makeGraph(file) #Create the graph
-
-    if(typeG == "bfs"):
-        bfs(graph, start, end)
-
-    elif(typeG == "dfs"):
-        dfs(graph, start, end)
-
-    elif(typeG == "ucs"):
-        ucs(graph, start, end)
-
-    elif(typeG == "astar"):
-        astar(graph, start, end, heuristic)
-
-
-#python p1.py bfs  input_file1.txt Richmond Frankfort heuristic_Frankfort.txt
-#Creates a graph from the input file. The graph is implemented using only maps. Every index of a node contains a list of adjacent nodes
-def makeGraph(file):
-
-    edges = []
-    with open(file) as file:
-        for line in file:       #Loop through file
-            if(line != "END"):
-                try:
-                    splitted = line.split()                                 
-                    edges.append([splitted[0],splitted[1],splitted[2]])     #Split line into seperate parts and 
-                    gEdges.append([splitted[0],splitted[1],splitted[2]])
-                except:
-                    pass
-
-    graph = defaultdict(list)   #Create a map of lists representing nodes connected to eachother
-
-    for edge in edges:
-        a = edge[0]
-        b =  edge[1]
-
-        graph[a].append(b)      #Add nodes to eachothers map entries
-        graph[b].append(a)
-
-    return graph
-
-
-#Search algorithm for a Breadth First Search, is not optimal
-#@param graph, the graph
-#@param start, the starting node
-#@param end, the goal node
-def bfs(graph, start, end):
-
-    if(start == end):
-        print("Start is end, invalid path")
-        return
-
-    visited = []            #Nodes visited so far
-    frontier = []           #FIFO queue for frontier
-    frontier.append([start])
-
-    while(frontier):           #While frontier  is not empty
-
-        parent = frontier.pop(0)    #The first node in the friontier queue
-
-        current = parent[-1]     #We store paths, not nodes, so get end of path because we go wide, not deep
-        
-
-        if current not in visited:
-            neighbours = graph[current]
-
-            for neighbor in neighbours:     #For children of parent node
-                new_path = list(parent)
-                new_path.append(neighbor)   #Add adjacent node to path
-                frontier.append(new_path)   #Add new node to frontier queue
-
-                if neighbor == end:         #If child is a goal then
-                    printPath(new_path)  #Print path
-                    return
-
-            visited.append(current)         #Done with current node
-    printNoPath()
-    
-
-
-#Function used to print out paths for any search algorithm, only requires nodes on the path
-def printPath(path):
-    print("path: \n")
-
-    currentDist = 0                                             #Distance of current edge
-    totalDist = 0                                               #Total distance traveled
-    for i in range(0,len(path)-1):                              #For node in path
-        for edge in gEdges:                                     #Check edges list for corresponding edge
-            if(edge[0] == path[i] and edge[1] == path[i+1]):
-                currentDist = edge[2]
-                totalDist += int(currentDist)                   #Add to distances
-            elif(edge[1] == path[i] and edge[0] == path[i+1]):
-                currentDist = edge[2]
-                totalDist+= int(currentDist)
-        print(path[i], " to ",path[i+1],": ", currentDist, " mi\n") #Print out current location in path
-    print("distance: ", totalDist, " mi\n")                     #Print end of path
-    
-
-
-#Search algorithm for a Depth First Search, is not optimal
-#@param graph, the graph
-#@param start, the starting node
-#@param end, the goal node
-def dfs(graph, start, end):
-
-    if(start == end):
-        print("Start is end, invalid path")
-        return
-
-    frontierStack = []     
-    frontierStack.append(start)     #The frontier, this time as a stack
-    
-    previous = {}                   #Running track of the previous node in our search path
-
-    seen = set()                    #Set containing seen nodes
-    seen.add(start)
-
-    while(frontierStack):                       #While frontier is not empty
-        current = frontierStack.pop()           #Pop current node
-        neighbors = graph[current]
-        for neighbor in neighbors:              #For each child
-            if neighbor not in seen:            #If not already explored
-                seen.add(neighbor)
-                frontierStack.append(neighbor)  #Add new deeper node to stack, fulfilling depth priority
-                previous[neighbor] = current    
-
-    #Search algorithm is now complete, but we must format so that we can use our print function correctly
-    bungo = True
-    path = []
-    currentPath = end       #Start at end
-    path.append(end)
-    try:
-        while(bungo):                           #Keep following previous[] until we reach our starting point
-            currentPath = previous[currentPath]
-            path.append(currentPath)            #Add current node to total path    
-            if(currentPath == start):
-                bungo = False
-    except:
-        printNoPath()
-        return
-
-    path.reverse()
-    printPath(path)         #Print the path
-
-
-#Helper function to get a list of all edges adjacent to our current node, used in the UCS algorithm
-#@param, our current node in the graph
-def adjacentEdges(current_node):
-    adjacency = []
-    for edge in gEdges:
-        if edge[0] == current_node or edge[1] == current_node:  #Check if either end of an edge is our current node
-            adjacency.append(edge)
-    return adjacency
-
-
-
-#Search algorithm for a Uniform Cost Search, is optimal
-#@param graph, the graph
-#@param start, the starting node
-#@param end, the goal node
-def ucs(graph, start, end):
-
-    if(start == end):
-        print("Start is end, invalid path")
-        return
-
-    visited = set()
-
-    frontier = queue.PriorityQueue()        #Priority queue for the frontier
-    frontier.put((0,start, [start]))        #Each entry in the frontier includes the node itself, as well the the accumulative cost to reach the node and the path to get there
-
-
-    while not frontier.empty():                             #While frontier not empty
-        costToNode, current_node, path = frontier.get()     #Get lowest cost node
-        visited.add(current_node)
-
-        if current_node == end:                             #If we found the end, print path
-            printPath(path)
-            return path
-        else:
-            for edge in adjacentEdges(current_node):        #For every adjacent edge
-                if edge[0] == current_node:
-                    child = edge[1]                         #Checking which node is adjacent
-                else:
-                    child = edge[0]
-                if child not in visited:                    
-                    frontier.put((costToNode + int(edge[2]), child, path + [child]))    #Add child to priority queue with updated cost and path
-    printNoPath()
-
-
-
-#Helper function to read heuristic file and create a map containing the heuristic value for each node    
-def hGraph(heuristicFile):
-    heuristics = {}                                     #Use map to simplify runtime
-    with open(heuristicFile) as file:
-        for line in file:
-            if ("END" not in line):
-                lineS = line.split()
-                try:
-                    heuristics[lineS[0]] = lineS[1]     #Map at index = city equals hueristic value
-                except:
-                    pass
-    return heuristics
-
-
-
-#Search algorithm for an AStar search, is optimal with an admissable heuristic
-#@param graph, the graph
-#@param start, the starting node
-#@param end, the goal node
-#@param heuristic, the file containing the heuristic values
-def astar(graph, start, end, heuristic):
-
-    if(start == end):
-        print("Start is end, invalid path")
-        return
-
-    heuristicGraph = hGraph(heuristic)  #Get heuristic values as a map
-
-    frontier = queue.PriorityQueue()    #Friontier as priority queue again
-    frontier.put(start, 0)
-   
-    previous = {}                       #Previous node in ideal path for each node
-    costAcc = {}                        #Accuimulative cost to get to any point in the graph
-
-    previous[start] = None
-    costAcc[start] = 0
-    
-    paths = []
-
-    while not frontier.empty():         #While frontier is not empty
-        current_node = frontier.get()   
-
-        if current_node == end:
-            paths.append([previous,current_node])
-            # printPathAstar(previous, current_node)                          #End only if we DEQUEUE! a goal state
-            #return()
-
-        neighbors = graph[current_node]
-        for neighbor in neighbors:                                          #Check neighbors
-
-            for edge in gEdges:                                             #Find correct edge representing our current node and nieghbor, only necessary because my graph implementation is bad
-                if edge[0] == current_node and edge[1] == neighbor:
-                    newCostAcc = costAcc[current_node] + int(edge[2])
-                elif edge[1] == current_node and edge[0] == neighbor:
-                    newCostAcc = costAcc[current_node] + int(edge[2])
-
-            if neighbor not in costAcc or newCostAcc < costAcc[neighbor]:   #If we haven't visited this node yet or this is a cheaper path than before
-                costAcc[neighbor] = newCostAcc                              #Save total cost to reach the node
-                importance = newCostAcc + int(heuristicGraph[neighbor])     #Importance/priority of new node
-                frontier.put(neighbor, importance)                                
-                previous[neighbor] = current_node                           #Save shortest path to current node
-    if not paths:
-        printNoPath()
-        return()
-
-    bestCost = paths[0][1]
-    #Incase two paths have goal on the fringe
-    for path in paths:
-        if path[1] <= bestCost:
-            bestCost = path[1]
-            bestPath = path
-    printPathAstar(bestPath[0], bestPath[1])
-
-
-
-#Function to print the path for Astar, the path it finds is a little more complicated and needs to printed differently
-def printPathAstar(path, current):
-
-    combinedPath = []
-    combinedPath.append(current)
-    while path[current] != None:            #Iterate from end to start and add nodes on the path to our total path
-        combinedPath.append(path[current])
-        current = path[current]
-    combinedPath = combinedPath[::-1]       #Reverse the path
-    printPath(combinedPath)              #Print the path
-
-def printNoPath():
-    print("path: ")
-    print("none\n")
-    print("distance: infinity\n")
-    
-
-#Call main without heuristics
-if len(sys.argv) == 5:
-    main(sys.argv[1],sys.argv[2],sys.argv[3],sys.argv[4], sys.argv[4])
-
-#Call main with heuristics
-if len(sys.argv) == 6:
-    main(sys.argv[1],sys.argv[2],sys.argv[3],sys.argv[4], sys.argv[5])
\ No newline at end of file
+import sys
+import heapq
+import time
+from collections import deque
+
+from graph import Graph
+from binary_graph import MappedGraph, isBinaryGraph
+from contraction import ContractionHierarchy
+from landmarks import Landmarks, isLandmarkFile
+from anytime import anytimeSearch
+from grid import GridMap, isGridMap, gridSearch, jumpPointSearch, octile
+
+#Simple python program to create a graph from an input text file and perform ucs, bfs, dfs or astar search, or their bidirectional versions biucs and biastar, or ch on a contraction hierarchy, between any two points on the graph
+#Nophil Mehboob 217395609
+#Implements psuedocode from: https://github.com/aimacode/aima-pseudocode, although my implemenatation varies in many places
+
+
+#Main method, simply calls the appropriate search algorithm based on user input
+#@param, typeG, the type of search algorithm to use
+#@param file, the name of the file containing the graph
+#@param start, the starting point
+#@param end, the goal node
+#@param heuristic, the file containing the heuristic values, or a landmark file from landmarks.py
+def main(typeG, file, start, end, heuristic):
+
+    if isGridMap(file):     #Grid maps are searched on their cells, see grid.py
+        gridPath(GridMap.load(file), typeG, start, end)
+        return
+
+    graph = makeGraph(file) #Create the graph
+
+    if(typeG == "bfs"):
+        bfs(graph, start, end)
+
+    elif(typeG == "dfs"):
+        dfs(graph, start, end)
+
+    elif(typeG == "ucs"):
+        ucs(graph, start, end)
+
+    elif(typeG == "astar"):
+        astar(graph, start, end, graph.heuristics.get(end, heuristic))   #Heuristic values stored in a binary graph come first
+
+    elif(typeG == "arastar"):
+        arastar(graph, start, end, graph.heuristics.get(end, heuristic))
+
+    elif(typeG == "biucs"):
+        biucs(graph, start, end)
+
+    elif(typeG == "biastar"):
+        biastar(graph, start, end, graph.heuristics.get(end, heuristic))
+
+    elif(typeG == "ch"):
+        ch(graph, start, end, heuristic)    #The heuristic argument is the hierarchy file from contraction.py
+
+
+#python p1.py bfs  input_file1.txt Richmond Frankfort heuristic_Frankfort.txt
+#Creates a graph from the input file. Every node gets an integer id and a list of (neighbour, weight) pairs, see graph.py
+#A binary graph file written by binary_graph.py is memory-mapped instead of parsed
+def makeGraph(file):
+
+    if isBinaryGraph(file):
+        return MappedGraph(file)
+
+    edges = []
+    with open(file) as file:
+        for line in file:       #Loop through file
+            splitted = line.split()
+            if(len(splitted) >= 3):                                     #Skips the END line and anything that is not an edge
+                edges.append((splitted[0],splitted[1],int(splitted[2])))   #Split line into seperate parts, the weight is parsed once here
+
+    return Graph.from_edges(edges)     #Every edge is added in both directions
+
+
+#Search algorithm for a Breadth First Search, is not optimal
+#@param graph, the graph
+#@param start, the starting node
+#@param end, the goal node
+def bfs(graph, start, end):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in graph or end not in graph:
+        printNoPath()
+        return
+
+    path = bfsSearch(graph, graph.ids[start], graph.ids[end])
+    if path is None:
+        printNoPath()
+        return
+    path = graph.path_names(path)
+    printPath(graph, path)  #Print path
+    return path
+
+
+#Breadth first search on node ids, the goal is tested as soon as it is reached
+#@param stats, SearchStats that receives the counters of the search, or None
+#@return list of node ids on the path, or None if there is no path
+def bfsSearch(graph, start, end, stats=None):
+    return traversalPath(traverse(graph, start, False, stats), end)
+
+
+#Traversal of every node reachable from start, as a generator so huge graphs can be streamed through
+#The frontier is a deque used as a FIFO queue (bfs) or a stack (dfs), and the visited set is one byte per node id.
+#Nodes are yielded once, when they are first reached, which for bfs is also the order they are visited in
+#@param graph, the graph
+#@param start, the starting node id
+#@param depthFirst, True for a depth first traversal
+#@param stats, SearchStats that receives the counters of the traversal, or None
+#@yield (node id, id of the node it was reached from), the start node is reached from None
+def traverse(graph, start, depthFirst=False, stats=None):
+
+    offsets, targets = graph.offsets, graph.targets
+    seen = bytearray(len(graph))        #1 for every node that has been reached
+    seen[start] = 1
+    frontier = deque([start])
+    take = frontier.pop if depthFirst else frontier.popleft
+    yield start, None
+
+    while frontier:                     #While frontier is not empty
+        if stats is not None:
+            stats.frontier(len(frontier))
+        current = take()
+        if stats is not None:
+            stats.heap_pops += 1
+            stats.expanded += 1
+            stats.generated += offsets[current + 1] - offsets[current]
+        for i in range(offsets[current], offsets[current + 1]):   #For each child
+            neighbor = targets[i]
+            if not seen[neighbor]:      #If not already reached
+                seen[neighbor] = 1
+                frontier.append(neighbor)
+                if stats is not None:
+                    stats.heap_pushes += 1
+                yield neighbor, current
+
+
+#Path to end through the parent pointers of a traversal, stopping the traversal as soon as end is reached
+#@param nodes, the (node, parent) pairs of traverse
+#@param end, the goal node id
+#@return list of node ids on the path, or None if end is never reached
+def traversalPath(nodes, end):
+
+    previous = {}                       #Parent of every node reached so far
+    for node, parent in nodes:
+        previous[node] = parent
+        if node == end:                 #Goal test when the node is generated
+            path = [end]
+            while previous[path[-1]] is not None:
+                path.append(previous[path[-1]])
+            path.reverse()
+            return path
+    return None
+
+
+
+#Function used to print out paths for any search algorithm, only requires the graph and the names of the nodes on the path
+def printPath(graph, path):
+    print("path: \n")
+
+    currentDist = 0                                             #Distance of current edge
+    totalDist = 0                                               #Total distance traveled
+    for i in range(0,len(path)-1):                              #For node in path
+        currentDist = graph.weight(graph.ids[path[i]], graph.ids[path[i+1]])   #Look up the edge between the two nodes
+        totalDist += currentDist                                #Add to distances
+        print(path[i], " to ",path[i+1],": ", currentDist, " mi\n") #Print out current location in path
+    print("distance: ", totalDist, " mi\n")                     #Print end of path
+    
+
+
+#Total weight of a path of node ids
+def pathDistance(graph, path):
+    return sum(graph.weight(path[i], path[i+1]) for i in range(len(path)-1))
+
+
+#Search between two nodes without printing anything, used by the query server
+#@param graph, the graph
+#@param typeG, the type of search algorithm to use
+#@param start, the starting node
+#@param end, the goal node
+#@param heuristic, heuristic values towards end by node id for astar and biastar
+#@param toStart, heuristic values towards start by node id for biastar
+#@param hierarchy, the ContractionHierarchy of the graph for ch
+#@param stats, SearchStats that receives the counters and the time of the search, or None
+#@return (list of node names on the path, distance), or (None, None) if there is no path
+def findPath(graph, typeG, start, end, heuristic=None, toStart=None, hierarchy=None, stats=None):
+
+    if start not in graph or end not in graph:
+        return None, None
+    start, end = graph.ids[start], graph.ids[end]
+    if stats is not None:
+        started = time.perf_counter()
+
+    if(typeG == "bfs"):
+        path = bfsSearch(graph, start, end, stats)
+        distance = None if path is None else pathDistance(graph, path)
+
+    elif(typeG == "dfs"):
+        path = dfsSearch(graph, start, end, stats)
+        distance = None if path is None else pathDistance(graph, path)
+
+    elif(typeG == "ucs"):
+        path, distance = bestFirstSearch(graph, start, end, None, stats)
+
+    elif(typeG == "astar"):
+        path, distance = bestFirstSearch(graph, start, end, heuristic, stats)
+
+    elif(typeG == "biucs"):
+        path, distance = bidirectionalSearch(graph, start, end, None, None, stats)
+
+    elif(typeG == "biastar"):
+        path, distance = bidirectionalSearch(graph, start, end, heuristic, toStart, stats)
+
+    elif(typeG == "ch"):
+        path, distance = hierarchy.query(start, end)
+
+    else:
+        raise ValueError("unknown search algorithm " + typeG)
+
+    if stats is not None:
+        stats.record("search", time.perf_counter() - started)
+        stats.depth = 0 if path is None else len(path) - 1
+    if path is None:
+        return None, None
+    return graph.path_names(path), distance
+
+
+#Search algorithm for a Depth First Search, is not optimal
+#@param graph, the graph
+#@param start, the starting node
+#@param end, the goal node
+def dfs(graph, start, end):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in graph or end not in graph:
+        printNoPath()
+        return
+
+    path = dfsSearch(graph, graph.ids[start], graph.ids[end])
+    if path is None:
+        printNoPath()
+        return
+    path = graph.path_names(path)
+    printPath(graph, path)  #Print the path
+    return path
+
+
+#Depth first search on node ids, the goal is tested as soon as it is reached
+#@param stats, SearchStats that receives the counters of the search, or None
+#@return list of node ids on the path, or None if there is no path
+def dfsSearch(graph, start, end, stats=None):
+    return traversalPath(traverse(graph, start, True, stats), end)
+
+
+#Best first search shared by ucs and astar, on a binary heap of (priority, node) entries
+#A node is pushed again whenever a cheaper path to it is found instead of updating its entry in the heap, the older
+#entries are skipped when popped (lazy deletion). Each node keeps only its cost and a pointer to its parent on the path
+#@param graph, the graph
+#@param start, the starting node id
+#@param end, the goal node id
+#@param heuristic, list of heuristic values by node id, or None for a uniform cost search
+#@param stats, SearchStats that receives the counters of the search, or None
+#@return (list of node ids on the path, distance), or (None, None) if there is no path
+def bestFirstSearch(graph, start, end, heuristic=None, stats=None):
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    costAcc = {start: 0}                #Cheapest known cost to reach every node
+    previous = {start: None}            #Parent of every node on its cheapest known path
+
+    frontier = [(heuristic[start] if heuristic else 0, 0, start)]    #(priority, cost, node)
+
+    while frontier:                                         #While frontier not empty
+        if stats is not None:
+            stats.frontier(len(frontier))
+            stats.heap_pops += 1
+        priority, costToNode, current_node = heapq.heappop(frontier)
+        if costToNode > costAcc[current_node]:              #A cheaper path to this node was found after this entry was pushed
+            if stats is not None:
+                stats.stale += 1
+            continue
+
+        if current_node == end:                             #End only when the goal is popped, its cost is then the cheapest
+            path = [end]
+            while previous[path[-1]] is not None:
+                path.append(previous[path[-1]])
+            path.reverse()
+            return path, costToNode
+
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += offsets[current_node + 1] - offsets[current_node]
+        for i in range(offsets[current_node], offsets[current_node + 1]):   #For every adjacent edge
+            child = targets[i]
+            newCost = costToNode + weights[i]
+            if child not in costAcc or newCost < costAcc[child]:
+                costAcc[child] = newCost
+                previous[child] = current_node
+                heapq.heappush(frontier, (newCost + heuristic[child] if heuristic else newCost, newCost, child))
+                if stats is not None:
+                    stats.heap_pushes += 1
+    return None, None
+
+
+
+#Single source uniform cost search, settling nodes until every target is settled (or the whole component without targets)
+#@param graph, the graph
+#@param start, the source node id
+#@param targets, collection of node ids, or None to settle every reachable node
+#@param stats, SearchStats that receives the counters of the search, or None
+#@return (cost of every settled node, parent of every settled node) as maps of node ids, the parent of start is None
+def shortestPathTree(graph, start, targets=None, stats=None):
+
+    offsets, edgeTargets, weights = graph.offsets, graph.targets, graph.weights
+
+    remaining = None if targets is None else set(targets)
+    costAcc = {start: 0}
+    previous = {start: None}
+    settled = {}
+    parents = {}
+
+    frontier = [(0, start)]
+    while frontier:
+        if stats is not None:
+            stats.frontier(len(frontier))
+            stats.heap_pops += 1
+        costToNode, current_node = heapq.heappop(frontier)
+        if current_node in settled:                         #Stale entry
+            if stats is not None:
+                stats.stale += 1
+            continue
+        settled[current_node] = costToNode
+        parents[current_node] = previous[current_node]
+        if remaining is not None:
+            remaining.discard(current_node)
+            if not remaining:                               #Every target has its cheapest cost
+                break
+
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += offsets[current_node + 1] - offsets[current_node]
+        for i in range(offsets[current_node], offsets[current_node + 1]):
+            child = edgeTargets[i]
+            newCost = costToNode + weights[i]
+            if child not in costAcc or newCost < costAcc[child]:
+                costAcc[child] = newCost
+                previous[child] = current_node
+                heapq.heappush(frontier, (newCost, child))
+                if stats is not None:
+                    stats.heap_pushes += 1
+    return settled, parents
+
+
+
+#Bidirectional best first search shared by biucs and biastar, a forward search from start and a reverse search from end
+#that expand in turn whichever side has the smaller key. Both use the consistent average potential
+#p(v) = (toEnd[v] - toStart[v]) / 2, forward keys are cost + p(v) and reverse keys cost - p(v), kept doubled so they
+#stay integers. Every edge relaxed into a node the other side has reached gives a candidate path, and the search stops
+#once the two smallest keys add up to at least the best candidate, which is then a shortest path.
+#The potential of a node is computed when the node is first reached and kept, so a query only costs as much as the
+#nodes it reaches, also with landmark bounds where every value is a pass over the landmarks.
+#The reverse search follows the same adjacency as the forward one, the graphs from makeGraph are undirected
+#@param graph, the graph
+#@param start, the starting node id
+#@param end, the goal node id
+#@param toEnd, list of heuristic values towards end by node id, or None
+#@param toStart, list of heuristic values towards start by node id, or None
+#@param stats, SearchStats that receives the counters of the search, or None
+#@return (list of node ids on the path, distance), or (None, None) if there is no path
+def bidirectionalSearch(graph, start, end, toEnd=None, toStart=None, stats=None):
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    hasPotential = toEnd is not None or toStart is not None
+    potentials = {}                     #Twice the potential of every node generated so far, computed once per node
+
+    def potential(v):
+        p = potentials.get(v)
+        if p is None:
+            p = potentials[v] = (toEnd[v] if toEnd is not None else 0) - (toStart[v] if toStart is not None else 0)
+        return p
+
+    costAcc = ({start: 0}, {end: 0})                    #Cheapest known cost from start and to end
+    previous = ({start: None}, {end: None})             #Parent of every node towards start and towards end
+    frontiers = ([(potential(start) if hasPotential else 0, 0, start)],
+                 [(-potential(end) if hasPotential else 0, 0, end)])     #(doubled key, cost, node)
+
+    bestDistance = None                 #Length of the shortest path found so far
+    meeting = None                      #The node where it joins the two searches
+
+    while frontiers[0] and frontiers[1]:
+        if bestDistance is not None and frontiers[0][0][0] + frontiers[1][0][0] >= 2*bestDistance:
+            break                                           #No path through an unexpanded node can be shorter
+
+        side = 0 if frontiers[0][0][0] <= frontiers[1][0][0] else 1
+        sign = 1 if side == 0 else -1
+        costs, other = costAcc[side], costAcc[1 - side]
+        if stats is not None:
+            stats.frontier(len(frontiers[0]) + len(frontiers[1]))
+            stats.heap_pops += 1
+        _, costToNode, current_node = heapq.heappop(frontiers[side])
+        if costToNode > costs[current_node]:                #Stale entry, see bestFirstSearch
+            if stats is not None:
+                stats.stale += 1
+            continue
+
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += offsets[current_node + 1] - offsets[current_node]
+        for i in range(offsets[current_node], offsets[current_node + 1]):
+            child = targets[i]
+            newCost = costToNode + weights[i]
+            if child not in costs or newCost < costs[child]:
+                costs[child] = newCost
+                previous[side][child] = current_node
+                heapq.heappush(frontiers[side], (2*newCost + sign*potential(child) if hasPotential else 2*newCost, newCost, child))
+                if stats is not None:
+                    stats.heap_pushes += 1
+                if child in other and (bestDistance is None or newCost + other[child] < bestDistance):
+                    bestDistance = newCost + other[child]
+                    meeting = child
+
+    if meeting is None:
+        return None, None
+    path = [meeting]
+    while previous[0][path[-1]] is not None:        #Back to start
+        path.append(previous[0][path[-1]])
+    path.reverse()
+    while previous[1][path[-1]] is not None:        #On to end
+        path.append(previous[1][path[-1]])
+    return path, bestDistance
+
+
+
+#Search algorithm for a Uniform Cost Search, is optimal
+#@param graph, the graph
+#@param start, the starting node
+#@param end, the goal node
+def ucs(graph, start, end):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in graph or end not in graph:
+        printNoPath()
+        return
+
+    path, distance = bestFirstSearch(graph, graph.ids[start], graph.ids[end])
+    if path is None:
+        printNoPath()
+        return
+    path = graph.path_names(path)
+    printPath(graph, path)
+    return path
+
+
+
+#Search algorithm for a bidirectional Uniform Cost Search (bidirectional Dijkstra), is optimal
+#@param graph, the graph
+#@param start, the starting node
+#@param end, the goal node
+def biucs(graph, start, end):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in graph or end not in graph:
+        printNoPath()
+        return
+
+    path, distance = bidirectionalSearch(graph, graph.ids[start], graph.ids[end])
+    if path is None:
+        printNoPath()
+        return
+    path = graph.path_names(path)
+    printPath(graph, path)
+    return path
+
+
+
+#Helper function to read heuristic file and create a map containing the heuristic value for each node    
+def hGraph(heuristicFile):
+    heuristics = {}                                     #Use map to simplify runtime
+    with open(heuristicFile) as file:
+        for line in file:
+            if ("END" not in line):
+                lineS = line.split()
+                try:
+                    heuristics[lineS[0]] = lineS[1]     #Map at index = city equals hueristic value
+                except:
+                    pass
+    return heuristics
+
+
+
+#Heuristic value of every node id towards end, from a heuristic file, a landmark file or already as values by node id
+#Nodes missing from a heuristic file get 0 which is always admissable
+def heuristicValues(graph, heuristic, end):
+    if isinstance(heuristic, str):
+        if isLandmarkFile(heuristic):
+            return Landmarks.load(heuristic, graph).heuristic(graph.ids[end])    #Lower bounds for any goal
+        heuristicGraph = hGraph(heuristic)  #Get heuristic values as a map
+        return [int(heuristicGraph.get(name, 0)) for name in graph.names]
+    return heuristic
+
+
+
+#Search algorithm for an AStar search, is optimal with an admissable heuristic
+#@param graph, the graph
+#@param start, the starting node
+#@param end, the goal node
+#@param heuristic, the file containing the heuristic values, a landmark file, or the heuristic values by node id
+def astar(graph, start, end, heuristic):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in graph or end not in graph:
+        printNoPath()
+        return
+
+    values = heuristicValues(graph, heuristic, end)
+
+    path, distance = bestFirstSearch(graph, graph.ids[start], graph.ids[end], values)
+    if path is None:
+        printNoPath()
+        return
+    path = graph.path_names(path)
+    printPath(graph, path)
+    return path
+
+
+
+#Anytime search with ARA*, prints every improved path distance with its suboptimality bound, then the shortest path
+#@param graph, the graph
+#@param start, the starting node
+#@param end, the goal node
+#@param heuristic, the file containing the heuristic values, a landmark file, or the heuristic values by node id
+#@param deadline, seconds after which the best path so far is printed, or None to search until it is optimal
+def arastar(graph, start, end, heuristic, deadline=None):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in graph or end not in graph:
+        printNoPath()
+        return
+
+    values = heuristicValues(graph, heuristic, end)
+
+    path = None
+    for path, distance, bound in anytimeSearch(graph, graph.ids[start], graph.ids[end], values, deadline=deadline):
+        print("distance: ", distance, " mi, at most ", round(bound, 4), " times the shortest\n")
+    if path is None:
+        printNoPath()
+        return
+    path = graph.path_names(path)
+    printPath(graph, path)
+    return path
+
+
+
+#Search algorithm for a bidirectional AStar search, is optimal with a consistent heuristic
+#@param graph, the graph
+#@param start, the starting node
+#@param end, the goal node
+#@param heuristic, the file containing the heuristic values towards end, a landmark file, or the heuristic values by node id
+#@param toStart, heuristic values towards start by node id, or None to use 0
+def biastar(graph, start, end, heuristic, toStart=None):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in graph or end not in graph:
+        printNoPath()
+        return
+
+    values = heuristicValues(graph, heuristic, end)
+    if toStart is None and isinstance(heuristic, str) and isLandmarkFile(heuristic):
+        toStart = heuristicValues(graph, heuristic, start)     #Landmarks bound the distance towards start too
+
+    path, distance = bidirectionalSearch(graph, graph.ids[start], graph.ids[end], values, toStart)
+    if path is None:
+        printNoPath()
+        return
+    path = graph.path_names(path)
+    printPath(graph, path)
+    return path
+
+
+
+#Shortest path query on a contraction hierarchy, is optimal
+#@param graph, the graph
+#@param start, the starting node
+#@param end, the goal node
+#@param hierarchy, the hierarchy file written by contraction.py for this graph
+def ch(graph, start, end, hierarchy):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in graph or end not in graph:
+        printNoPath()
+        return
+
+    if isinstance(hierarchy, str):
+        hierarchy = ContractionHierarchy.load(hierarchy, graph)
+
+    path, distance = hierarchy.query(graph.ids[start], graph.ids[end])
+    if path is None:
+        printNoPath()
+        return
+    path = graph.path_names(path)
+    printPath(graph, path)
+    return path
+
+
+
+#Search on a grid map, with successors generated from the cells instead of a graph
+#@param grid, the GridMap
+#@param typeG, ucs, astar with the octile heuristic, or jps for Jump Point Search
+#@param start, the starting cell as "x,y"
+#@param end, the goal cell as "x,y"
+def gridPath(grid, typeG, start, end):
+
+    if(start == end):
+        print("Start is end, invalid path")
+        return
+
+    if start not in grid or end not in grid:
+        printNoPath()
+        return
+
+    if(typeG == "jps"):
+        path, distance = jumpPointSearch(grid, grid.ids[start], grid.ids[end])
+    elif(typeG == "astar"):
+        path, distance = gridSearch(grid, grid.ids[start], grid.ids[end], octile)
+    elif(typeG == "ucs"):
+        path, distance = gridSearch(grid, grid.ids[start], grid.ids[end], None)
+    else:
+        print("Grid maps are searched with ucs, astar or jps")
+        return
+
+    if path is None:
+        printNoPath()
+        return
+    path = grid.path_names(path)
+    printPath(grid, path)
+    return path
+
+
+
+def printNoPath():
+    print("path: ")
+    print("none\n")
+    print("distance: infinity\n")
+    
+
+if __name__ == "__main__":
+    #Call main without heuristics
+    if len(sys.argv) == 5:
+        main(sys.argv[1],sys.argv[2],sys.argv[3],sys.argv[4], sys.argv[4])
+
+    #Call main with heuristics
+    if len(sys.argv) == 6:
+        main(sys.argv[1],sys.argv[2],sys.argv[3],sys.argv[4], sys.argv[5])
\ No newline at end of file
@@ -0,0 +1,116 @@
+#Weighted graph used by the search algorithms in find_path3.py
+#Nodes are numbered 0..n-1 in the order they first appear, and the edges are kept in compressed sparse row form:
+#the neighbours of node u are targets[offsets[u]:offsets[u+1]], with the matching weights in the same slice of weights.
+#Every neighbour and weight is stored once, already parsed, so a search never has to look through the edge list.
+
+from array import array
+
+
+class Graph:
+    """
+    Graph with integer node ids and adjacency arrays.
+
+    Parameters
+    ----------
+    names: list of str
+        the name of every node, indexed by node id
+    offsets: sequence of int
+        n+1 offsets into targets and weights
+    targets: sequence of int
+        the neighbour ids of every node, one slice per node
+    weights: sequence of int
+        the weight of every edge in targets
+    ids: mapping or None
+        the node id of every name, built from names when not given
+    """
+
+    def __init__(self, names, offsets, targets, weights, ids=None):
+        self.names = names
+        self.ids = {name: i for i, name in enumerate(names)} if ids is None else ids
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.heuristics = {}    #Heuristic values by node id for some goal names, stored with binary graphs
+        self.version = 0        #Incremented by changed(), so cached results of older versions are not used
+        self._costs = None
+
+    @classmethod
+    def from_edges(cls, edges):
+        """
+        Build an undirected graph from (a, b, weight) triples of node names,
+        every edge can be travelled both ways. The neighbours of every node keep
+        the order of the edges.
+        """
+        ids = {}
+        names = []
+        adjacency = []
+        for a, b, weight in edges:
+            for name in (a, b):
+                if name not in ids:
+                    ids[name] = len(names)
+                    names.append(name)
+                    adjacency.append([])
+            adjacency[ids[a]].append((ids[b], weight))
+            adjacency[ids[b]].append((ids[a], weight))
+
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("q")
+        for neighbours in adjacency:
+            for v, weight in neighbours:
+                targets.append(v)
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(names, offsets, targets, weights)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def neighbors(self, u):
+        #(neighbour id, weight) of every edge leaving u
+        targets = self.targets
+        weights = self.weights
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            yield targets[i], weights[i]
+
+    def weight(self, u, v):
+        """
+        Weight of the edge from u to v in O(1), the lightest one if there are
+        several. The lookup map is built on the first call.
+        """
+        if self._costs is None:
+            costs = {}
+            n = len(self.names)
+            for u2 in range(n):
+                for v2, weight in self.neighbors(u2):
+                    key = u2*n + v2
+                    if key not in costs or weight < costs[key]:
+                        costs[key] = weight
+            self._costs = costs
+        return self._costs[u*len(self.names) + v]
+
+    def set_weight(self, u, v, weight):
+        """
+        Change the weight of every edge from u to v, the edge from v to u of an
+        undirected graph is a separate entry. Starts a new version of the graph.
+        """
+        found = False
+        for i in range(self.offsets[u], self.offsets[u + 1]):
+            if self.targets[i] == v:
+                self.weights[i] = weight
+                found = True
+        if not found:
+            raise KeyError((u, v))
+        self.changed()
+
+    def changed(self):
+        #Call after changing the weights or edges of the graph, drops the lookup map and starts a new version
+        self._costs = None
+        self.version += 1
+
+    def path_names(self, path):
+        #Node names of a path of node ids
+        return [self.names[u] for u in path]
@@ -0,0 +1,339 @@
+#Grid maps for find_path3.py, searched without building a graph
+#A map is an ASCII file in the format of the Moving AI benchmarks ("type octile", "height H", "width W", "map", then
+#H rows of W characters), or just the rows; '.', 'G' and 'S' cells are passable and every other character is blocked.
+#The cells are kept in one bytearray and the successors of a cell are generated when it is expanded: the 8 neighbours,
+#where a diagonal step costs sqrt(2) and may not cut the corner of a blocked cell, or only the 4 straight ones.
+#Cells are named "x,y", with x the column and y the row from the top.
+#Jump Point Search only expands the jump points of the grid: straight and diagonal runs are followed without
+#expanding the cells on them until a goal or a cell with a forced neighbour is found, which prunes all the symmetric
+#paths of equal cost that A* on the grid would expand.
+#python find_path3.py jps warehouse.map 1,1 250,310
+
+import heapq
+import math
+
+STRAIGHT = 1.0
+DIAGONAL = math.sqrt(2)
+PASSABLE = b".GS"
+
+_HEADER_FIELDS = (b"type", b"height", b"width")
+
+
+def isGridMap(file):
+    #True if file is an ASCII grid map, either with a Moving AI header or only of map characters
+    with open(file, "rb") as f:
+        first = f.readline().strip()
+    if first.split(b" ")[0] in _HEADER_FIELDS:
+        return True
+    return bool(first) and not first.strip(b".@#GSTOW")
+
+
+def octile(dx, dy):
+    #Distance with 8 directions, straight steps cost 1 and diagonal ones sqrt(2)
+    dx, dy = abs(dx), abs(dy)
+    return DIAGONAL*min(dx, dy) + STRAIGHT*abs(dx - dy)
+
+
+def manhattan(dx, dy):
+    #Distance with the 4 straight directions
+    return STRAIGHT*(abs(dx) + abs(dy))
+
+
+class _CellNames:
+    #"x,y" name of every cell id
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def __len__(self):
+        return len(self.grid)
+
+    def __getitem__(self, cell):
+        return "%d,%d" % (cell % self.grid.width, cell // self.grid.width)
+
+    def __iter__(self):
+        return (self[cell] for cell in range(len(self)))
+
+
+class _CellIds:
+    #Cell id of every "x,y" name of a passable cell
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def get(self, name, default=None):
+        try:
+            x, y = (int(part) for part in name.split(","))
+        except (AttributeError, ValueError):
+            return default
+        if self.grid.walkable(x, y):
+            return y*self.grid.width + x
+        return default
+
+    def __getitem__(self, name):
+        cell = self.get(name)
+        if cell is None:
+            raise KeyError(name)
+        return cell
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+
+class GridMap:
+    """
+    A grid of passable and blocked cells. It can be printed with printPath of
+    find_path3.py like a Graph: names, ids, weight() and path_names().
+
+    Parameters
+    ----------
+    width, height: int
+    cells: bytearray
+        1 for every passable cell, row after row from the top
+    """
+
+    def __init__(self, width, height, cells):
+        self.width = width
+        self.height = height
+        self.cells = cells
+        self.names = _CellNames(self)
+        self.ids = _CellIds(self)
+
+    @classmethod
+    def load(cls, file):
+        with open(file, "rb") as f:
+            lines = [line.rstrip(b"\r\n") for line in f]
+        rows = lines
+        if lines and lines[0].split(b" ")[0] in _HEADER_FIELDS:
+            rows = lines[lines.index(b"map") + 1:]
+        rows = [row for row in rows if row]
+        width = max((len(row) for row in rows), default=0)
+        cells = bytearray(width*len(rows))
+        for y, row in enumerate(rows):
+            for x, c in enumerate(row):
+                if c in PASSABLE:
+                    cells[y*width + x] = 1
+        return cls(width, len(rows), cells)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def walkable(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height and self.cells[y*self.width + x] == 1
+
+    def successors(self, cell, diagonal=True):
+        #(neighbour cell, step cost) of every move out of cell
+        width = self.width
+        x, y = cell % width, cell // width
+        walkable = self.walkable
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if walkable(x + dx, y + dy):
+                yield cell + dy*width + dx, STRAIGHT
+        if diagonal:
+            for dx, dy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+                if walkable(x + dx, y + dy) and walkable(x + dx, y) and walkable(x, y + dy):
+                    yield cell + dy*width + dx, DIAGONAL
+
+    def weight(self, u, v):
+        #Cost of the step between two neighbouring cells
+        du, dv = divmod(u, self.width), divmod(v, self.width)
+        return DIAGONAL if du[0] != dv[0] and du[1] != dv[1] else STRAIGHT
+
+    def path_names(self, path):
+        return [self.names[cell] for cell in path]
+
+
+def _path(previous, end):
+    path = [end]
+    while previous[path[-1]] is not None:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return path
+
+
+def gridSearch(grid, start, end, heuristic=octile, diagonal=True, stats=None):
+    """
+    A* (or with heuristic None, uniform cost search) between two cells, on
+    successors generated from the grid.
+
+    Parameters
+    ----------
+    grid: GridMap
+    start, end: int
+        cell ids
+    heuristic: octile, manhattan or None
+        computed for every generated cell from its offset to end; use
+        manhattan only with diagonal False, where it is admissable
+    diagonal: boolean
+        allow the 4 diagonal moves
+    stats: SearchStats or None
+
+    Returns
+    -------
+    (path, distance): list of cell ids and float, or (None, None) if there is no path
+    """
+    width = grid.width
+    endX, endY = end % width, end // width
+    costAcc = {start: 0.0}
+    previous = {start: None}
+    frontier = [(0.0, 0.0, start)]
+    while frontier:
+        if stats is not None:
+            stats.frontier(len(frontier))
+            stats.heap_pops += 1
+        _, costToCell, cell = heapq.heappop(frontier)
+        if costToCell > costAcc[cell]:      #Stale entry
+            if stats is not None:
+                stats.stale += 1
+            continue
+        if cell == end:
+            return _path(previous, end), costToCell
+        if stats is not None:
+            stats.expanded += 1
+        for child, step in grid.successors(cell, diagonal):
+            if stats is not None:
+                stats.generated += 1
+            newCost = costToCell + step
+            if child not in costAcc or newCost < costAcc[child]:
+                costAcc[child] = newCost
+                previous[child] = cell
+                estimate = heuristic(child % width - endX, child // width - endY) if heuristic else 0.0
+                heapq.heappush(frontier, (newCost + estimate, newCost, child))
+                if stats is not None:
+                    stats.heap_pushes += 1
+    return None, None
+
+
+def _prunedNeighbours(grid, x, y, dx, dy):
+    #Directions worth following from (x, y) when it was reached moving (dx, dy), all directions at the start
+    walkable = grid.walkable
+    if dx == 0 and dy == 0:
+        for sx, sy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if walkable(x + sx, y + sy):
+                yield sx, sy
+        for sx, sy in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+            if walkable(x + sx, y + sy) and walkable(x + sx, y) and walkable(x, y + sy):
+                yield sx, sy
+    elif dx != 0 and dy != 0:
+        straightX, straightY = walkable(x + dx, y), walkable(x, y + dy)
+        if straightY:
+            yield 0, dy
+        if straightX:
+            yield dx, 0
+        if straightX and straightY and walkable(x + dx, y + dy):
+            yield dx, dy
+    elif dx != 0:
+        ahead, up, down = walkable(x + dx, y), walkable(x, y - 1), walkable(x, y + 1)
+        if ahead:
+            yield dx, 0
+            if up and walkable(x + dx, y - 1):
+                yield dx, -1
+            if down and walkable(x + dx, y + 1):
+                yield dx, 1
+        if up:
+            yield 0, -1
+        if down:
+            yield 0, 1
+    else:
+        ahead, left, right = walkable(x, y + dy), walkable(x - 1, y), walkable(x + 1, y)
+        if ahead:
+            yield 0, dy
+            if left and walkable(x - 1, y + dy):
+                yield -1, dy
+            if right and walkable(x + 1, y + dy):
+                yield 1, dy
+        if left:
+            yield -1, 0
+        if right:
+            yield 1, 0
+
+
+def _jump(grid, x, y, dx, dy, endX, endY):
+    #First jump point from (x, y) moving (dx, dy): the goal, a cell with a forced neighbour, or for a diagonal run
+    #a cell from which a straight run finds one. None if the run ends at a wall
+    walkable = grid.walkable
+    while True:
+        if not walkable(x, y):
+            return None
+        if x == endX and y == endY:
+            return x, y
+        if dx != 0 and dy != 0:
+            if _jump(grid, x + dx, y, dx, 0, endX, endY) or _jump(grid, x, y + dy, 0, dy, endX, endY):
+                return x, y
+        elif dx != 0:
+            if (walkable(x, y - 1) and not walkable(x - dx, y - 1)) or (walkable(x, y + 1) and not walkable(x - dx, y + 1)):
+                return x, y
+        elif (walkable(x - 1, y) and not walkable(x - 1, y - dy)) or (walkable(x + 1, y) and not walkable(x + 1, y - dy)):
+            return x, y
+        #A diagonal step may not cut the corner of a blocked cell
+        if walkable(x + dx, y) and walkable(x, y + dy):
+            x, y = x + dx, y + dy
+        else:
+            return None
+
+
+def jumpPointSearch(grid, start, end, stats=None):
+    """
+    Jump Point Search between two cells, 8 directions without corner cutting.
+    Returns the same shortest distance as gridSearch with the octile heuristic.
+
+    Returns
+    -------
+    (path, distance): list of every cell id on the path and float, or (None, None) if there is no path
+    """
+    width = grid.width
+    endX, endY = end % width, end // width
+    costAcc = {start: 0.0}
+    previous = {start: None}
+    frontier = [(0.0, 0.0, start)]
+    while frontier:
+        if stats is not None:
+            stats.frontier(len(frontier))
+            stats.heap_pops += 1
+        _, costToCell, cell = heapq.heappop(frontier)
+        if costToCell > costAcc[cell]:
+            if stats is not None:
+                stats.stale += 1
+            continue
+        if cell == end:
+            return _unpackJumps(grid, _path(previous, end)), costToCell
+        if stats is not None:
+            stats.expanded += 1
+
+        x, y = cell % width, cell // width
+        parent = previous[cell]
+        dx = dy = 0
+        if parent is not None:      #The direction this cell was reached in
+            px, py = parent % width, parent // width
+            dx, dy = (x > px) - (x < px), (y > py) - (y < py)
+        for sx, sy in _prunedNeighbours(grid, x, y, dx, dy):
+            point = _jump(grid, x + sx, y + sy, sx, sy, endX, endY)
+            if point is None:
+                continue
+            if stats is not None:
+                stats.generated += 1
+            child = point[1]*width + point[0]
+            newCost = costToCell + octile(point[0] - x, point[1] - y)
+            if child not in costAcc or newCost < costAcc[child]:
+                costAcc[child] = newCost
+                previous[child] = cell
+                heapq.heappush(frontier, (newCost + octile(point[0] - endX, point[1] - endY), newCost, child))
+                if stats is not None:
+                    stats.heap_pushes += 1
+    return None, None
+
+
+def _unpackJumps(grid, jumps):
+    #Every cell between consecutive jump points, which lie on one straight or diagonal line
+    width = grid.width
+    path = [jumps[0]]
+    for a, b in zip(jumps, jumps[1:]):
+        ax, ay, bx, by = a % width, a // width, b % width, b // width
+        dx, dy = (bx > ax) - (bx < ax), (by > ay) - (by < ay)
+        while (ax, ay) != (bx, by):
+            ax, ay = ax + dx, ay + dy
+            path.append(ay*width + ax)
+    return path
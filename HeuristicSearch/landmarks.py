@@ -0,0 +1,180 @@
+#ALT heuristics (A*, landmarks and the triangle inequality) for any goal, so that A* needs no heuristic file per goal.
+#A few landmark nodes are picked once and the distance from each of them to every node is stored. For a landmark L and
+#an undirected graph, |d(L, goal) - d(L, v)| <= d(v, goal), so the largest of these over the landmarks is an admissable
+#and consistent heuristic towards any goal, computed at query time in O(K) per node.
+#Landmarks are picked farthest first: each new landmark is the node farthest from the ones already picked.
+#python landmarks.py input_file1.txt landmarks.bin --count 8
+#python find_path3.py astar input_file1.txt Boise Salem landmarks.bin
+
+import argparse
+import heapq
+import mmap
+import struct
+import sys
+from array import array
+
+MAGIC = b"ALTLMARK"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIxxxxQQ")     #magic, version, number of landmarks K, number of nodes V
+
+UNREACHABLE = -1
+
+
+def distancesFrom(graph, source):
+    """
+    Shortest distance from source to every node, UNREACHABLE for nodes in
+    another component.
+
+    Returns
+    -------
+    distances: array of int
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = array("q", [UNREACHABLE])*len(graph)
+    distances[source] = 0
+    frontier = [(0, source)]
+    while frontier:
+        cost, u = heapq.heappop(frontier)
+        if cost > distances[u]:
+            continue
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            newCost = cost + weights[i]
+            if distances[v] == UNREACHABLE or newCost < distances[v]:
+                distances[v] = newCost
+                heapq.heappush(frontier, (newCost, v))
+    return distances
+
+
+def isLandmarkFile(file):
+    #True if file starts with the magic of a landmark file
+    with open(file, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class _Bound:
+    #Heuristic values towards one goal by node id, computed from the landmark distances when first indexed and kept,
+    #so a search pays the pass over the landmarks once for every node it reaches and nothing for the others
+
+    def __init__(self, landmarks, goal):
+        self.rows = landmarks.rows
+        self.goalDistances = [row[goal] for row in self.rows]
+        self.size = landmarks.nodes
+        self.values = {}
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, v):
+        best = self.values.get(v)
+        if best is not None:
+            return best
+        best = 0
+        for row, toGoal in zip(self.rows, self.goalDistances):
+            toNode = row[v]
+            if toNode != UNREACHABLE and toGoal != UNREACHABLE:
+                bound = toGoal - toNode if toGoal > toNode else toNode - toGoal
+                if bound > best:
+                    best = bound
+        self.values[v] = best
+        return best
+
+
+class Landmarks:
+    """
+    Distances from K landmarks to every node of a graph.
+
+    Parameters
+    ----------
+    landmarks: list of int
+        the landmark node ids
+    distances: sequence of int
+        K x V distances, row i holding the distance from landmarks[i] to every node
+    """
+
+    def __init__(self, landmarks, distances):
+        self.landmarks = list(landmarks)
+        self.nodes = len(distances)//len(self.landmarks) if self.landmarks else 0
+        self.distances = distances
+        self.rows = [distances[i*self.nodes:(i + 1)*self.nodes] for i in range(len(self.landmarks))]
+        self.map = None
+
+    @classmethod
+    def build(cls, graph, count=8, first=0):
+        """
+        Pick count landmarks farthest first, starting from the node farthest
+        from node first, and compute their distances.
+        """
+        count = min(count, len(graph))
+        landmarks = []
+        distances = array("q")
+        nearest = distancesFrom(graph, first)       #Distance from every node to the closest landmark so far
+        for _ in range(count):
+            #Unreachable nodes are the farthest of all, so every component gets a landmark
+            landmark = max(range(len(graph)), key=lambda v: (nearest[v] == UNREACHABLE, nearest[v]))
+            if landmark in landmarks:
+                break
+            row = distancesFrom(graph, landmark)
+            landmarks.append(landmark)
+            distances.extend(row)
+            if len(landmarks) == 1:
+                nearest = array("q", row)
+            else:
+                for v in range(len(graph)):
+                    if row[v] != UNREACHABLE and (nearest[v] == UNREACHABLE or row[v] < nearest[v]):
+                        nearest[v] = row[v]
+        return cls(landmarks, distances)
+
+    def heuristic(self, goal):
+        """
+        Lower bounds on the distance from every node to goal, as a sequence
+        indexed by node id for bestFirstSearch and bidirectionalSearch.
+        """
+        return _Bound(self, goal)
+
+    def save(self, file):
+        with open(file, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, _VERSION, len(self.landmarks), self.nodes))
+            for values in (array("q", self.landmarks), array("q", self.distances)):
+                if sys.byteorder != "little":
+                    values.byteswap()
+                values.tofile(f)
+
+    @classmethod
+    def load(cls, file, graph=None):
+        """
+        Memory-map a landmark file written by save. With graph, check that the
+        file was built for a graph with as many nodes.
+        """
+        with open(file, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, k, n = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != _VERSION:
+            raise ValueError(file + " is not a landmark file")
+        if sys.byteorder != "little":
+            raise ValueError("landmark files can only be mapped on little-endian machines")
+        if graph is not None and n != len(graph):
+            raise ValueError("%s was built for a graph with %d nodes, not %d" % (file, n, len(graph)))
+        view = memoryview(data)[_HEADER.size:].cast("q")
+        landmarks = cls(view[:k], view[k:k + k*n])
+        landmarks.map = data
+        return landmarks
+
+
+def main(argv=None):
+    from find_path3 import makeGraph
+
+    parser = argparse.ArgumentParser(description="Pick landmarks and store their distances for ALT heuristics.")
+    parser.add_argument("graph", help="text graph or binary graph file")
+    parser.add_argument("out", help="landmark file to write")
+    parser.add_argument("--count", type=int, default=8, help="number of landmarks")
+    args = parser.parse_args(argv)
+
+    graph = makeGraph(args.graph)
+    landmarks = Landmarks.build(graph, args.count)
+    landmarks.save(args.out)
+    print(len(landmarks.landmarks), "landmarks written to", args.out + ":", " ".join(graph.path_names(landmarks.landmarks)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#Many-to-many distance matrices and one-to-all shortest path trees
+#One single source uniform cost search is run per source and read off for every target, instead of one search per pair,
+#and each search stops as soon as all of the targets are settled. The sources are spread over a process pool whose
+#workers share the graph read-only: forked workers inherit it copy-on-write, and workers given a binary graph file
+#memory-map the same pages.
+#python matrix.py input_file1.txt --sources Richmond Boise --targets Frankfort Salem Detroit --workers 2
+#python matrix.py input_file1.txt --tree Richmond
+
+import argparse
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from binary_graph import isBinaryGraph
+from find_path3 import makeGraph, shortestPathTree
+
+_graph = None       #The graph of a worker process
+
+
+def oneToAll(graph, source):
+    """
+    Shortest path tree from one node.
+
+    Parameters
+    ----------
+    graph: Graph
+    source: str
+        the name of the root node
+
+    Returns
+    -------
+    tree: dict
+        node name -> (distance from source, name of the parent node), the
+        parent of source is None; nodes that cannot be reached are left out
+    """
+    if source not in graph:
+        return {}
+    distances, parents = shortestPathTree(graph, graph.ids[source])
+    return {graph.names[u]: (distances[u], None if parents[u] is None else graph.names[parents[u]]) for u in distances}
+
+
+def _row(graph, source, targets):
+    #Distances from source to every target, None where there is no path
+    if source is None:
+        return [None]*len(targets)
+    distances, _ = shortestPathTree(graph, source, [t for t in targets if t is not None])
+    return [None if t is None else distances.get(t) for t in targets]
+
+
+def _init_worker(graphFile):
+    global _graph
+    if graphFile is not None:
+        _graph = makeGraph(graphFile)
+
+
+def _row_in_worker(source, targets):
+    return _row(_graph, source, targets)
+
+
+def manyToMany(graph, sources, targets, workers=0, graphFile=None):
+    """
+    Distances between every source and every target.
+
+    Parameters
+    ----------
+    graph: Graph
+    sources, targets: list of str
+        node names, names that are not in the graph get None distances
+    workers: int
+        number of worker processes, 0 to run every search in this process
+    graphFile: str or None
+        the file graph was loaded from, for the workers to load themselves;
+        without it the workers are forked and inherit graph
+
+    Returns
+    -------
+    matrix: list of lists
+        matrix[i][j] is the distance from sources[i] to targets[j], None where there is no path
+    """
+    sourceIds = [graph.ids.get(name) for name in sources]
+    targetIds = [graph.ids.get(name) for name in targets]
+    if not workers or len(sources) < 2:
+        return [_row(graph, source, targetIds) for source in sourceIds]
+
+    global _graph
+    if graphFile is None:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("workers need a graphFile where processes cannot be forked")
+        context = multiprocessing.get_context("fork")
+        _graph = graph      #Inherited by the forked workers without being copied
+    else:
+        context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(workers, context, _init_worker, (graphFile,)) as pool:
+            chunk = max(1, len(sourceIds)//(4*workers))
+            return list(pool.map(_row_in_worker, sourceIds, [targetIds]*len(sourceIds), chunksize=chunk))
+    finally:
+        if graphFile is None:
+            _graph = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Distance matrices and shortest path trees.")
+    parser.add_argument("graph", help="text graph or binary graph file")
+    parser.add_argument("--sources", nargs="+", default=[])
+    parser.add_argument("--targets", nargs="+", default=[])
+    parser.add_argument("--tree", default=None, help="print the shortest path tree of this node instead")
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    graph = makeGraph(args.graph)
+    if args.tree is not None:
+        for name, (distance, parent) in oneToAll(graph, args.tree).items():
+            print(name, distance, "-" if parent is None else parent, sep="\t")
+        return
+
+    #Forked workers inherit the graph already loaded here, only a memory-mapped binary graph is as cheap to load again
+    #in every worker, and a text graph has to be where processes cannot be forked
+    forkable = "fork" in multiprocessing.get_all_start_methods()
+    graphFile = args.graph if isBinaryGraph(args.graph) or not forkable else None
+    matrix = manyToMany(graph, args.sources, args.targets, args.workers, graphFile)
+    print("", *args.targets, sep="\t")
+    for source, row in zip(args.sources, matrix):
+        print(source, *["inf" if d is None else d for d in row], sep="\t")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
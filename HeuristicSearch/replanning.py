@@ -0,0 +1,173 @@
+#Incremental replanning between a fixed start and goal with Lifelong Planning A* (LPA*)
+#Every node keeps g, its cost when it was last expanded, and rhs, the cheapest cost its neighbours' g values offer.
+#A node with g != rhs is inconsistent and waits on the priority queue. After a batch of edge weight changes only the
+#endpoints of the changed edges are updated, and the search expands just the inconsistent nodes whose keys are below
+#the goal's, which repairs the part of the search tree the changes affected instead of searching again from scratch.
+#The graphs from makeGraph are undirected, so a node's predecessors are its neighbours.
+#LPA* needs every edge to cost more than 0, or two nodes joined by an edge of weight 0 can keep each other's outdated
+#costs alive after an update. An edge of weight w therefore costs w*n + 1 here, with n the number of nodes: paths are
+#ordered by distance and then by their number of edges (always below n), and the distance of a cost is cost // n.
+#
+#   search = IncrementalSearch(graph, graph.ids["Richmond"], graph.ids["Frankfort"])
+#   path, distance = search.path()
+#   path, distance = search.update([(graph.ids["Charleston"], graph.ids["Lexington"], 400)])
+
+import heapq
+import math
+from collections import deque
+
+
+class IncrementalSearch:
+    """
+    LPA* search between two nodes that keeps its state between calls.
+
+    Parameters
+    ----------
+    graph: Graph
+        searched in place, update() changes its weights, so it cannot be a
+        MappedGraph
+    start, end: int
+        node ids
+    heuristic: sequence of int or None
+        consistent lower bounds on the distance from every node id to end,
+        for example Landmarks.heuristic(end), which stay lower bounds as long
+        as weights only go up; None for no heuristic
+    """
+
+    def __init__(self, graph, start, end, heuristic=None):
+        self.graph = graph
+        self.start = start
+        self.end = end
+        self.heuristic = heuristic
+        self.scale = len(graph)     #Costs are weight*scale + 1, see above
+        self.g = {}
+        self.rhs = {start: 0}
+        self.queue = []         #(key, node) entries, the ones whose key is not queued[node] any more are stale
+        self.queued = {}        #Current key of every inconsistent node
+        self._push(start)
+
+    def _key(self, u):
+        cost = min(self.g.get(u, math.inf), self.rhs.get(u, math.inf))
+        return (cost + (self.heuristic[u]*self.scale if self.heuristic else 0), cost)
+
+    def _edges(self, u):
+        #(neighbour id, cost) of every edge of u
+        scale = self.scale
+        for v, weight in self.graph.neighbors(u):
+            yield v, weight*scale + 1
+
+    def _push(self, u):
+        key = self._key(u)
+        self.queued[u] = key
+        heapq.heappush(self.queue, (key, u))
+
+    def _updateNode(self, u):
+        #Recompute rhs of u from its neighbours and queue it if it is inconsistent
+        if u != self.start:
+            best = math.inf
+            g = self.g
+            for v, weight in self._edges(u):
+                cost = g.get(v, math.inf) + weight
+                if cost < best:
+                    best = cost
+            self.rhs[u] = best
+        if self.g.get(u, math.inf) != self.rhs.get(u, math.inf):
+            self._push(u)
+        else:
+            self.queued.pop(u, None)
+
+    def _topKey(self):
+        #Smallest current key on the queue, dropping stale entries
+        while self.queue:
+            key, u = self.queue[0]
+            if self.queued.get(u) == key:
+                return key
+            heapq.heappop(self.queue)
+        return (math.inf, math.inf)
+
+    def _computeShortestPath(self, stats=None):
+        g, rhs, end = self.g, self.rhs, self.end
+        while self._topKey() < self._key(end) or g.get(end, math.inf) != rhs.get(end, math.inf):
+            if not self.queue:
+                break
+            key, u = heapq.heappop(self.queue)
+            del self.queued[u]
+            if stats is not None:
+                stats.heap_pops += 1
+                stats.expanded += 1
+                stats.frontier(len(self.queue) + 1)
+            if g.get(u, math.inf) > rhs.get(u, math.inf):     #Overconsistent, its cost went down
+                g[u] = rhs[u]
+                for v, _ in self.graph.neighbors(u):
+                    self._updateNode(v)
+            else:                                           #Underconsistent, its cost went up
+                g[u] = math.inf
+                self._updateNode(u)
+                for v, _ in self.graph.neighbors(u):
+                    self._updateNode(v)
+
+    def path(self, stats=None):
+        """
+        The shortest path with the current weights, only expanding the nodes
+        that changed since the last call.
+
+        Parameters
+        ----------
+        stats: SearchStats or None
+            receives the counters of the repair
+
+        Returns
+        -------
+        (path, distance): list of node ids and int, or (None, None) if there is no path
+        """
+        self._computeShortestPath(stats)
+        cost = self.g.get(self.end, math.inf)
+        if cost == math.inf:
+            return None, None
+        #Walk back from the goal along the edges whose cost explains the difference in g, g(v) + cost = g(u). Several
+        #neighbours can qualify, so this is a breadth first search with parent pointers instead of a greedy walk
+        g = self.g
+        towardsEnd = {self.end: None}
+        frontier = deque([self.end])
+        while frontier and self.start not in towardsEnd:
+            u = frontier.popleft()
+            for v, weight in self._edges(u):
+                if v not in towardsEnd and g.get(v, math.inf) + weight == g[u]:
+                    towardsEnd[v] = u
+                    frontier.append(v)
+        if self.start not in towardsEnd:
+            return None, None
+        path = [self.start]
+        while towardsEnd[path[-1]] is not None:
+            path.append(towardsEnd[path[-1]])
+        return path, cost//self.scale
+
+    def update(self, changes, stats=None):
+        """
+        Apply a batch of edge weight changes to the graph and replan.
+
+        Parameters
+        ----------
+        changes: iterable of (u, v, weight)
+            new weights of the edges between node ids u and v, set in both
+            directions
+        stats: SearchStats or None
+
+        Returns
+        -------
+        (path, distance): see path()
+
+        Raises
+        ------
+        TypeError
+            if the graph is a MappedGraph, whose weights are read-only
+        """
+        touched = set()
+        for u, v, weight in changes:
+            self.graph.set_weight(u, v, weight)
+            self.graph.set_weight(v, u, weight)
+            touched.add(u)
+            touched.add(v)
+        for u in touched:
+            self._updateNode(u)
+        return self.path(stats)
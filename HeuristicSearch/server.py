@@ -0,0 +1,275 @@
+#Long-lived query server for the searches in find_path3.py
+#The graph and the heuristic files are loaded once, then queries are read as JSON lines from stdin or from clients of a
+#local TCP or unix socket, and every answer is written back as one JSON line:
+#   {"id": 1, "algorithm": "astar", "start": "Richmond", "end": "Frankfort"}
+#   {"id": 1, "path": ["Richmond", "Charleston", "Columbus", "Indianapolis", "Frankfort"], "distance": 557}
+#A path that does not exist is answered with "path": null and "distance": null, a bad query with "error".
+#A query with "stats": true is also answered with the SearchStats of its search (see stats.py).
+#An "arastar" query can give a "deadline" in milliseconds and a suboptimality "bound", it is answered with the best
+#path found by then (see anytime.py) and its "bound", for callers that would rather have a slightly longer path in time:
+#   {"id": 2, "algorithm": "arastar", "start": "Richmond", "end": "Frankfort", "deadline": 5, "bound": 1.1}
+#Queries are answered concurrently: without --workers the searches run in threads of the server process, which take
+#turns on the interpreter lock so a long search does not hold up the short ones but no two searches run in parallel;
+#with --workers they run in parallel in worker processes that each load the graph once (a binary graph from
+#binary_graph.py is memory-mapped and so shared by all of them).
+#python server.py input_file1.txt --heuristic heuristic_Frankfort.txt
+#python server.py graph.bin --port 8401 --workers 4 --landmarks landmarks.bin --hierarchy ch.bin
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from anytime import anytimePath
+from binary_graph import heuristicGoal
+from cache import PathCache
+from find_path3 import findPath, hGraph, makeGraph
+from contraction import ContractionHierarchy
+from landmarks import Landmarks
+from stats import SearchStats
+
+ALGORITHMS = ("bfs", "dfs", "ucs", "astar", "arastar", "biucs", "biastar", "ch")
+
+_worker = None      #(graph, heuristics, landmarks, hierarchy, cache) of a worker process
+
+
+def loadHeuristics(graph, heuristicFiles=()):
+    """
+    Heuristic values by node id for every goal, from the heuristics stored in
+    a binary graph and the heuristic_<goal>.txt files.
+    """
+    heuristics = dict(graph.heuristics)
+    for heuristicFile in heuristicFiles:
+        values = hGraph(heuristicFile)
+        heuristics[heuristicGoal(heuristicFile)] = [int(values.get(name, 0)) for name in graph.names]
+    return heuristics
+
+
+def answer(graph, heuristics, query, landmarks=None, hierarchy=None, cache=None):
+    """
+    Answer one query.
+
+    Parameters
+    ----------
+    graph: Graph
+    heuristics: dict
+        goal name -> heuristic values by node id, for astar
+    query: dict
+        with "algorithm", "start" and "end", and optionally an "id" that is copied to the answer
+        and "stats" to add the search counters to the answer, for arastar also "deadline" in
+        milliseconds and "bound"
+    landmarks: Landmarks or None
+        heuristics for the goals that are not in heuristics
+    hierarchy: ContractionHierarchy or None
+        the contraction hierarchy of the graph, for ch
+    cache: PathCache or None
+        cache of the answers on graph
+
+    Returns
+    -------
+    answer: dict
+    """
+    result = {"id": query.get("id")}
+    algorithm, start, end = query.get("algorithm"), query.get("start"), query.get("end")
+    if algorithm not in ALGORITHMS:
+        result["error"] = "unknown algorithm %r, expected one of %s" % (algorithm, ", ".join(ALGORITHMS))
+    elif not isinstance(start, str) or not isinstance(end, str):
+        result["error"] = "start and end must be node names"
+    elif query.get("deadline") is not None and not (_isNumber(query["deadline"]) and query["deadline"] >= 0):
+        result["error"] = "deadline must be a number of milliseconds"
+    elif query.get("bound") is not None and not (_isNumber(query["bound"]) and query["bound"] >= 1):
+        result["error"] = "bound must be a number of at least 1"
+    elif start == end:
+        result["error"] = "Start is end, invalid path"
+    elif algorithm in ("astar", "arastar", "biastar") and end not in heuristics and (landmarks is None or end not in graph):
+        result["error"] = "no heuristic for goal " + end
+    elif algorithm == "ch" and hierarchy is None:
+        result["error"] = "the server has no contraction hierarchy"
+    else:
+        toEnd, toStart = heuristics.get(end), None
+        if landmarks is not None and start in graph and end in graph:
+            if toEnd is None:
+                toEnd = landmarks.heuristic(graph.ids[end])
+            toStart = landmarks.heuristic(graph.ids[start])
+        stats = SearchStats() if query.get("stats") else None
+        if algorithm == "arastar":
+            result["path"], result["distance"], result["bound"] = _anytime(graph, start, end, toEnd, query, stats)
+        elif cache is not None:
+            result["path"], result["distance"] = cache.findPath(algorithm, start, end, toEnd, toStart, hierarchy, stats)
+        else:
+            result["path"], result["distance"] = findPath(graph, algorithm, start, end, toEnd, toStart, hierarchy, stats)
+        if stats is not None:
+            result["stats"] = stats.as_dict()
+    return result
+
+
+def _isNumber(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _anytime(graph, start, end, heuristic, query, stats=None):
+    #ARA* answer within the deadline of the query, never cached since it depends on the time the search got
+    if start not in graph or end not in graph:
+        return None, None, None
+    deadline = query.get("deadline")
+    deadline = None if deadline is None else deadline/1000
+    path, distance, bound = anytimePath(graph, graph.ids[start], graph.ids[end], heuristic, deadline,
+                                        query.get("bound") or 1.0, stats=stats)
+    if stats is not None and path is not None:
+        stats.depth = len(path) - 1
+    return None if path is None else graph.path_names(path), distance, bound
+
+
+def _init_worker(graphFile, heuristicFiles, landmarkFile, hierarchyFile, cacheSize):
+    global _worker
+    graph = makeGraph(graphFile)
+    landmarks = None if landmarkFile is None else Landmarks.load(landmarkFile, graph)
+    hierarchy = None if hierarchyFile is None else ContractionHierarchy.load(hierarchyFile, graph)
+    cache = PathCache(graph, cacheSize) if cacheSize else None
+    _worker = graph, loadHeuristics(graph, heuristicFiles), landmarks, hierarchy, cache
+
+
+def _answer_in_worker(query):
+    graph, heuristics, landmarks, hierarchy, cache = _worker
+    return answer(graph, heuristics, query, landmarks, hierarchy, cache)
+
+
+class PathServer:
+    """
+    Answers queries on one graph that is loaded once.
+
+    Parameters
+    ----------
+    graphFile: str
+        a text graph or a binary graph file
+    heuristicFiles: list of str
+        heuristic_<goal>.txt files for astar
+    workers: int
+        number of worker processes for the searches, 0 to search in the server process
+    landmarkFile: str or None
+        a landmark file from landmarks.py, for astar to any goal
+    hierarchyFile: str or None
+        a contraction hierarchy file from contraction.py, for ch
+    cacheSize: int
+        the most answers cached by every process, 0 for no cache
+    """
+
+    def __init__(self, graphFile, heuristicFiles=(), workers=0, landmarkFile=None, hierarchyFile=None, cacheSize=0):
+        self.graph = makeGraph(graphFile)
+        self.heuristics = loadHeuristics(self.graph, heuristicFiles)
+        self.landmarks = None if landmarkFile is None else Landmarks.load(landmarkFile, self.graph)
+        self.hierarchy = None if hierarchyFile is None else ContractionHierarchy.load(hierarchyFile, self.graph)
+        self.cache = PathCache(self.graph, cacheSize) if cacheSize else None
+        self.pool = None
+        if workers:
+            #Spawned rather than forked, a forked worker would keep the sockets of the clients open
+            self.pool = ProcessPoolExecutor(workers, multiprocessing.get_context("spawn"), _init_worker,
+                                            (graphFile, list(heuristicFiles), landmarkFile, hierarchyFile, cacheSize))
+
+    async def query(self, line):
+        #The JSON answer line to a JSON query line
+        try:
+            query = json.loads(line)
+            if not isinstance(query, dict):
+                raise ValueError("a query must be a JSON object")
+        except ValueError as error:
+            return json.dumps({"id": None, "error": str(error)})
+        try:
+            if self.pool is None:
+                result = await asyncio.to_thread(answer, self.graph, self.heuristics, query, self.landmarks,
+                                                 self.hierarchy, self.cache)
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(self.pool, _answer_in_worker, query)
+        except Exception as error:
+            #Every query line gets an answer line, also when its search failed
+            result = {"id": query.get("id"), "error": "%s: %s" % (type(error).__name__, error)}
+        return json.dumps(result)
+
+    async def serve_stream(self, reader, write, limit=256):
+        #Answer every line of reader with write(answer line), at most limit queries at once
+        slots = asyncio.Semaphore(limit)
+        pending = set()
+
+        async def handle(line):
+            try:
+                write(await self.query(line))
+            finally:
+                slots.release()
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            await slots.acquire()
+            task = asyncio.ensure_future(handle(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.wait(pending)
+
+    async def serve_stdin(self):
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+        def write(line):
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+        await self.serve_stream(reader, write)
+
+    async def _client(self, reader, writer):
+        try:
+            await self.serve_stream(reader, lambda line: writer.write(line.encode() + b"\n"))
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_socket(self, host="127.0.0.1", port=None, path=None):
+        #Serve clients of a TCP port, or of a unix socket when path is given, until cancelled
+        if path is not None:
+            server = await asyncio.start_unix_server(self._client, path)
+        else:
+            server = await asyncio.start_server(self._client, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Answer path queries as JSON lines on a graph loaded once.")
+    parser.add_argument("graph", help="text graph or binary graph file")
+    parser.add_argument("--heuristic", action="append", default=[], help="heuristic_<goal>.txt file, can be repeated")
+    parser.add_argument("--port", type=int, default=None, help="serve a local TCP port instead of stdin")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--unix", default=None, help="serve a unix socket at this path instead of stdin")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes for the searches")
+    parser.add_argument("--landmarks", default=None, help="landmark file from landmarks.py, for astar to any goal")
+    parser.add_argument("--hierarchy", default=None, help="contraction hierarchy file from contraction.py, for ch")
+    parser.add_argument("--cache", type=int, default=0, help="answers cached by every process, 0 for no cache")
+    args = parser.parse_args(argv)
+
+    server = PathServer(args.graph, args.heuristic, args.workers, args.landmarks, args.hierarchy, args.cache)
+    try:
+        if args.port is None and args.unix is None:
+            asyncio.run(server.serve_stdin())
+        else:
+            asyncio.run(server.serve_socket(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if args.unix is not None and os.path.exists(args.unix):
+            os.remove(args.unix)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
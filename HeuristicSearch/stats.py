@@ -0,0 +1,47 @@
+#Counters filled in by the searches of find_path3.py when a SearchStats instance is passed to them
+#The phases, timing and JSON output are shared with the connect 4 solver, see instrumentation/stats.py.
+
+from instrumentation.stats import BaseStats
+
+
+class SearchStats(BaseStats):
+    """
+    What a path search did on its last call.
+
+    Attributes
+    ----------
+    expanded: int
+        the nodes whose edges were followed
+    generated: int
+        the edges followed to a node, whether or not it was added to the frontier
+    heap_pushes: int
+        the entries added to the frontier
+    heap_pops: int
+        the entries taken from the frontier
+    stale: int
+        the entries taken from the frontier after a cheaper path to their node was found
+    peak_frontier: int
+        the most entries on the frontier at once
+    depth: int
+        the number of edges on the path found
+    elapsed: float
+        wall time in seconds
+    phases: dict
+        wall time in seconds of every phase, see phase()
+    """
+
+    COUNTERS = ("expanded", "generated", "heap_pushes", "heap_pops", "stale")
+    NODES = "expanded"
+
+    def __init__(self):
+        BaseStats.__init__(self)
+        self.peak_frontier = 0
+
+    def frontier(self, size):
+        #Note the size of the frontier
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def merge(self, other):
+        BaseStats.merge(self, other)
+        self.peak_frontier = max(self.peak_frontier, other.peak_frontier)
@@ -0,0 +1,41 @@
+#Reference implementations and random inputs the searches are checked against
+
+from graph import Graph
+
+
+
+def randomGraph(rng, n, extra=None, maxWeight=50, zero=False):
+    """
+    Connected random graph of n nodes named "0".."n-1": a random spanning tree
+    plus extra random edges, with weights from 1 (or 0 with zero) to maxWeight.
+    """
+    low = 0 if zero else 1
+    edges = [(str(i), str(rng.randrange(i)), rng.randint(low, maxWeight)) for i in range(1, n)]
+    for _ in range(n if extra is None else extra):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a != b:
+            edges.append((str(a), str(b), rng.randint(low, maxWeight)))
+    return Graph.from_edges(edges)
+
+
+def dijkstra(graph, source):
+    #Distances from source by node id, plain and quadratic, as the reference for the faster searches
+    distances = {source: 0}
+    done = set()
+    while True:
+        u = min((v for v in distances if v not in done), key=distances.get, default=None)
+        if u is None:
+            return distances
+        done.add(u)
+        for v, weight in graph.neighbors(u):
+            if v not in distances or distances[u] + weight < distances[v]:
+                distances[v] = distances[u] + weight
+
+
+def pathCost(graph, path):
+    #Weight of a path of node ids, checking that every step is an edge
+    total = 0
+    for u, v in zip(path, path[1:]):
+        total += min(weight for w, weight in graph.neighbors(u) if w == v)
+    return total
+
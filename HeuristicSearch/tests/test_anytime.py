@@ -0,0 +1,55 @@
+import random
+
+from anytime import anytimePath, anytimeSearch
+from graph import Graph
+from landmarks import Landmarks
+from path_reference import dijkstra, pathCost, randomGraph
+
+
+def test_improves_to_the_shortest_path():
+    rng = random.Random(24)
+    for _ in range(40):
+        graph = randomGraph(rng, rng.randint(2, 150))
+        landmarks = Landmarks.build(graph, 4)
+        for _ in range(5):
+            start, end = rng.sample(range(len(graph)), 2)
+            shortest = dijkstra(graph, start)[end]
+            results = list(anytimeSearch(graph, start, end, landmarks.heuristic(end), epsilon=3))
+            assert results[-1][1] == shortest and results[-1][2] == 1.0
+            previous = None
+            for path, distance, bound in results:
+                assert path[0] == start and path[-1] == end and pathCost(graph, path) <= distance
+                assert distance <= bound*shortest + 1e-9
+                if previous is not None:
+                    assert distance < previous[0] or bound < previous[1]
+                previous = distance, bound
+
+
+def chain():
+    #A direct edge of 1000 next to a chain of 101 edges of weight 1
+    edges = [("S", "G", 1000)] + [(str(i), str(i + 1), 1) for i in range(100)] + [("S", "0", 1), ("100", "G", 1)]
+    graph = Graph.from_edges(edges)
+    return graph, graph.ids["S"], graph.ids["G"]
+
+
+def test_bound_of_an_unfinished_search():
+    graph, start, end = chain()
+    path, distance, bound = anytimePath(graph, start, end, [0]*len(graph), deadline=0)
+    assert distance == 1000
+    assert bound >= 1000/101
+
+
+def test_bounds_hold_at_any_deadline():
+    rng = random.Random(240)
+    for _ in range(40):
+        graph = randomGraph(rng, rng.randint(50, 300), maxWeight=100)
+        start, end = rng.sample(range(len(graph)), 2)
+        shortest = dijkstra(graph, start)[end]
+        heuristic = Landmarks.build(graph, 2).heuristic(end)
+        for path, distance, bound in anytimeSearch(graph, start, end, heuristic, epsilon=5, deadline=0):
+            assert distance <= bound*shortest + 1e-9
+
+
+def test_no_path():
+    graph = Graph.from_edges([("A", "B", 1), ("C", "D", 1)])
+    assert anytimePath(graph, graph.ids["A"], graph.ids["D"], [0]*4) == (None, None, None)
@@ -0,0 +1,33 @@
+from benchmark import geometricGraph, gridGraph, queries, scaleFreeGraph
+from instrumentation.benchmark import compare, percentile
+from path_reference import dijkstra
+
+
+def test_generated_heuristics_are_consistent():
+    for generate in (geometricGraph, gridGraph, scaleFreeGraph):
+        graph, heuristic = generate(300, seed=1)
+        for _, end in queries(graph, 3, seed=1):
+            goal = graph.ids[end]
+            values = heuristic(goal)
+            assert values[goal] == 0
+            for u in range(len(graph)):
+                for v, weight in graph.neighbors(u):
+                    assert values[u] <= weight + values[v]
+            distances = dijkstra(graph, goal)
+            assert all(values[u] <= distances[u] for u in distances)
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50 and percentile(values, 99) == 99 and percentile([3], 90) == 3
+
+
+def test_compare():
+    old = {"graph": "grid", "nodes": 100, "algorithm": "ucs", "queries": 10, "expanded": 1000, "nodes_per_sec": 1000,
+           "p50_ms": 1.0, "p99_ms": 2.0, "peak_kb": 10.0}
+    key = ("graph", "nodes", "algorithm")
+    assert compare([dict(old, nodes_per_sec=900, peak_kb=60.0)], [old], key, "expanded", "queries") == []
+    regressions = compare([dict(old, nodes_per_sec=700, p99_ms=3.0, peak_kb=100.0, expanded=1001)], [old], key,
+                          "expanded", "queries")
+    assert len(regressions) == 4
+    assert compare([dict(old, algorithm="astar", nodes_per_sec=1)], [old], key, "expanded", "queries") == []
@@ -0,0 +1,64 @@
+import random
+
+from benchmark import geometricGraph, queries
+from find_path3 import bestFirstSearch, bidirectionalSearch, findPath
+from graph import Graph
+from landmarks import Landmarks
+from path_reference import dijkstra, pathCost, randomGraph
+from stats import SearchStats
+
+
+def test_bidirectional_matches_dijkstra():
+    rng = random.Random(15)
+    for trial in range(60):
+        graph = randomGraph(rng, rng.randint(2, 70), extra=rng.randint(0, 100), zero=trial % 3 == 0)
+        landmarks = Landmarks.build(graph, rng.randint(1, 4))
+        start, end = rng.sample(range(len(graph)), 2)
+        expected = dijkstra(graph, start)[end]
+        for toEnd, toStart in ((None, None), (landmarks.heuristic(end), None), (None, landmarks.heuristic(start)),
+                               (landmarks.heuristic(end), landmarks.heuristic(start))):
+            path, distance = bidirectionalSearch(graph, start, end, toEnd, toStart, SearchStats())
+            assert distance == expected
+            assert path[0] == start and path[-1] == end and pathCost(graph, path) == distance
+
+
+def test_no_path():
+    graph = Graph.from_edges([("A", "B", 1), ("C", "D", 1)])
+    assert findPath(graph, "biucs", "A", "D") == (None, None)
+    landmarks = Landmarks.build(graph, 2)
+    assert bidirectionalSearch(graph, 0, 3, landmarks.heuristic(3), landmarks.heuristic(0)) == (None, None)
+
+
+def test_adjacent_and_zero_weight():
+    graph = Graph.from_edges([("A", "B", 0), ("B", "C", 0), ("A", "C", 1)])
+    assert findPath(graph, "biucs", "A", "C") == (["A", "B", "C"], 0)
+    assert findPath(graph, "biucs", "A", "B") == (["A", "B"], 0)
+
+
+class _Counting:
+    #Heuristic values that count how often they are read
+    def __init__(self, values):
+        self.values = values
+        self.reads = 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, v):
+        self.reads += 1
+        return self.values[v]
+
+
+def test_biastar_expands_less_than_ucs():
+    graph, _ = geometricGraph(3000, seed=15)
+    landmarks = Landmarks.build(graph, 8)
+    plain, bounded = SearchStats(), SearchStats()
+    for start, end in queries(graph, 20, seed=15):
+        start, end = graph.ids[start], graph.ids[end]
+        pushes = bounded.heap_pushes
+        toEnd, toStart = _Counting(landmarks.heuristic(end)), _Counting(landmarks.heuristic(start))
+        assert bidirectionalSearch(graph, start, end, toEnd, toStart, bounded)[1] == \
+            bestFirstSearch(graph, start, end, None, plain)[1]
+        #The potentials are only computed for the nodes the search reaches, once each
+        assert toEnd.reads == toStart.reads <= bounded.heap_pushes - pushes + 2 < len(graph)
+    assert bounded.expanded < plain.expanded/2
@@ -0,0 +1,55 @@
+import os
+import random
+
+import pytest
+
+from binary_graph import MappedGraph, convert, isBinaryGraph, writeBinaryGraph
+from find_path3 import findPath, makeGraph
+from graph import Graph
+from path_reference import randomGraph
+
+#The input files are read from the directory of the scripts, as when they are run from there
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+
+def test_mapped_graph_matches_graph(tmp_path):
+    rng = random.Random(13)
+    for trial in range(10):
+        graph = randomGraph(rng, rng.randint(2, 80), zero=trial % 2 == 0)
+        heuristics = {graph.names[0]: [rng.randint(0, 9) for _ in range(len(graph))]}
+        file = str(tmp_path / ("graph%d.bin" % trial))
+        writeBinaryGraph(graph, file, heuristics)
+        mapped = MappedGraph(file)
+        assert len(mapped) == len(graph) and list(mapped.names) == list(graph.names)
+        assert all(mapped.ids[name] == graph.ids[name] for name in graph.names)
+        assert "nowhere" not in mapped and mapped.ids.get("nowhere") is None
+        for u in range(len(graph)):
+            assert list(mapped.neighbors(u)) == list(graph.neighbors(u))
+            for v, _ in graph.neighbors(u):
+                assert mapped.weight(u, v) == graph.weight(u, v)
+        assert list(mapped.heuristics[graph.names[0]]) == heuristics[graph.names[0]]
+        for _ in range(5):
+            start, end = (graph.names[u] for u in rng.sample(range(len(graph)), 2))
+            for algorithm in ("bfs", "ucs", "biucs"):
+                assert findPath(mapped, algorithm, start, end) == findPath(graph, algorithm, start, end)
+
+
+def test_names_are_utf8(tmp_path):
+    graph = Graph.from_edges([("Zürich", "Genève", 3), ("Genève", "Lyon", 4), ("Zürich", "Aaa", 1)])
+    writeBinaryGraph(graph, str(tmp_path / "graph.bin"))
+    mapped = MappedGraph(str(tmp_path / "graph.bin"))
+    assert mapped.ids["Genève"] == graph.ids["Genève"]
+    assert findPath(mapped, "ucs", "Zürich", "Lyon") == (["Zürich", "Genève", "Lyon"], 7)
+
+
+def test_convert_and_make_graph(tmp_path, monkeypatch):
+    monkeypatch.chdir(SCRIPTS)
+    out = str(tmp_path / "graph.bin")
+    graph = convert("input_file1.txt", out, ["heuristic_Frankfort.txt"])
+    assert isBinaryGraph(out) and not isBinaryGraph("input_file1.txt")
+    mapped = makeGraph(out)
+    assert isinstance(mapped, MappedGraph) and "Frankfort" in mapped.heuristics
+    path, distance = findPath(mapped, "astar", "Richmond", "Frankfort", mapped.heuristics["Frankfort"])
+    assert distance == findPath(graph, "ucs", "Richmond", "Frankfort")[1]
+    with pytest.raises(ValueError):
+        MappedGraph("heuristic_Frankfort.txt")
@@ -0,0 +1,45 @@
+import random
+
+from cache import PathCache
+from find_path3 import findPath
+from path_reference import dijkstra, randomGraph
+
+
+def test_answers_match_searches():
+    rng = random.Random(19)
+    graph = randomGraph(rng, 60, zero=True)
+    cache = PathCache(graph, size=50, trees=4)
+    names = graph.names
+    for _ in range(400):
+        algorithm = rng.choice(("ucs", "bfs", "biucs"))
+        start, end = (names[u] for u in rng.sample(range(12), 2))     #Few pairs, so answers and trees are reused
+        path, distance = cache.findPath(algorithm, start, end)
+        if algorithm == "bfs":
+            assert (path, distance) == findPath(graph, "bfs", start, end)
+        else:
+            assert distance == dijkstra(graph, graph.ids[start])[graph.ids[end]]
+            assert path[0] == start and path[-1] == end
+    assert cache.hits and cache.treeHits and cache.misses
+    assert len(cache.answers) <= 50 and len(cache.trees) <= 4
+
+
+def test_weight_change_invalidates():
+    rng = random.Random(190)
+    graph = randomGraph(rng, 40)
+    cache = PathCache(graph)
+    start, end = graph.names[0], graph.names[1]
+    path, distance = cache.findPath("ucs", start, end)
+    for u, v in zip(path, path[1:]):
+        graph.set_weight(graph.ids[u], graph.ids[v], graph.weight(graph.ids[u], graph.ids[v]) + 100)
+        graph.set_weight(graph.ids[v], graph.ids[u], graph.weight(graph.ids[v], graph.ids[u]) + 100)
+    newPath, newDistance = cache.findPath("ucs", start, end)
+    assert newDistance == dijkstra(graph, graph.ids[start])[graph.ids[end]] >= distance
+    assert cache.version == graph.version
+
+
+def test_unknown_nodes():
+    graph = randomGraph(random.Random(1900), 10)
+    cache = PathCache(graph)
+    assert cache.findPath("ucs", "0", "nowhere") == (None, None)
+    assert cache.findPath("astar", "nowhere", "0", [0]*len(graph)) == (None, None)
+    assert 0 <= cache.hitRate() <= 1
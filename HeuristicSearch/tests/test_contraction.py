@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from contraction import ContractionHierarchy, isHierarchyFile
+from find_path3 import findPath
+from graph import Graph
+from path_reference import dijkstra, pathCost, randomGraph
+
+
+@pytest.mark.parametrize("settleLimit", [500, 1])
+def test_queries_match_dijkstra(settleLimit):
+    #With a settle limit of 1 nearly every witness search gives up, which must only add shortcuts
+    rng = random.Random(17)
+    for trial in range(25):
+        graph = randomGraph(rng, rng.randint(2, 60), extra=rng.randint(0, 90), zero=trial % 3 == 0)
+        hierarchy = ContractionHierarchy.build(graph, settleLimit)
+        assert sorted(hierarchy.ranks) == list(range(len(graph)))
+        for _ in range(10):
+            start, end = rng.sample(range(len(graph)), 2)
+            path, distance = hierarchy.query(start, end)
+            assert distance == dijkstra(graph, start)[end]
+            assert path[0] == start and path[-1] == end and pathCost(graph, path) == distance
+
+
+def test_no_path_and_loops():
+    graph = Graph.from_edges([("A", "B", 2), ("B", "B", 1), ("C", "D", 1)])
+    hierarchy = ContractionHierarchy.build(graph)
+    assert findPath(graph, "ch", "A", "D", hierarchy=hierarchy) == (None, None)
+    assert findPath(graph, "ch", "B", "A", hierarchy=hierarchy) == (["B", "A"], 2)
+
+
+def test_save_and_load(tmp_path):
+    rng = random.Random(170)
+    graph = randomGraph(rng, 50)
+    hierarchy = ContractionHierarchy.build(graph)
+    file = str(tmp_path / "ch.bin")
+    hierarchy.save(file)
+    assert isHierarchyFile(file)
+    loaded = ContractionHierarchy.load(file, graph)
+    for _ in range(20):
+        start, end = rng.sample(range(len(graph)), 2)
+        assert loaded.query(start, end) == hierarchy.query(start, end)
+    with pytest.raises(ValueError):
+        ContractionHierarchy.load(file, randomGraph(rng, 51))
@@ -0,0 +1,55 @@
+import os
+import random
+
+from find_path3 import bestFirstSearch, findPath, makeGraph, shortestPathTree
+from graph import Graph
+from path_reference import dijkstra, pathCost, randomGraph
+
+#The input files are read from the directory of the scripts, as when they are run from there
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+
+def _disconnected(rng, n):
+    #A random graph with a second component of two nodes
+    graph = randomGraph(rng, n, zero=rng.random() < 0.3)
+    edges = [(graph.names[u], graph.names[v], w) for u in range(len(graph)) for v, w in graph.neighbors(u) if u < v]
+    return Graph.from_edges(edges + [("island", "shore", 1)])
+
+
+def test_ucs_and_astar_match_dijkstra():
+    rng = random.Random(12)
+    for _ in range(40):
+        graph = _disconnected(rng, rng.randint(2, 60))
+        start, end = rng.sample(range(len(graph)), 2)
+        distances = dijkstra(graph, start)
+        exact = dijkstra(graph, end)      #The exact distances to end are a consistent heuristic
+        heuristic = [exact.get(u, 0) for u in range(len(graph))]
+        for values in (None, heuristic, [0]*len(graph)):
+            path, distance = bestFirstSearch(graph, start, end, values)
+            if end not in distances:
+                assert (path, distance) == (None, None)
+            else:
+                assert distance == distances[end]
+                assert path[0] == start and path[-1] == end and pathCost(graph, path) == distance
+
+
+def test_shortest_path_tree_matches_dijkstra():
+    rng = random.Random(120)
+    for _ in range(20):
+        graph = _disconnected(rng, rng.randint(2, 60))
+        start = rng.randrange(len(graph))
+        distances, parents = shortestPathTree(graph, start)
+        assert distances == dijkstra(graph, start)
+        for u, parent in parents.items():
+            if parent is not None:
+                assert distances[parent] + graph.weight(parent, u) == distances[u]
+
+
+def test_find_path_on_the_input_file(monkeypatch):
+    monkeypatch.chdir(SCRIPTS)
+    graph = makeGraph("input_file1.txt")
+    path, distance = findPath(graph, "ucs", "Richmond", "Frankfort")
+    assert path[0] == "Richmond" and path[-1] == "Frankfort"
+    assert distance == dijkstra(graph, graph.ids["Richmond"])[graph.ids["Frankfort"]]
+    assert findPath(graph, "ucs", "Richmond", "Atlantis") == (None, None)
+
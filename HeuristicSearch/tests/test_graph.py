@@ -0,0 +1,30 @@
+import random
+
+from graph import Graph
+
+
+def test_from_edges_matches_the_edge_list():
+    rng = random.Random(11)
+    for _ in range(20):
+        edges = [(str(rng.randrange(20)), str(rng.randrange(20)), rng.randint(0, 9)) for _ in range(rng.randint(1, 60))]
+        graph = Graph.from_edges(edges)
+        expected = {}
+        for a, b, weight in edges:
+            expected.setdefault(a, []).append((b, weight))
+            expected.setdefault(b, []).append((a, weight))
+        assert sorted(graph.names) == sorted(expected)
+        for name, neighbours in expected.items():
+            u = graph.ids[name]
+            assert [(graph.names[v], weight) for v, weight in graph.neighbors(u)] == neighbours
+
+
+def test_weights():
+    graph = Graph.from_edges([("A", "B", 5), ("A", "B", 3), ("B", "C", 0)])
+    a, b, c = (graph.ids[name] for name in "ABC")
+    assert graph.weight(a, b) == 3 and graph.weight(b, a) == 3 and graph.weight(c, b) == 0
+    version = graph.version
+    graph.set_weight(b, c, 7)
+    assert graph.weight(b, c) == 7 and graph.weight(c, b) == 0 and graph.version == version + 1
+    assert graph.path_names([a, b, c]) == ["A", "B", "C"]
+    assert "A" in graph and "D" not in graph
+
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from grid import GridMap, gridSearch, isGridMap, jumpPointSearch, manhattan, octile
+
+
+def _randomGrid(rng, width, height, blocked):
+    return GridMap(width, height, bytearray(rng.random() >= blocked for _ in range(width*height)))
+
+
+def _cost(grid, path, diagonal=True):
+    #Cost of a path of cell ids, checking that every step is a move of the grid
+    total = 0.0
+    for u, v in zip(path, path[1:]):
+        steps = dict(grid.successors(u, diagonal))
+        assert v in steps
+        total += steps[v]
+    return total
+
+
+def test_searches_match_uniform_cost_search():
+    rng = random.Random(23)
+    for _ in range(60):
+        grid = _randomGrid(rng, rng.randint(1, 25), rng.randint(1, 25), rng.choice((0.0, 0.2, 0.35)))
+        cells = [cell for cell in range(len(grid)) if grid.cells[cell]]
+        if len(cells) < 2:
+            continue
+        for _ in range(5):
+            start, end = rng.sample(cells, 2)
+            path, distance = gridSearch(grid, start, end, None)
+            for found, cost in (gridSearch(grid, start, end, octile), jumpPointSearch(grid, start, end)):
+                if path is None:
+                    assert (found, cost) == (None, None)
+                else:
+                    assert cost == pytest.approx(distance)
+                    assert found[0] == start and found[-1] == end
+                    assert _cost(grid, found) == pytest.approx(distance)
+            straight = gridSearch(grid, start, end, None, diagonal=False)
+            found, cost = gridSearch(grid, start, end, manhattan, diagonal=False)
+            assert cost == straight[1] and (found is None or _cost(grid, found, False) == cost)
+
+
+def test_no_corner_cutting():
+    grid = GridMap(2, 2, bytearray([1, 0, 0, 1]))
+    assert gridSearch(grid, 0, 3) == (None, None)
+    assert jumpPointSearch(grid, 0, 3) == (None, None)
+
+
+def test_load(tmp_path):
+    file = tmp_path / "room.map"
+    file.write_text("type octile\nheight 3\nwidth 4\nmap\n....\n.@@.\nS..G\n")
+    assert isGridMap(str(file))
+    grid = GridMap.load(str(file))
+    assert (grid.width, grid.height) == (4, 3)
+    assert "0,0" in grid and "1,1" not in grid and "4,0" not in grid
+    path, distance = jumpPointSearch(grid, grid.ids["0,2"], grid.ids["3,2"])
+    assert grid.path_names(path) == ["0,2", "1,2", "2,2", "3,2"] and distance == 3
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from find_path3 import bestFirstSearch
+from graph import Graph
+from landmarks import UNREACHABLE, Landmarks, distancesFrom, isLandmarkFile
+from path_reference import dijkstra, randomGraph
+
+
+def _twoComponents(rng, n):
+    graph = randomGraph(rng, n, zero=rng.random() < 0.3)
+    edges = [(graph.names[u], graph.names[v], w) for u in range(len(graph)) for v, w in graph.neighbors(u) if u < v]
+    return Graph.from_edges(edges + [("island", "shore", 4), ("shore", "cape", 2)])
+
+
+def test_distances_match_dijkstra():
+    rng = random.Random(16)
+    for _ in range(20):
+        graph = _twoComponents(rng, rng.randint(2, 50))
+        source = rng.randrange(len(graph))
+        expected = dijkstra(graph, source)
+        assert list(distancesFrom(graph, source)) == [expected.get(u, UNREACHABLE) for u in range(len(graph))]
+
+
+def test_bounds_are_admissable_and_consistent():
+    rng = random.Random(160)
+    for _ in range(20):
+        graph = _twoComponents(rng, rng.randint(2, 50))
+        landmarks = Landmarks.build(graph, rng.randint(1, 6))
+        assert len(set(landmarks.landmarks)) == len(landmarks.landmarks)
+        goal = rng.randrange(len(graph))
+        bound = landmarks.heuristic(goal)
+        distances = dijkstra(graph, goal)
+        assert len(bound) == len(graph) and bound[goal] == 0
+        for u in range(len(graph)):
+            assert bound[u] <= distances.get(u, bound[u])
+            for v, weight in graph.neighbors(u):
+                assert bound[u] <= weight + bound[v]
+
+
+def test_every_component_gets_a_landmark():
+    graph = _twoComponents(random.Random(1600), 20)
+    landmarks = Landmarks.build(graph, 2)
+    assert {graph.names[u] in ("island", "shore", "cape") for u in landmarks.landmarks} == {True, False}
+
+
+def test_astar_with_landmarks_matches_dijkstra():
+    rng = random.Random(16000)
+    for _ in range(30):
+        graph = randomGraph(rng, rng.randint(2, 80), zero=rng.random() < 0.3)
+        landmarks = Landmarks.build(graph, 4)
+        start, end = rng.sample(range(len(graph)), 2)
+        assert bestFirstSearch(graph, start, end, landmarks.heuristic(end))[1] == dijkstra(graph, start)[end]
+
+
+def test_save_and_load(tmp_path):
+    graph = randomGraph(random.Random(7), 40)
+    landmarks = Landmarks.build(graph, 3)
+    file = str(tmp_path / "landmarks.bin")
+    landmarks.save(file)
+    assert isLandmarkFile(file)
+    loaded = Landmarks.load(file, graph)
+    assert list(loaded.landmarks) == landmarks.landmarks
+    assert [loaded.heuristic(5)[u] for u in range(len(graph))] == [landmarks.heuristic(5)[u] for u in range(len(graph))]
+    with pytest.raises(ValueError):
+        Landmarks.load(file, randomGraph(random.Random(7), 41))
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+import matrix
+from binary_graph import writeBinaryGraph
+from matrix import manyToMany, oneToAll
+from path_reference import dijkstra, randomGraph
+
+
+def _expected(graph, sources, targets):
+    rows = []
+    for source in sources:
+        distances = dijkstra(graph, graph.ids[source]) if source in graph else {}
+        rows.append([distances.get(graph.ids.get(target)) for target in targets])
+    return rows
+
+
+def test_matrix_matches_dijkstra():
+    rng = random.Random(18)
+    for _ in range(20):
+        graph = randomGraph(rng, rng.randint(2, 50), zero=rng.random() < 0.3)
+        sources = [graph.names[u] for u in rng.sample(range(len(graph)), min(4, len(graph)))] + ["nowhere"]
+        targets = [graph.names[u] for u in rng.sample(range(len(graph)), min(5, len(graph)))] + ["nowhere"]
+        assert manyToMany(graph, sources, targets) == _expected(graph, sources, targets)
+
+
+def test_tree_matches_dijkstra():
+    rng = random.Random(180)
+    graph = randomGraph(rng, 40)
+    tree = oneToAll(graph, "0")
+    distances = dijkstra(graph, graph.ids["0"])
+    assert {name: distance for name, (distance, _) in tree.items()} == {graph.names[u]: d for u, d in distances.items()}
+    for name, (distance, parent) in tree.items():
+        if parent is not None:
+            assert tree[parent][0] + min(w for v, w in graph.neighbors(graph.ids[name]) if graph.names[v] == parent) == distance
+
+
+@pytest.mark.parametrize("binary", [False, True])
+def test_workers_match_serial(tmp_path, binary):
+    rng = random.Random(1800)
+    graph = randomGraph(rng, 60)
+    graphFile = None
+    if binary:
+        graphFile = str(tmp_path / "graph.bin")
+        writeBinaryGraph(graph, graphFile)
+    elif "fork" not in matrix.multiprocessing.get_all_start_methods():
+        pytest.skip("workers without a graph file need fork")
+    sources, targets = graph.names[:8], graph.names[10:20]
+    assert manyToMany(graph, sources, targets, 2, graphFile) == manyToMany(graph, sources, targets)
+
+
+def test_main_only_passes_binary_graphs(tmp_path, monkeypatch):
+    #A text graph is inherited by forked workers rather than parsed again by every one of them
+    graph = randomGraph(random.Random(0), 10)
+    text = tmp_path / "graph.txt"
+    text.write_text("".join("%s %s %d\n" % (graph.names[u], graph.names[v], w)
+                            for u in range(len(graph)) for v, w in graph.neighbors(u) if u < v))
+    binary = str(tmp_path / "graph.bin")
+    writeBinaryGraph(graph, binary)
+    files = []
+    monkeypatch.setattr(matrix, "manyToMany", lambda graph, sources, targets, workers, graphFile: files.append(graphFile) or [])
+    monkeypatch.setattr(matrix.multiprocessing, "get_all_start_methods", lambda: ["fork", "spawn"])
+    matrix.main([str(text), "--sources", "0", "--targets", "1", "--workers", "2"])
+    matrix.main([binary, "--sources", "0", "--targets", "1", "--workers", "2"])
+    assert files == [None, binary]
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from binary_graph import MappedGraph, writeBinaryGraph
+from graph import Graph
+from landmarks import Landmarks
+from replanning import IncrementalSearch
+from path_reference import dijkstra, pathCost, randomGraph
+
+
+def test_zero_weight_edges():
+    graph = Graph.from_edges([("B", "C", 0), ("A", "B", 5), ("C", "D", 5)])
+    search = IncrementalSearch(graph, graph.ids["A"], graph.ids["D"])
+    path, distance = search.path()
+    assert graph.path_names(path) == ["A", "B", "C", "D"]
+    assert distance == 10
+
+
+def test_zero_weight_cycle():
+    graph = Graph.from_edges([("A", "B", 0), ("B", "C", 0), ("C", "A", 0), ("C", "D", 0), ("B", "E", 3), ("D", "E", 1)])
+    search = IncrementalSearch(graph, graph.ids["A"], graph.ids["E"])
+    path, distance = search.path()
+    assert distance == 1
+    assert pathCost(graph, path) == 1
+
+
+def test_updates_match_dijkstra():
+    rng = random.Random(22)
+    for trial in range(30):
+        graph = randomGraph(rng, rng.randint(2, 60), zero=trial % 3 == 0)
+        start, end = rng.sample(range(len(graph)), 2)
+        heuristic = Landmarks.build(graph, 2).heuristic(end) if trial % 2 else None
+        search = IncrementalSearch(graph, start, end, heuristic)
+        path, distance = search.path()
+        for _ in range(5):
+            assert distance == dijkstra(graph, start)[end]
+            assert path[0] == start and path[-1] == end and pathCost(graph, path) == distance
+            changes = []
+            for _ in range(rng.randint(1, 4)):
+                u = rng.randrange(len(graph))
+                v, weight = rng.choice(list(graph.neighbors(u)))
+                #Weights only go up when there is a heuristic, so the landmark bounds stay admissable
+                changes.append((u, v, weight + rng.randint(0, 30) if heuristic else rng.randint(0, 50)))
+            path, distance = search.update(changes)
+
+
+def test_mapped_graph_is_read_only(tmp_path):
+    graph = Graph.from_edges([("A", "B", 5), ("B", "C", 5)])
+    writeBinaryGraph(graph, str(tmp_path / "graph.bin"))
+    mapped = MappedGraph(str(tmp_path / "graph.bin"))
+    search = IncrementalSearch(mapped, mapped.ids["A"], mapped.ids["C"])
+    assert search.path()[1] == 10
+    with pytest.raises(TypeError, match="read-only"):
+        search.update([(mapped.ids["A"], mapped.ids["B"], 1)])
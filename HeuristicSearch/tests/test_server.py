@@ -0,0 +1,123 @@
+import asyncio
+import json
+import os
+import random
+
+import pytest
+
+from benchmark import geometricGraph, queries
+from find_path3 import bestFirstSearch, makeGraph
+from landmarks import Landmarks
+from server import PathServer, answer, loadHeuristics
+
+HERE = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+GRAPH = os.path.join(HERE, "input_file1.txt")
+HEURISTIC = os.path.join(HERE, "heuristic_Frankfort.txt")
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return makeGraph(GRAPH)
+
+
+def ask(graph, **query):
+    return answer(graph, loadHeuristics(graph, [HEURISTIC]), query)
+
+
+def test_answers_every_algorithm(graph):
+    for algorithm in ("bfs", "dfs", "ucs", "astar", "arastar", "biucs"):
+        result = ask(graph, id=1, algorithm=algorithm, start="Richmond", end="Frankfort")
+        assert result["id"] == 1 and result["path"][0] == "Richmond" and result["path"][-1] == "Frankfort"
+    assert ask(graph, algorithm="ucs", start="Richmond", end="Frankfort")["distance"] == 557
+
+
+def test_shortest_distances(graph):
+    rng = random.Random(14)
+    for _ in range(30):
+        start, end = rng.sample(list(graph.names), 2)
+        _, shortest = bestFirstSearch(graph, graph.ids[start], graph.ids[end])
+        assert ask(graph, algorithm="biucs", start=start, end=end)["distance"] == shortest
+
+
+@pytest.mark.parametrize("query", [
+    {"algorithm": "sort", "start": "Richmond", "end": "Frankfort"},
+    {"algorithm": "ucs", "start": 1, "end": "Frankfort"},
+    {"algorithm": "ucs", "start": ["Richmond"], "end": "Frankfort"},
+    {"algorithm": "ucs", "start": "Richmond", "end": "Richmond"},
+    {"algorithm": "astar", "start": "Richmond", "end": "Boise"},
+    {"algorithm": "ch", "start": "Richmond", "end": "Frankfort"},
+    {"algorithm": "arastar", "start": "Richmond", "end": "Frankfort", "deadline": "x"},
+    {"algorithm": "arastar", "start": "Richmond", "end": "Frankfort", "deadline": -1},
+    {"algorithm": "arastar", "start": "Richmond", "end": "Frankfort", "bound": "a"},
+    {"algorithm": "arastar", "start": "Richmond", "end": "Frankfort", "bound": 0.5},
+])
+def test_malformed_queries(graph, query):
+    assert "error" in ask(graph, id=7, **query)
+
+
+def serve(server, lines):
+    #Answer lines through serve_stream, the way serve_stdin and the socket clients do
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data("".join(line + "\n" for line in lines).encode())
+        reader.feed_eof()
+        answers = []
+        await server.serve_stream(reader, answers.append)
+        return [json.loads(line) for line in answers]
+    return asyncio.run(run())
+
+
+def test_every_line_is_answered(monkeypatch):
+    server = PathServer(GRAPH, [HEURISTIC])
+
+    def broken(*args):
+        raise RuntimeError("search failed")
+
+    lines = [
+        "not json",
+        "[1, 2]",
+        json.dumps({"id": 1, "algorithm": "ucs", "start": "Richmond", "end": "Frankfort"}),
+        json.dumps({"id": 2, "algorithm": "arastar", "start": "Richmond", "end": "Frankfort", "deadline": "x"}),
+    ]
+    answers = serve(server, lines)
+    assert len(answers) == 4
+    answers = {a["id"]: a for a in answers}
+    assert answers[1]["distance"] == 557 and "error" in answers[2]
+
+    monkeypatch.setattr("server.answer", broken)
+    answers = serve(server, [json.dumps({"id": 3, "algorithm": "ucs", "start": "Richmond", "end": "Frankfort"})])
+    assert answers == [{"id": 3, "error": "RuntimeError: search failed"}]
+
+
+def test_cache_shared_by_threads():
+    server = PathServer(GRAPH, [HEURISTIC], cacheSize=8)
+    names = list(server.graph.names)
+    rng = random.Random(140)
+    lines = [json.dumps({"id": i, "algorithm": rng.choice(["ucs", "biucs"]), "start": rng.choice(names),
+                         "end": rng.choice(names)}) for i in range(200)]
+    for result in serve(server, lines):
+        query = json.loads(lines[result["id"]])
+        if query["start"] == query["end"]:
+            assert "error" in result
+        else:
+            _, shortest = bestFirstSearch(server.graph, server.graph.ids[query["start"]], server.graph.ids[query["end"]])
+            assert result["distance"] == shortest
+
+
+def test_landmark_biastar_only_bounds_reached_nodes(monkeypatch):
+    #A biastar query with landmark bounds must not pay for the nodes it never reaches
+    graph, _ = geometricGraph(3000, seed=16)
+    landmarks = Landmarks.build(graph, 8)
+    bounds = []
+    build = Landmarks.heuristic
+    monkeypatch.setattr(Landmarks, "heuristic", lambda self, goal: bounds.append(build(self, goal)) or bounds[-1])
+    expanded = {"biastar": 0, "ucs": 0}
+    for start, end in queries(graph, 10, seed=16):
+        for algorithm in expanded:
+            del bounds[:]
+            result = answer(graph, {}, {"algorithm": algorithm, "start": start, "end": end, "stats": True}, landmarks)
+            expanded[algorithm] += result["stats"]["expanded"]
+            if algorithm == "biastar":
+                assert len(bounds) == 2
+                assert all(len(bound.values) <= result["stats"]["heap_pushes"] + 2 < len(graph) for bound in bounds)
+    assert expanded["biastar"] < expanded["ucs"]
@@ -0,0 +1,62 @@
+import io
+import json
+import random
+
+from find_path3 import findPath
+from graph import Graph
+from path_reference import randomGraph
+from stats import SearchStats
+from instrumentation.stats import effective_branching_factor
+
+
+def _chain(n):
+    #Nodes 0 to n - 1 joined in a line by edges of weight 1
+    return Graph.from_edges([(str(i), str(i + 1), 1) for i in range(n - 1)])
+
+
+def test_ucs_counts_on_a_chain():
+    stats = SearchStats()
+    assert findPath(_chain(10), "ucs", "0", "9", stats=stats) == ([str(i) for i in range(10)], 9)
+    assert stats.expanded == 9 and stats.generated == 2*8 + 1
+    assert stats.heap_pushes == 9 and stats.heap_pops == 10 and stats.stale == 0
+    assert stats.peak_frontier == 1
+    assert stats.depth == 9 and stats.branching_factor() == 1.0
+    assert list(stats.phases) == ["search"] and stats.elapsed == stats.phases["search"] > 0
+
+
+def test_merge_adds_counters():
+    graph = randomGraph(random.Random(21), 60)
+    first, second = SearchStats(), SearchStats()
+    findPath(graph, "ucs", graph.names[0], graph.names[59], stats=first)
+    findPath(graph, "bfs", graph.names[1], graph.names[58], stats=second)
+    merged = SearchStats()
+    merged.merge(first)
+    merged.merge(second)
+    for name in SearchStats.COUNTERS:
+        assert getattr(merged, name) == getattr(first, name) + getattr(second, name)
+    assert merged.depth == max(first.depth, second.depth)
+    assert merged.peak_frontier == max(first.peak_frontier, second.peak_frontier)
+    assert merged.phases["search"] == first.phases["search"] + second.phases["search"]
+
+
+def test_phases_add_up():
+    stats = SearchStats()
+    with stats.phase("load"):
+        sum(range(1000))
+    stats.record("search", 0.5)
+    stats.record("search", 0.25)
+    assert stats.phases["load"] > 0 and stats.phases["search"] == 0.75
+    assert stats.elapsed == stats.phases["load"] + 0.75
+
+
+def test_emit_round_trips():
+    graph = randomGraph(random.Random(22), 80)
+    stats = SearchStats()
+    findPath(graph, "ucs", graph.names[0], graph.names[79], stats=stats)
+    out = io.StringIO()
+    stats.emit(out, algorithm="ucs")
+    line = out.getvalue()
+    assert line.endswith("\n") and line.count("\n") == 1
+    values = json.loads(line)
+    assert values == dict(stats.as_dict(), algorithm="ucs")
+    assert values["branching_factor"] == effective_branching_factor(stats.expanded, stats.depth)
@@ -0,0 +1,57 @@
+import random
+
+from find_path3 import bfsSearch, dfsSearch, traverse
+from graph import Graph
+from path_reference import dijkstra, randomGraph
+from stats import SearchStats
+
+
+def _hops(graph):
+    #The same graph with every edge of weight 1, so that its Dijkstra distances count edges
+    edges = [(graph.names[u], graph.names[v], 1) for u in range(len(graph)) for v, _ in graph.neighbors(u) if u < v]
+    return Graph.from_edges(edges + [("island", "shore", 1)])
+
+
+def _isPath(graph, path):
+    return all(any(w == v for w, _ in graph.neighbors(u)) for u, v in zip(path, path[1:]))
+
+
+def test_bfs_finds_the_fewest_edges():
+    rng = random.Random(21)
+    for _ in range(40):
+        graph = _hops(randomGraph(rng, rng.randint(2, 60), extra=rng.randint(0, 60)))
+        start, end = rng.sample(range(len(graph)), 2)
+        hops = dijkstra(graph, start)
+        path = bfsSearch(graph, start, end)
+        if end not in hops:
+            assert path is None and dfsSearch(graph, start, end) is None
+            continue
+        assert path[0] == start and path[-1] == end and _isPath(graph, path)
+        assert len(path) - 1 == hops[end]
+        path = dfsSearch(graph, start, end)
+        assert path[0] == start and path[-1] == end and _isPath(graph, path)
+        assert len(set(path)) == len(path)
+
+
+def test_traversal_reaches_every_node_once():
+    rng = random.Random(210)
+    for depthFirst in (False, True):
+        for _ in range(20):
+            graph = _hops(randomGraph(rng, rng.randint(2, 60)))
+            start = rng.randrange(len(graph))
+            stats = SearchStats()
+            reached = {}
+            for node, parent in traverse(graph, start, depthFirst, stats):
+                assert node not in reached
+                assert parent is None if node == start else parent in reached and _isPath(graph, [parent, node])
+                reached[node] = parent
+            assert set(reached) == set(dijkstra(graph, start))
+            assert stats.expanded == len(reached) and stats.heap_pushes == len(reached) - 1
+
+
+def test_reach_order():
+    graph = Graph.from_edges([("A", "B", 1), ("A", "C", 1), ("C", "D", 1), ("B", "E", 1)])
+    order = [graph.names[node] for node, _ in traverse(graph, graph.ids["A"], True)]
+    assert order == ["A", "B", "C", "D", "E"]
+    order = [graph.names[node] for node, _ in traverse(graph, graph.ids["A"], False)]
+    assert order == ["A", "B", "C", "E", "D"]
@@ -0,0 +1,43 @@
+#The modules of Connect4Solver and HeuristicSearch import each other by name, as when they are run from their own
+#directory, and both solvers have a stats.py and a benchmark.py. Every test module is imported, and every test is run,
+#with its solver directory and tests directory first on sys.path and the stats and benchmark modules of that solver in
+#sys.modules, so python -m pytest runs both suites at once from the repository root, or one of them from its directory.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOLVERS = ("Connect4Solver", "HeuristicSearch")
+SHARED = ("stats", "benchmark")         #Module names used by both solvers
+
+_modules = {solver: {} for solver in SOLVERS}       #Shared modules imported so far, by solver
+_paths = {solver: [os.path.join(ROOT, solver), os.path.join(ROOT, solver, "tests")] for solver in SOLVERS}
+
+
+def _solver(path):
+    #Solver directory a file belongs to, or None
+    solver = os.path.relpath(os.path.abspath(str(path)), ROOT).split(os.sep)[0]
+    return solver if solver in _modules else None
+
+
+def _use(solver):
+    #Put the modules of solver in front, keeping the ones of the other solver for its own tests
+    for name in SHARED:
+        module = sys.modules.get(name)
+        owner = _solver(module.__file__) if getattr(module, "__file__", None) else None
+        if owner is not None:
+            _modules[owner][name] = sys.modules.pop(name)
+    sys.modules.update(_modules[solver])
+    others = [path for paths in _paths.values() for path in paths]
+    sys.path[:] = _paths[solver] + [path for path in sys.path if path not in others]
+
+
+def pytest_collectstart(collector):
+    solver = _solver(collector.path)
+    if solver is not None:
+        _use(solver)
+
+
+def pytest_runtest_setup(item):
+    solver = _solver(item.path)
+    if solver is not None:
+        _use(solver)
@@ -0,0 +1,3 @@
+#Instrumentation shared by the connect 4 solver and the path searches: the search counters of stats.py and the
+#benchmark helpers of benchmark.py. It is installed with pip install -e . from the repository
+#root; pyproject.toml also puts the repository root on sys.path for the tests.
@@ -0,0 +1,113 @@
+#Measurements and baseline comparisons shared by the benchmarks of both solvers
+#A benchmark times its searches, summarizes them with summarize() into one result dict per case, and compares a list
+#of those against the results of an earlier run with compare(), where a case is matched by its key fields.
+
+import json
+import math
+import platform
+import tracemalloc
+
+MEMORY_SLACK_KB = 64    #Peak memory may grow by this much regardless of the tolerance, small peaks vary run to run
+
+
+def percentile(values, p):
+    #The p-th percentile of values by the nearest rank
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p/100*len(ordered)) - 1)]
+
+
+def peak_memory(search, cases):
+    """
+    The most memory search(case) allocated for any of the cases, in bytes,
+    measured with tracemalloc, which slows the searches down.
+    """
+    peak = 0
+    tracemalloc.start()
+    try:
+        for case in cases:
+            tracemalloc.reset_peak()
+            search(case)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def summarize(latencies, nodes, peak):
+    """
+    Result fields of the timed searches of one case.
+
+    Parameters
+    ----------
+    latencies: list of float
+        seconds of every search
+    nodes: int
+        the nodes all of them searched
+    peak: int
+        peak memory in bytes, see peak_memory()
+
+    Returns
+    -------
+    result: dict
+        seconds, nodes_per_sec, p50_ms, p90_ms, p99_ms and peak_kb
+    """
+    seconds = sum(latencies)
+    return {
+        "seconds": round(seconds, 6),
+        "nodes_per_sec": round(nodes/seconds) if seconds else 0,
+        "p50_ms": round(1000*percentile(latencies, 50), 4),
+        "p90_ms": round(1000*percentile(latencies, 90), 4),
+        "p99_ms": round(1000*percentile(latencies, 99), 4),
+        "peak_kb": round(peak/1024, 1),
+    }
+
+
+def compare(results, baseline, key, work, runs, tolerance=0.2):
+    """
+    Regressions of results against the results of a baseline run.
+
+    Parameters
+    ----------
+    results, baseline: list of dict
+        with the fields of summarize()
+    key: tuple of str
+        the fields that identify a case, results without a baseline case are skipped
+    work: str
+        the field counting the nodes searched; the inputs are fixed, so a
+        larger count on as many runs means the search itself got worse
+    runs: str
+        the field counting the searches of a case
+    tolerance: float
+        fraction by which a result may be slower or bigger than the baseline
+
+    Returns
+    -------
+    regressions: list of str
+    """
+    before = {tuple(r[field] for field in key): r for r in baseline}
+    regressions = []
+    for result in results:
+        old = before.get(tuple(result[field] for field in key))
+        if old is None:
+            continue
+        name = " ".join(str(result[field]) for field in key)
+        if result["nodes_per_sec"] < old["nodes_per_sec"]*(1 - tolerance):
+            regressions.append("%s: %d nodes/sec, was %d" % (name, result["nodes_per_sec"], old["nodes_per_sec"]))
+        for field in ("p50_ms", "p99_ms"):
+            if result[field] > old[field]*(1 + tolerance):
+                regressions.append("%s: %s %s, was %s" % (name, field, result[field], old[field]))
+        if result["peak_kb"] > max(old["peak_kb"]*(1 + tolerance), old["peak_kb"] + MEMORY_SLACK_KB):
+            regressions.append("%s: peak_kb %s, was %s" % (name, result["peak_kb"], old["peak_kb"]))
+        if result[runs] == old[runs] and result[work] > old[work]:
+            regressions.append("%s: %s %d, was %d" % (name, work, result[work], old[work]))
+    return regressions
+
+
+def save_baseline(file, results):
+    with open(file, "w") as f:
+        json.dump({"python": platform.python_version(), "results": results}, f, indent=1)
+
+
+def load_baseline(file):
+    with open(file) as f:
+        return json.load(f)["results"]
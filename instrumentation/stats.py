@@ -0,0 +1,89 @@
+#Counters filled in by the searches when a stats instance is passed to them
+#Both solvers subclass BaseStats with their own counters, so they report in the same JSON lines format.
+#Without one the searches only pay for an "is not None" check per node.
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+
+def effective_branching_factor(nodes, depth):
+    """
+    The branching factor b of a uniform tree of the given depth with as many
+    nodes, b + b^2 + ... + b^depth = nodes, found by bisection.
+    """
+    if depth <= 0 or nodes <= depth:
+        return 1.0 if nodes else 0.0
+    low, high = 1.0, float(nodes)
+    for _ in range(100):
+        middle = (low + high)/2
+        if sum(middle**i for i in range(1, depth + 1)) < nodes:
+            low = middle
+        else:
+            high = middle
+    return round((low + high)/2, 4)
+
+
+class BaseStats:
+    """
+    What a search did on its last call: the counters named in COUNTERS, all
+    starting at 0, and the attributes below.
+
+    Attributes
+    ----------
+    depth: int
+        the depth of the search, used for the effective branching factor
+    elapsed: float
+        wall time in seconds
+    phases: dict
+        wall time in seconds of every phase, see phase()
+    """
+
+    COUNTERS = ()
+    NODES = None        #The counter the effective branching factor is computed from
+
+    def __init__(self):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        self.depth = 0
+        self.elapsed = 0.0
+        self.phases = {}
+
+    def record(self, name, seconds):
+        #Add seconds of wall time spent in phase name
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        self.elapsed += seconds
+
+    @contextmanager
+    def phase(self, name):
+        #Record the wall time of the with block as phase name
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def merge(self, other):
+        #Add the counters and phase times of another search, for searches split over several parts or processes
+        for name in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.depth = max(self.depth, other.depth)
+        for name, seconds in other.phases.items():
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def branching_factor(self):
+        return effective_branching_factor(getattr(self, self.NODES), self.depth)
+
+    def as_dict(self):
+        values = dict(self.__dict__)
+        values["phases"] = dict(self.phases)
+        values["branching_factor"] = self.branching_factor()
+        return values
+
+    def emit(self, file=None, **fields):
+        #Write the stats and any extra fields as one JSON line
+        values = self.as_dict()
+        values.update(fields)
+        file = sys.stdout if file is None else file
+        file.write(json.dumps(values) + "\n")